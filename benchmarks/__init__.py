@@ -0,0 +1 @@
+"""Performance benchmarks for uplink-python binding"""
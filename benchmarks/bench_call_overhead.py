@@ -0,0 +1,62 @@
+"""
+Benchmark of per-call overhead of the binding against a compiled stub libuplinkc.
+
+Compares assigning argtypes and restype before every call, as the binding used to do,
+with signatures bound once when the library is loaded.
+
+Usage: python -m benchmarks.bench_call_overhead
+"""
+import time
+
+from uplink_python.download import Download
+from uplink_python.module_def import _FUNCTION_SIGNATURES
+from uplink_python.project import Project
+from uplink_python.uplink import Uplink
+from uplink_python.upload import Upload
+from benchmarks.stub_library import build_stub_library
+
+CALLS = 200000
+CHUNK_SIZE = 64
+
+
+def rebind(library, name):
+    """Assigns the signature of one function, as done before every call previously."""
+
+    function = getattr(library, name)
+    function.argtypes, function.restype = _FUNCTION_SIGNATURES[name]
+
+
+def measure(call):
+    """Returns the average time of call() in microseconds."""
+
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        call()
+    return (time.perf_counter() - start) / CALLS * 1e6
+
+
+def main():
+    """Runs the benchmark and prints a table of results."""
+
+    uplink = Uplink(build_stub_library())
+    library = uplink.m_libuplink
+    project = Project(None, uplink)
+    upload = Upload(None, uplink)
+    download = Download(None, uplink, None, None, None)
+    data = bytes(CHUNK_SIZE)
+    buffer = bytearray(CHUNK_SIZE)
+
+    cases = [("stat_object", "uplink_stat_object", lambda: project.stat_object("b", "k")),
+             ("write", "uplink_upload_write", lambda: upload.write(data)),
+             ("read", "uplink_download_read", lambda: download.readinto(buffer))]
+
+    print("{:>12} {:>16} {:>16}".format("call", "per-call (us)", "bound once (us)"))
+    for name, function_name, call in cases:
+        def legacy(function_name=function_name, call=call):
+            rebind(library, function_name)
+            call()
+        print("{:>12} {:>16.2f} {:>16.2f}".format(name, measure(legacy), measure(call)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark of compressed uploads and downloads of JSON and CSV data against LocalLibrary,
+for every available codec and several levels.
+
+The throughputs are effective ones, in MB/s of uncompressed data, through a link throttled
+to a given bandwidth: compression pays off as long as the codec outruns the link by more
+than the data shrinks. Uploads are written with Upload.write_file and downloads read with
+Download.read_file, both in chunks, so memory use does not grow with the object.
+
+Usage: python -m benchmarks.bench_compression [bandwidth MB/s] [data MiB]
+"""
+import csv
+import io
+import json
+import sys
+import time
+
+from uplink_python.compression import Compression, CODECS
+from uplink_python.local import LocalLibrary
+from uplink_python.uplink import Uplink
+
+BANDWIDTH = 32
+DATA_SIZE = 16
+LEVELS = {"zlib": [1, 6, 9], "zstd": [1, 3, 9, 19]}
+
+
+def json_data(size):
+    """Returns about size bytes of JSON records."""
+
+    rows, length, i = list(), 0, 0
+    while length < size:
+        row = {"id": i, "name": "user-{}".format(i), "score": i * 7 % 1000 / 10,
+               "active": i % 3 == 0, "tags": ["tag-{}".format(i % 17), "group-{}".format(i % 5)]}
+        rows.append(row)
+        length += 100
+        i += 1
+    return json.dumps(rows).encode("utf-8")
+
+
+def csv_data(size):
+    """Returns about size bytes of CSV rows."""
+
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(["id", "timestamp", "sensor", "value", "status"])
+    i = 0
+    while output.tell() < size:
+        writer.writerow([i, 1600000000 + i * 60, "sensor-{}".format(i % 32),
+                         "{:.3f}".format((i * 37 % 1000) / 3), "ok" if i % 11 else "warn"])
+        i += 1
+    return output.getvalue().encode("utf-8")
+
+
+def measure(project, library, data, compression):
+    """Returns the stored size, upload and download MB/s of data with compression."""
+
+    start = time.perf_counter()
+    with project.upload_object("bench", "object", compression=compression) as upload:
+        upload.write_file(io.BytesIO(data))
+    upload_rate = len(data) / (time.perf_counter() - start) / (1024 * 1024)
+    stored = len(library.buckets["bench"]["object"][0])
+
+    output = io.BytesIO()
+    start = time.perf_counter()
+    with project.download_object("bench", "object") as download:
+        download.read_file(output)
+    download_rate = len(data) / (time.perf_counter() - start) / (1024 * 1024)
+    assert output.getvalue() == data
+    return stored, upload_rate, download_rate
+
+
+def main():
+    """Runs the benchmark and prints a table of results."""
+
+    bandwidth = float(sys.argv[1]) if len(sys.argv) > 1 else BANDWIDTH
+    size = int(float(sys.argv[2]) * 1024 * 1024) if len(sys.argv) > 2 else DATA_SIZE * 1024 * 1024
+
+    library = LocalLibrary(bandwidth=int(bandwidth * 1024 * 1024))
+    project = Uplink(library).request_access_with_passphrase("local", "local",
+                                                             "bench").open_project()
+    project.ensure_bucket("bench")
+
+    print("link bandwidth {:.0f} MB/s".format(bandwidth))
+    print("{:>6} {:>6} {:>6} {:>8} {:>12} {:>12}".format("data", "codec", "level", "ratio",
+                                                         "upload MB/s", "download MB/s"))
+    for name, data in (("json", json_data(size)), ("csv", csv_data(size))):
+        settings = [("none", None)] + [(codec, level) for codec in CODECS
+                                       for level in LEVELS[codec]]
+        for codec, level in settings:
+            compression = None if codec == "none" else Compression(codec, level)
+            stored, upload_rate, download_rate = measure(project, library, data, compression)
+            print("{:>6} {:>6} {:>6} {:>8.2f} {:>12.1f} {:>12.1f}".format(
+                name, codec, "-" if level is None else level, len(data) / stored, upload_rate,
+                download_rate))
+    project.close()
+
+
+if __name__ == '__main__':
+    main()
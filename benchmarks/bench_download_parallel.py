@@ -0,0 +1,79 @@
+"""
+Benchmark of end-to-end download throughput to a local file against a compiled stub
+libuplinkc whose downloads are throttled to a per stream bandwidth.
+
+Compares the sequential Download.read_file with Project.download_file_parallel for
+several numbers of workers.
+
+Usage: python -m benchmarks.bench_download_parallel [object MiB] [stream MiB/s]
+"""
+import ctypes
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from uplink_python.project import Project
+from uplink_python.uplink import Uplink
+from benchmarks.stub_library import build_stub_library
+
+OBJECT_SIZE = 256 * 1024 * 1024
+STREAM_BANDWIDTH = 64 * 1024 * 1024
+WORKERS = [1, 2, 4, 8]
+
+
+def sequential(project, file_path):
+    """Downloads the object with one stream through Download.read_file."""
+
+    download = project.download_object("bench", "object")
+    try:
+        with open(file_path, 'wb') as file_handle:
+            download.read_file(file_handle)
+    finally:
+        download.close()
+
+
+def measure(download, file_path, size):
+    """Returns MB/s for download(file_path) of an object of size bytes."""
+
+    start = time.perf_counter()
+    download(file_path)
+    elapsed = time.perf_counter() - start
+    if os.path.getsize(file_path) != size:
+        raise AssertionError("downloaded file has the wrong size")
+    return size / elapsed / (1024 * 1024)
+
+
+def main():
+    """Runs the benchmark and prints a table of results."""
+
+    size = int(sys.argv[1]) * 1024 * 1024 if len(sys.argv) > 1 else OBJECT_SIZE
+    bandwidth = int(sys.argv[2]) * 1024 * 1024 if len(sys.argv) > 2 else STREAM_BANDWIDTH
+
+    uplink = Uplink(build_stub_library())
+    library = uplink.m_libuplink
+    library.stub_set_object_size.argtypes = [ctypes.c_int64]
+    library.stub_set_stream_bandwidth.argtypes = [ctypes.c_int64]
+    library.stub_set_object_size(size)
+    library.stub_set_stream_bandwidth(bandwidth)
+    project = Project(None, uplink)
+
+    directory = tempfile.mkdtemp(prefix="uplink-bench-")
+    file_path = os.path.join(directory, "object")
+    try:
+        print("{:>24} {:>10}".format("download", "MB/s"))
+        print("{:>24} {:>10.1f}".format("read_file", measure(
+            lambda path: sequential(project, path), file_path, size)))
+        for workers in WORKERS:
+            def parallel(path, workers=workers):
+                project.download_file_parallel("bench", "object", path,
+                                               segment_size=size // 16, workers=workers)
+            print("{:>24} {:>10.1f}".format("parallel, {} workers".format(workers),
+                                            measure(parallel, file_path, size)))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
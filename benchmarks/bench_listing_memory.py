@@ -0,0 +1,85 @@
+"""
+Benchmark of memory retained per listed object.
+
+Builds the python objects of a listing, as Uplink.object_from_result does for every listed
+key, and compares the previous __dict__ based classes with the __slots__ based ones.
+
+Usage: python -m benchmarks.bench_listing_memory [entries]
+"""
+import sys
+import time
+import tracemalloc
+
+from uplink_python.module_classes import Object, SystemMetadata, CustomMetadata
+
+ENTRIES = 1000000
+
+
+class LegacySystemMetadata:
+    """SystemMetadata as defined before, attributes in a per instance __dict__."""
+
+    def __init__(self, created=0, expires=0, content_length=0):
+        self.created = created
+        self.expires = expires
+        self.content_length = content_length
+
+
+class LegacyCustomMetadata:
+    """CustomMetadata as defined before, attributes in a per instance __dict__."""
+
+    def __init__(self, entries=None, count=0):
+        self.entries = entries
+        self.count = count
+
+
+class LegacyObject:
+    """Object as defined before, attributes in a per instance __dict__."""
+
+    def __init__(self, key="", is_prefix=False, system=None, custom=None):
+        self.key = key
+        self.is_prefix = is_prefix
+        self.system = system
+        self.custom = custom
+
+
+def build(entries, object_class, system_class, custom_class):
+    """Returns the time to build a listing of entries objects and its bytes per object."""
+
+    keys = ["folder/object-{:08d}".format(i) for i in range(entries)]
+
+    def listing():
+        return [object_class(key=key, is_prefix=False,
+                             system=system_class(created=1600000000, expires=0,
+                                                 content_length=1024),
+                             custom=custom_class(entries=list(), count=0))
+                for key in keys]
+
+    # timed without tracing, tracemalloc slows down every allocation
+    start = time.perf_counter()
+    listing()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    objects = listing()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return elapsed, size / entries
+
+
+def main():
+    """Runs the benchmark and prints a table of results."""
+
+    entries = int(sys.argv[1]) if len(sys.argv) > 1 else ENTRIES
+    cases = [("__dict__", LegacyObject, LegacySystemMetadata, LegacyCustomMetadata),
+             ("__slots__", Object, SystemMetadata, CustomMetadata)]
+
+    print("{:>10} {:>10} {:>18} {:>10}".format("classes", "entries", "bytes per object",
+                                               "time (s)"))
+    for name, object_class, system_class, custom_class in cases:
+        elapsed, per_object = build(entries, object_class, system_class, custom_class)
+        print("{:>10} {:>10} {:>18.1f} {:>10.2f}".format(name, entries, per_object, elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmark of bulk stat_object calls per second against a compiled stub libuplinkc whose
+stat_object is delayed by a round trip latency.
+
+Compares a serial loop of Project.stat_object with Project.stat_objects for several
+concurrencies.
+
+Usage: python -m benchmarks.bench_stat_objects [keys] [latency ms]
+"""
+import ctypes
+import sys
+import time
+
+from uplink_python.project import Project
+from uplink_python.uplink import Uplink
+from benchmarks.stub_library import build_stub_library
+
+KEYS = 2000
+LATENCY_MS = 5
+CONCURRENCIES = [1, 8, 32, 128]
+
+
+def measure(stat, keys):
+    """Returns calls per second of stat(keys)."""
+
+    start = time.perf_counter()
+    stat(keys)
+    return len(keys) / (time.perf_counter() - start)
+
+
+def main():
+    """Runs the benchmark and prints a table of results."""
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else KEYS
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else LATENCY_MS
+
+    uplink = Uplink(build_stub_library())
+    library = uplink.m_libuplink
+    library.stub_set_call_latency.argtypes = [ctypes.c_int64]
+    library.stub_set_call_latency(int(latency * 1e6))
+    project = Project(None, uplink)
+    keys = ["object-{:08d}".format(i) for i in range(count)]
+
+    print("{:>24} {:>12}".format("stat", "calls/s"))
+    print("{:>24} {:>12.0f}".format("stat_object loop", measure(
+        lambda keys: [project.stat_object("bench", key) for key in keys], keys)))
+    for concurrency in CONCURRENCIES:
+        def bulk(keys, concurrency=concurrency):
+            return project.stat_objects("bench", keys, concurrency)
+        print("{:>24} {:>12.0f}".format("stat_objects, {:>3}".format(concurrency),
+                                        measure(bulk, keys)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark of transfer throughput from a growing number of threads against a compiled stub
+libuplinkc whose uploads and downloads are throttled to a per stream bandwidth, and whose
+commits and listings are delayed by a call latency.
+
+Every thread shares one Project and repeats an upload, a download and a listing. Native
+calls release the GIL, so operations per second grow linearly with the number of threads
+until the CPU saturates.
+
+Usage: python -m benchmarks.bench_thread_scaling [seconds per run] [object KiB]
+"""
+import ctypes
+import sys
+import threading
+import time
+
+from uplink_python.project import Project
+from uplink_python.uplink import Uplink
+from benchmarks.stub_library import build_stub_library
+
+DURATION = 2.0
+OBJECT_SIZE = 256 * 1024
+STREAM_BANDWIDTH = 64 * 1024 * 1024
+LATENCY_MS = 2
+LIST_SIZE = 100
+THREADS = [1, 2, 4, 8, 16, 32]
+
+
+def cycle(project, data, buffer):
+    """Uploads data, downloads it back into buffer and lists the bucket."""
+
+    with project.upload_object("bench", "object") as upload:
+        upload.write(data)
+    with project.download_object("bench", "object") as download:
+        while download.readinto(buffer):
+            pass
+    project.list_objects("bench")
+
+
+def measure(project, threads, duration, size):
+    """Returns cycles per second of threads threads running cycle for duration seconds."""
+
+    deadline = time.perf_counter() + duration
+    counts = [0] * threads
+
+    def worker(index):
+        data, buffer = bytes(size), bytearray(size)
+        while time.perf_counter() < deadline:
+            cycle(project, data, buffer)
+            counts[index] += 1
+
+    start = time.perf_counter()
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return sum(counts) / (time.perf_counter() - start)
+
+
+def main():
+    """Runs the benchmark and prints a table of results."""
+
+    duration = float(sys.argv[1]) if len(sys.argv) > 1 else DURATION
+    size = int(sys.argv[2]) * 1024 if len(sys.argv) > 2 else OBJECT_SIZE
+
+    uplink = Uplink(build_stub_library())
+    library = uplink.m_libuplink
+    for name in ("stub_set_object_size", "stub_set_stream_bandwidth", "stub_set_call_latency",
+                 "stub_set_list_size"):
+        getattr(library, name).argtypes = [ctypes.c_int64]
+    library.stub_set_object_size(size)
+    library.stub_set_stream_bandwidth(STREAM_BANDWIDTH)
+    library.stub_set_call_latency(LATENCY_MS * 1000000)
+    library.stub_set_list_size(LIST_SIZE)
+    project = Project(None, uplink)
+
+    print("{:>8} {:>12} {:>10}".format("threads", "cycles/s", "speedup"))
+    single = None
+    for threads in THREADS:
+        rate = measure(project, threads, duration, size)
+        single = single or rate
+        print("{:>8} {:>12.1f} {:>10.2f}".format(threads, rate, rate / single))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark of Upload.write throughput against a stub libuplinkc.
+
+Compares the previous marshalling, which unpacked every byte into a new ctypes array,
+with the current buffer protocol path, for several buffer types and chunk sizes.
+
+Usage: python -m benchmarks.bench_upload_write
+"""
+import ctypes
+import mmap
+import time
+
+from uplink_python.upload import Upload
+from uplink_python.uplink import Uplink
+from benchmarks.stub_library import StubLibrary
+
+TOTAL_BYTES = 64 * 1024 * 1024
+CHUNK_SIZES = [4 * 1024, 64 * 1024, 1024 * 1024]
+
+
+def legacy_write(upload, data_to_write, size_to_write):
+    """Upload.write marshalling as it was before buffer protocol support."""
+
+    data_to_write = (ctypes.c_uint8 * ctypes.c_int32(len(data_to_write)).value)(*data_to_write)
+    data_to_write_ptr = ctypes.cast(data_to_write, ctypes.POINTER(ctypes.c_uint8))
+    write_result = upload.uplink.m_libuplink.uplink_upload_write(upload.upload, data_to_write_ptr,
+                                                                 ctypes.c_size_t(size_to_write))
+    return int(write_result.bytes_written)
+
+
+def measure(write, data, total_bytes):
+    """Returns MB/s for writing total_bytes in len(data) sized chunks."""
+
+    count = max(1, total_bytes // len(data))
+    start = time.perf_counter()
+    for _ in range(count):
+        write(data, len(data))
+    elapsed = time.perf_counter() - start
+    return count * len(data) / elapsed / (1024 * 1024)
+
+
+def main():
+    """Runs the benchmark and prints a table of results."""
+
+    upload = Upload(None, Uplink(StubLibrary()))
+    print("{:>10} {:>12} {:>14}".format("chunk", "buffer", "MB/s"))
+    for chunk_size in CHUNK_SIZES:
+        payload = bytes(range(256)) * (chunk_size // 256)
+        mapped = mmap.mmap(-1, chunk_size)
+        mapped.write(payload)
+        buffers = [("bytes", payload), ("bytearray", bytearray(payload)),
+                   ("memoryview", memoryview(bytearray(payload))), ("mmap", mapped)]
+        # the legacy path is too slow to push the full volume through
+        legacy = measure(lambda data, size: legacy_write(upload, data, size), payload,
+                         TOTAL_BYTES // 16)
+        print("{:>10} {:>12} {:>14.1f}".format(chunk_size, "legacy", legacy))
+        for name, data in buffers:
+            print("{:>10} {:>12} {:>14.1f}".format(chunk_size, name,
+                                                   measure(upload.write, data, TOTAL_BYTES)))
+        mapped.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""Stand-in for libuplinkc used by the benchmarks, it does no network I/O."""
+# pylint: disable=too-few-public-methods
+import ctypes
+import os
+import subprocess
+import tempfile
+
+from uplink_python.module_def import _WriteResult, _Error
+
+
+class StubFunction:
+    """Callable carrying argtypes and restype attributes, like a ctypes foreign function."""
+
+    def __init__(self, function):
+        self.function = function
+        self.argtypes = None
+        self.restype = None
+
+    def __call__(self, *args):
+        return self.function(*args)
+
+
+class StubLibrary:
+    """
+    Minimal stand-in for the functions of libuplinkc exercised by the benchmarks.
+
+    uplink_upload_write consumes the bytes passed to it by copying them into a sink buffer,
+    the same amount of memory traffic the real library has when buffering an upload.
+    """
+
+    def __init__(self, sink_size: int = 1024 * 1024):
+        self.sink = (ctypes.c_uint8 * sink_size)()
+        self.bytes_written = 0
+        self.uplink_upload_write = StubFunction(self._upload_write)
+
+    def _upload_write(self, upload, data, size):
+        """Consumes up to sink size bytes of data."""
+
+        size = size.value
+        ctypes.memmove(self.sink, data, min(size, len(self.sink)))
+        self.bytes_written += size
+        return _WriteResult(size, ctypes.POINTER(_Error)())
+
+
+def build_stub_library():
+    """
+    Compiles stub_uplinkc.c with the system C compiler and returns the path of the shared
+    library, to be loaded by Uplink(path) so benchmarks measure the real cost of ctypes
+    foreign function calls.
+    """
+
+    source = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stub_uplinkc.c")
+    library = os.path.join(tempfile.mkdtemp(prefix="uplink-bench-"), "libstubuplinkc.so")
+    subprocess.check_call([os.environ.get("CC", "cc"), "-O2", "-shared", "-fPIC",
+                           "-o", library, source])
+    return library
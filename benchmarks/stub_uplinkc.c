@@ -0,0 +1,255 @@
+/*
+ * Stand-in for libuplinkc exporting the functions exercised by the benchmarks, with the
+ * same C ABI and no network I/O. Uploads and downloads can be throttled to a per stream
+ * bandwidth, and stat_object, upload commits and listings delayed by a call latency, to model
+ * the network bound calls of the real library.
+ */
+#define _POSIX_C_SOURCE 199309L
+#include <stdbool.h>
+#include <stddef.h>
+#include <stdint.h>
+#include <string.h>
+#include <time.h>
+
+#define MAX_DOWNLOADS 1024
+#define MAX_ITERATORS 1024
+
+typedef struct { size_t _handle; } UplinkHandle;
+typedef struct { int32_t code; char *message; } UplinkError;
+typedef struct { int64_t created; int64_t expires; int64_t content_length; } UplinkSystemMetadata;
+typedef struct { char *key; size_t key_length; char *value; size_t value_length; } UplinkCustomMetadataEntry;
+typedef struct { UplinkCustomMetadataEntry *entries; size_t count; } UplinkCustomMetadata;
+typedef struct {
+    char *key;
+    bool is_prefix;
+    UplinkSystemMetadata system;
+    UplinkCustomMetadata custom;
+} UplinkObject;
+typedef struct { char *name; int64_t created; } UplinkBucket;
+typedef struct { UplinkBucket *bucket; UplinkError *error; } UplinkBucketResult;
+typedef struct { UplinkObject *object; UplinkError *error; } UplinkObjectResult;
+typedef struct { size_t bytes_written; UplinkError *error; } UplinkWriteResult;
+typedef struct { size_t bytes_read; UplinkError *error; } UplinkReadResult;
+typedef struct { UplinkHandle *upload; UplinkError *error; } UplinkUploadResult;
+typedef struct { UplinkHandle *download; UplinkError *error; } UplinkDownloadResult;
+typedef struct { int64_t offset; int64_t length; } UplinkDownloadOptions;
+typedef UplinkHandle UplinkObjectIterator;
+
+static UplinkObject object = {"stub", false, {1600000000, 0, 1024}, {NULL, 0}};
+static UplinkBucket stub_bucket = {"stub", 1600000000};
+static uint8_t sink[1 << 20];
+static UplinkError eof = {-1, "EOF"};
+static UplinkHandle downloads[MAX_DOWNLOADS];
+static int64_t remaining[MAX_DOWNLOADS];
+static size_t next_download;
+static UplinkHandle stub_upload;
+static UplinkHandle iterators[MAX_ITERATORS];
+static int64_t listed[MAX_ITERATORS];
+static size_t next_iterator;
+static int64_t list_size;
+static int64_t stream_bandwidth;
+static int64_t call_latency;
+
+void stub_set_object_size(int64_t size)
+{
+    object.system.content_length = size;
+}
+
+void stub_set_list_size(int64_t objects)
+{
+    list_size = objects;
+}
+
+void stub_set_stream_bandwidth(int64_t bytes_per_second)
+{
+    stream_bandwidth = bytes_per_second;
+}
+
+void stub_set_call_latency(int64_t nanoseconds)
+{
+    call_latency = nanoseconds;
+}
+
+static void sleep_nanoseconds(int64_t nanoseconds)
+{
+    struct timespec delay = {nanoseconds / 1000000000, nanoseconds % 1000000000};
+    nanosleep(&delay, NULL);
+}
+
+static void throttle(size_t length)
+{
+    if (stream_bandwidth > 0) {
+        sleep_nanoseconds((int64_t)length * 1000000000 / stream_bandwidth);
+    }
+}
+
+static void round_trip(void)
+{
+    if (call_latency > 0) {
+        sleep_nanoseconds(call_latency);
+    }
+}
+
+UplinkBucketResult uplink_ensure_bucket(UplinkHandle *project, char *name)
+{
+    UplinkBucketResult result = {&stub_bucket, NULL};
+    round_trip();
+    return result;
+}
+
+UplinkObjectResult uplink_stat_object(UplinkHandle *project, char *bucket, char *key)
+{
+    UplinkObjectResult result = {&object, NULL};
+    /* models the satellite round trip of a metadata request */
+    round_trip();
+    return result;
+}
+
+UplinkObjectResult uplink_delete_object(UplinkHandle *project, char *bucket, char *key)
+{
+    UplinkObjectResult result = {&object, NULL};
+    round_trip();
+    return result;
+}
+
+UplinkObjectIterator *uplink_list_objects(UplinkHandle *project, char *bucket, void *options)
+{
+    size_t slot = __sync_fetch_and_add(&next_iterator, 1) % MAX_ITERATORS;
+    iterators[slot]._handle = slot;
+    listed[slot] = list_size;
+    /* models the satellite round trip of the first page of the listing */
+    round_trip();
+    return &iterators[slot];
+}
+
+bool uplink_object_iterator_next(UplinkObjectIterator *iterator)
+{
+    return listed[iterator->_handle]-- > 0;
+}
+
+UplinkObject *uplink_object_iterator_item(UplinkObjectIterator *iterator)
+{
+    return &object;
+}
+
+UplinkError *uplink_object_iterator_err(UplinkObjectIterator *iterator)
+{
+    return NULL;
+}
+
+UplinkUploadResult uplink_upload_object(UplinkHandle *project, char *bucket, char *key,
+                                        void *options)
+{
+    UplinkUploadResult result = {&stub_upload, NULL};
+    return result;
+}
+
+UplinkWriteResult uplink_upload_write(UplinkHandle *upload, void *bytes, size_t length)
+{
+    UplinkWriteResult result = {length, NULL};
+    memcpy(sink, bytes, length < sizeof(sink) ? length : sizeof(sink));
+    throttle(length);
+    return result;
+}
+
+UplinkError *uplink_upload_set_custom_metadata(UplinkHandle *upload,
+                                               UplinkCustomMetadata custom)
+{
+    return NULL;
+}
+
+UplinkError *uplink_upload_abort(UplinkHandle *upload)
+{
+    return NULL;
+}
+
+UplinkError *uplink_upload_commit(UplinkHandle *upload)
+{
+    /* models the satellite round trip committing the object */
+    round_trip();
+    return NULL;
+}
+
+UplinkDownloadResult uplink_download_object(UplinkHandle *project, char *bucket, char *key,
+                                            UplinkDownloadOptions *options)
+{
+    size_t slot = __sync_fetch_and_add(&next_download, 1) % MAX_DOWNLOADS;
+    int64_t length = object.system.content_length;
+    if (options != NULL) {
+        length -= options->offset;
+        if (options->length >= 0 && options->length < length) {
+            length = options->length;
+        }
+    }
+    downloads[slot]._handle = slot;
+    remaining[slot] = length;
+    UplinkDownloadResult result = {&downloads[slot], NULL};
+    return result;
+}
+
+UplinkReadResult uplink_download_read(UplinkHandle *download, void *bytes, size_t length)
+{
+    UplinkReadResult result = {length, NULL};
+    /* reads without a download opened by uplink_download_object never end */
+    if (download != NULL) {
+        if (remaining[download->_handle] <= 0) {
+            result.bytes_read = 0;
+            result.error = &eof;
+            return result;
+        }
+        if ((int64_t)length > remaining[download->_handle]) {
+            result.bytes_read = length = remaining[download->_handle];
+        }
+        remaining[download->_handle] -= length;
+        throttle(length);
+    }
+    memcpy(bytes, sink, length < sizeof(sink) ? length : sizeof(sink));
+    return result;
+}
+
+UplinkObjectResult uplink_download_info(UplinkHandle *download)
+{
+    UplinkObjectResult result = {&object, NULL};
+    return result;
+}
+
+UplinkError *uplink_close_download(UplinkHandle *download)
+{
+    return NULL;
+}
+
+void uplink_free_error(UplinkError *error)
+{
+}
+
+void uplink_free_bucket_result(UplinkBucketResult result)
+{
+}
+
+void uplink_free_upload_result(UplinkUploadResult result)
+{
+}
+
+void uplink_free_download_result(UplinkDownloadResult result)
+{
+}
+
+void uplink_free_object_iterator(UplinkObjectIterator *iterator)
+{
+}
+
+void uplink_free_object(UplinkObject *item)
+{
+}
+
+void uplink_free_object_result(UplinkObjectResult result)
+{
+}
+
+void uplink_free_write_result(UplinkWriteResult result)
+{
+}
+
+void uplink_free_read_result(UplinkReadResult result)
+{
+}
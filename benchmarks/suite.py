@@ -0,0 +1,307 @@
+"""
+Benchmark suite of the hot paths of the binding, run offline against a stand-in backend.
+
+Cases:
+    write          Upload.write throughput for several chunk sizes
+    read           Download.readinto throughput for several buffer sizes
+    round_trip     upload, stat, download and delete of a small object
+    list           conversion of a listing into Object instances or ObjectColumns
+    metadata       CustomMetadata marshalling to ctypes and back for several entry counts
+    exception      mapping of libuplinkc error codes to exceptions by _storj_exception
+
+Every case is timed over several rounds, the best and median rounds are reported, as MB/s
+for throughputs and microseconds per operation otherwise. Results can be written as JSON
+and compared with an earlier JSON file to track them over time.
+
+The local backend is uplink_python.local.LocalLibrary, the cstub backend the compiled
+stub_uplinkc.c, whose calls cost only the ctypes foreign function call.
+
+Usage: python -m benchmarks.suite [--backend local|cstub] [--rounds N] [--filter NAME]
+                                  [--json FILE] [--compare FILE]
+"""
+import argparse
+import ctypes
+import datetime
+import json
+import platform
+import statistics
+import sys
+import time
+
+from uplink_python.errors import _storj_exception, ERROR_INTERNAL, ERROR_CANCELED,\
+    ERROR_INVALID_HANDLE, ERROR_TOO_MANY_REQUESTS, ERROR_BANDWIDTH_LIMIT_EXCEEDED,\
+    ERROR_BUCKET_NAME_INVALID, ERROR_BUCKET_ALREADY_EXISTS, ERROR_BUCKET_NOT_EMPTY,\
+    ERROR_BUCKET_NOT_FOUND, ERROR_OBJECT_KEY_INVALID, ERROR_OBJECT_NOT_FOUND, ERROR_UPLOAD_DONE
+from uplink_python.local import LocalLibrary
+from uplink_python.module_classes import CustomMetadata, CustomMetadataEntry, ListObjectsOptions
+from uplink_python.module_def import _ObjectStruct, _SystemMetadataStruct
+from uplink_python.project import Project
+from uplink_python.uplink import Uplink
+from benchmarks.stub_library import build_stub_library
+
+BUCKET = "bench"
+TRANSFER_SIZE = 16 * 1024 * 1024
+CHUNK_SIZES = [4 * 1024, 64 * 1024, 1024 * 1024]
+ROUND_TRIPS = 200
+ROUND_TRIP_SIZE = 1024
+LIST_SIZE = 10000
+METADATA_ENTRIES = [1, 8, 64]
+METADATA_CALLS = 2000
+EXCEPTION_CALLS = 20000
+ERROR_CODES = [ERROR_INTERNAL, ERROR_CANCELED, ERROR_INVALID_HANDLE, ERROR_TOO_MANY_REQUESTS,
+               ERROR_BANDWIDTH_LIMIT_EXCEEDED, ERROR_BUCKET_NAME_INVALID,
+               ERROR_BUCKET_ALREADY_EXISTS, ERROR_BUCKET_NOT_EMPTY, ERROR_BUCKET_NOT_FOUND,
+               ERROR_OBJECT_KEY_INVALID, ERROR_OBJECT_NOT_FOUND, ERROR_UPLOAD_DONE]
+
+
+class LocalBackend:
+    """Runs the cases against LocalLibrary, objects are really stored in memory."""
+
+    name = "local"
+
+    def __init__(self):
+        self.library = LocalLibrary()
+        self.uplink = Uplink(self.library)
+        access = self.uplink.request_access_with_passphrase("local", "local", "bench")
+        self.project = access.open_project()
+        self.project.ensure_bucket(BUCKET)
+
+    def put(self, key, size):
+        """Stores an object of size bytes at key."""
+
+        with self.project.upload_object(BUCKET, key) as upload:
+            upload.write(bytes(size))
+
+    def populate(self, prefix, count):
+        """Stores count empty objects below prefix."""
+
+        objects = self.library.buckets[BUCKET]
+        for i in range(count):
+            objects["{}{:08d}".format(prefix, i)] = (b"", {}, 0)
+
+
+class StubBackend:
+    """Runs the cases against the compiled stub, which stores nothing and serves any key."""
+
+    name = "cstub"
+
+    def __init__(self):
+        self.uplink = Uplink(build_stub_library())
+        self.library = self.uplink.m_libuplink
+        for name in ("stub_set_object_size", "stub_set_list_size"):
+            getattr(self.library, name).argtypes = [ctypes.c_int64]
+        self.project = Project(None, self.uplink)
+
+    def put(self, key, size):
+        """Makes every download return size bytes."""
+
+        self.library.stub_set_object_size(size)
+
+    def populate(self, prefix, count):
+        """Makes every listing return count objects."""
+
+        self.library.stub_set_list_size(count)
+
+
+BACKENDS = {"local": LocalBackend, "cstub": StubBackend}
+
+
+class Case:
+    """One timed operation, run processes units units of work each time it is called."""
+
+    def __init__(self, name, params, unit, units, setup, run):
+        self.name = name
+        self.params = params
+        self.unit = unit
+        self.units = units
+        self.setup = setup
+        self.run = run
+
+    @property
+    def key(self):
+        """Unique name of the case and its parameters."""
+
+        return result_key({"name": self.name, "params": self.params})
+
+
+def write_cases(backend):
+    """Yields the Upload.write throughput cases."""
+
+    for chunk_size in CHUNK_SIZES:
+        def run(chunk_size=chunk_size):
+            data = memoryview(bytes(chunk_size))
+            upload = backend.project.upload_object(BUCKET, "write")
+            try:
+                for _ in range(TRANSFER_SIZE // chunk_size):
+                    upload.write(data)
+            finally:
+                upload.abort()
+                upload.free()
+        yield Case("write", {"chunk": chunk_size}, "MB/s", TRANSFER_SIZE, None, run)
+
+
+def read_cases(backend):
+    """Yields the Download.readinto throughput cases."""
+
+    for chunk_size in CHUNK_SIZES:
+        def run(chunk_size=chunk_size):
+            buffer = bytearray(chunk_size)
+            with backend.project.download_object(BUCKET, "read") as download:
+                while download.readinto(buffer):
+                    pass
+        yield Case("read", {"chunk": chunk_size}, "MB/s", TRANSFER_SIZE,
+                   lambda: backend.put("read", TRANSFER_SIZE), run)
+
+
+def round_trip_cases(backend):
+    """Yields the small object round trip case."""
+
+    data = bytes(ROUND_TRIP_SIZE)
+    buffer = bytearray(ROUND_TRIP_SIZE)
+
+    def run():
+        project = backend.project
+        for i in range(ROUND_TRIPS):
+            key = "small-{}".format(i)
+            with project.upload_object(BUCKET, key) as upload:
+                upload.write(data)
+            project.stat_object(BUCKET, key)
+            with project.download_object(BUCKET, key) as download:
+                while download.readinto(buffer):
+                    pass
+            project.delete_object(BUCKET, key)
+    yield Case("round_trip", {"size": ROUND_TRIP_SIZE}, "us/op", ROUND_TRIPS,
+               lambda: backend.put("small", ROUND_TRIP_SIZE), run)
+
+
+def list_cases(backend):
+    """Yields the listing conversion cases."""
+
+    options = ListObjectsOptions(prefix="list/", recursive=True, system=True)
+    for columnar in (False, True):
+        def run(columnar=columnar):
+            backend.project.list_objects(BUCKET, options, columnar=columnar)
+        yield Case("list", {"columnar": columnar}, "us/op", LIST_SIZE,
+                   lambda: backend.populate("list/", LIST_SIZE), run)
+
+
+def metadata_cases(backend):
+    """Yields the custom metadata marshalling cases, they do not call the backend."""
+
+    for count in METADATA_ENTRIES:
+        entries = [CustomMetadataEntry("key-{}".format(i), len("key-{}".format(i)),
+                                       "value-{}".format(i), len("value-{}".format(i)))
+                   for i in range(count)]
+        custom = CustomMetadata(entries, count)
+        object_ = ctypes.pointer(_ObjectStruct(b"key", False, _SystemMetadataStruct(),
+                                               custom.get_structure()))
+
+        def to_ctypes(custom=custom):
+            for _ in range(METADATA_CALLS):
+                custom.get_structure()
+
+        def from_ctypes(object_=object_):
+            for _ in range(METADATA_CALLS):
+                Uplink.object_from_result(object_)
+        yield Case("metadata_to_ctypes", {"entries": count}, "us/op", METADATA_CALLS, None,
+                   to_ctypes)
+        yield Case("metadata_from_ctypes", {"entries": count}, "us/op", METADATA_CALLS, None,
+                   from_ctypes)
+
+
+def exception_cases(backend):
+    """Yields the error code mapping case, it does not call the backend."""
+
+    codes = (ERROR_CODES * (EXCEPTION_CALLS // len(ERROR_CODES) + 1))[:EXCEPTION_CALLS]
+
+    def run():
+        for code in codes:
+            _storj_exception(code, "details")
+    yield Case("exception", {}, "us/op", EXCEPTION_CALLS, None, run)
+
+
+CASES = [write_cases, read_cases, round_trip_cases, list_cases, metadata_cases,
+         exception_cases]
+
+
+def measure(case, rounds):
+    """Returns the result of case timed over rounds rounds, after one warm up round."""
+
+    if case.setup is not None:
+        case.setup()
+    case.run()
+    times = list()
+    for _ in range(rounds):
+        start = time.perf_counter()
+        case.run()
+        times.append(time.perf_counter() - start)
+
+    def value(elapsed):
+        if case.unit == "MB/s":
+            return case.units / elapsed / (1024 * 1024)
+        return elapsed / case.units * 1e6
+    return {"name": case.name, "params": case.params, "unit": case.unit,
+            "best": value(min(times)), "median": value(statistics.median(times)),
+            "rounds": rounds}
+
+
+def result_key(result):
+    """Unique name of a result and its parameters."""
+
+    params = ",".join("{}={}".format(name, value) for name, value in result["params"].items())
+    return "{}[{}]".format(result["name"], params) if params else result["name"]
+
+
+def change(result, previous):
+    """Returns the relative improvement of result over previous, positive when faster."""
+
+    if previous is None:
+        return None
+    ratio = result["best"] / previous["best"]
+    return ratio - 1 if result["unit"] == "MB/s" else 1 / ratio - 1
+
+
+def main(argv=None):
+    """Runs the suite, prints a table of results and writes them as JSON if asked to."""
+
+    parser = argparse.ArgumentParser(description="Benchmarks of the uplink-python binding.")
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default="local")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--filter", default="", help="only run cases whose name contains it")
+    parser.add_argument("--json", help="file to write the results to")
+    parser.add_argument("--compare", help="JSON results of an earlier run to compare with")
+    args = parser.parse_args(argv)
+
+    backend = BACKENDS[args.backend]()
+    previous = dict()
+    if args.compare:
+        with open(args.compare) as file_handle:
+            previous = {result_key(result): result for result in json.load(file_handle)["results"]}
+
+    results = list()
+    print("{:<42} {:>12} {:>12} {:>6} {:>9}".format("case", "best", "median", "unit",
+                                                    "change"))
+    for cases in CASES:
+        for case in cases(backend):
+            if args.filter not in case.key:
+                continue
+            result = measure(case, args.rounds)
+            results.append(result)
+            delta = change(result, previous.get(case.key))
+            print("{:<42} {:>12.2f} {:>12.2f} {:>6} {:>9}".format(
+                case.key, result["best"], result["median"], result["unit"],
+                "" if delta is None else "{:+.1%}".format(delta)))
+
+    if args.json:
+        report = {"timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                  "backend": backend.name, "python": platform.python_version(),
+                  "implementation": platform.python_implementation(),
+                  "platform": platform.platform(), "machine": platform.machine(),
+                  "results": results}
+        with open(args.json, "w") as file_handle:
+            json.dump(report, file_handle, indent=2)
+    return results
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
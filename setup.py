@@ -70,7 +70,7 @@ setuptools.setup(
     long_description_content_type="text/markdown",
     url="https://github.com/storj-thirdparty/uplink-python",
 
-    packages=['uplink_python'],
+    packages=['uplink_python', 'uplink_python.aio'],
     install_requires=['wheel'],
     include_package_data=True,
     classifiers=[
@@ -80,7 +80,7 @@ setuptools.setup(
         "Operating System :: OS Independent",
         "Topic :: Software Development :: Build Tools",
     ],
-    python_requires='>=3.4',
+    python_requires='>=3.7',
     cmdclass={
         'install': Install,
     }
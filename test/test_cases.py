@@ -2,16 +2,33 @@
 import unittest
 
 from .test_data.access_test import AccessTest
+from .test_data.aio_test import AioTest
 from .test_data.bucket_list_test import BucketListTest
 from .test_data.bucket_test import BucketTest
+from .test_data.cache_test import CacheTest
+from .test_data.checksum_test import ChecksumTest
+from .test_data.compression_test import CompressionTest
+from .test_data.dedup_test import DedupTest
+from .test_data.delete_test import DeleteTest
+from .test_data.download_test import DownloadTest
 from .test_data.helper import InitializationTest
+from .test_data.memory_test import MemoryTest
 from .test_data.object_list_test import ObjectListTest
 from .test_data.object_test import ObjectTest
+from .test_data.parallel_test import ParallelTest
+from .test_data.pool_test import PoolTest
 from .test_data.project_test import ProjectTest
+from .test_data.retry_test import RetryTest
+from .test_data.stat_test import StatTest
+from .test_data.stream_test import StreamTest
+from .test_data.sync_test import SyncTest
+from .test_data.thread_test import ThreadTest
 
 if __name__ == '__main__':
     testList = [InitializationTest, AccessTest, ProjectTest, BucketTest, BucketListTest,
-                ObjectTest, ObjectListTest]
+                ObjectTest, ObjectListTest, MemoryTest, ParallelTest, DeleteTest, StatTest,
+                CacheTest, DownloadTest, StreamTest, SyncTest, DedupTest,
+                CompressionTest, ChecksumTest, AioTest, PoolTest, ThreadTest, RetryTest]
     testLoad = unittest.TestLoader()
 
     TestList = []
@@ -0,0 +1,101 @@
+# pylint: disable=missing-docstring
+import asyncio
+import unittest
+
+from uplink_python.aio import AsyncProject, open_project
+from uplink_python.errors import ObjectNotFoundError
+from uplink_python.module_classes import ListObjectsOptions
+
+from .helper import LocalTestCase
+
+
+class AioTest(LocalTestCase):
+    """Tests of the asyncio interface against the in-memory LocalLibrary."""
+
+    with_project = False
+
+    def setUp(self):
+        super().setUp()
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+        self.project = self.run_async(open_project(self.access, max_workers=8))
+        self.run_async(self.project.ensure_bucket("alpha"))
+
+    def run_async(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def test1_upload_download(self):
+        async def transfer():
+            async with self.project.upload_object("alpha", "data.txt") as upload:
+                self.assertEqual(await upload.write(b"hello world"), 11)
+            async with self.project.download_object("alpha", "data.txt") as download:
+                self.assertEqual(await download.file_size(), 11)
+                data, size = await download.read(5)
+                buffer = bytearray(16)
+                size += await download.readinto(buffer)
+            return data + buffer[:size - 5], size
+
+        self.assertEqual(self.run_async(transfer()), (b"hello world", 11))
+        self.assertEqual(self.run_async(self.project.stat_object("alpha", "data.txt")).key,
+                         "data.txt")
+        self.run_async(self.project.close())
+        self.assertBalanced()
+
+    def test2_upload_aborted_on_exception(self):
+        async def failing_upload():
+            async with self.project.upload_object("alpha", "data.txt") as upload:
+                await upload.write(b"hello")
+                raise ValueError("producer failed")
+
+        with self.assertRaises(ValueError):
+            self.run_async(failing_upload())
+        with self.assertRaises(ObjectNotFoundError):
+            self.run_async(self.project.stat_object("alpha", "data.txt"))
+        self.run_async(self.project.close())
+        self.assertBalanced()
+
+    def test3_many_transfers_in_flight(self):
+        async def upload(key):
+            upload_ = await self.project.upload_object("alpha", key)
+            async with upload_:
+                await upload_.write(key.encode("utf-8"))
+
+        async def gather(coroutines):
+            return await asyncio.gather(*coroutines)
+
+        keys = ["data-{:03}".format(i) for i in range(200)]
+        self.run_async(gather(upload(key) for key in keys))
+
+        async def listed():
+            return [object_.key async for object_ in self.project.iterate_objects(
+                "alpha", ListObjectsOptions(recursive=True), batch_size=16)]
+
+        self.assertEqual(self.run_async(listed()), keys)
+        self.assertEqual(len(self.run_async(self.project.list_objects("alpha"))), 200)
+        self.run_async(gather(self.project.delete_object("alpha", key) for key in keys))
+        self.assertEqual(self.run_async(self.project.list_objects("alpha")), [])
+        self.run_async(self.project.close())
+        self.assertBalanced()
+
+    def test4_iterator_closed_mid_listing(self):
+        async def first_buckets():
+            for name in ("beta", "gamma"):
+                await self.project.create_bucket(name)
+            buckets = self.project.iterate_buckets(batch_size=1)
+            first = await buckets.__anext__()
+            await buckets.aclose()
+            return first.name
+
+        self.assertEqual(self.run_async(first_buckets()), "alpha")
+        self.run_async(self.project.close())
+        self.assertBalanced()
+
+    def test5_project_with_shared_executor(self):
+        project = AsyncProject(self.project.project, executor=self.project.executor)
+        self.assertEqual(self.run_async(project.stat_bucket("alpha")).name, "alpha")
+        self.run_async(self.project.close())
+        self.assertBalanced()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+# pylint: disable=missing-docstring
+import unittest
+
+from uplink_python.errors import ObjectNotFoundError
+
+from .helper import LocalTestCase
+
+
+class CacheTest(LocalTestCase):
+    """Tests of the metadata cache of stat_object and stat_bucket results."""
+
+    def test1_metadata_cache(self):
+        cache = self.project.enable_cache(max_entries=3, ttl=60)
+        self.upload("data.txt", b"hello")
+        for _ in range(20):
+            self.assertEqual(self.project.stat_object("alpha", "data.txt").system.content_length, 5)
+            self.project.stat_object("alpha", "data.txt")
+            self.project.stat_bucket("alpha")
+            self.project.stat_bucket("alpha")
+        self.assertEqual((cache.hits, cache.misses), (20 * 4 - 2, 2))
+        # uploads and deletes through the project invalidate the cached object
+        self.upload("data.txt", b"hello world")
+        self.assertEqual(self.project.stat_object("alpha", "data.txt").system.content_length, 11)
+        self.project.delete_object("alpha", "data.txt")
+        with self.assertRaises(ObjectNotFoundError):
+            self.project.stat_object("alpha", "data.txt")
+        for i in range(4):
+            self.upload("data-{}".format(i), b"x")
+            self.project.stat_object("alpha", "data-{}".format(i))
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(cache.evictions, 2)
+        cache.ttl = 0
+        self.project.stat_object("alpha", "data-3")
+        self.project.delete_bucket("alpha", force=True)
+        self.assertEqual(len(cache), 0)
+        self.project.close()
+        self.assertBalanced()
+
+    def test2_invalidated_during_stat(self):
+        cache = self.project.enable_cache()
+        self.upload("data.txt", b"hello")
+        stat_object = self.library.uplink_stat_object
+
+        def racing_stat_object(*args):
+            # the object is deleted while its stat is in flight
+            result = stat_object(*args)
+            self.project.delete_object("alpha", "data.txt")
+            return result
+
+        self.library.uplink_stat_object = racing_stat_object
+        self.assertEqual(self.project.stat_object("alpha", "data.txt").key, "data.txt")
+        self.library.uplink_stat_object = stat_object
+        # the stale result fetched before the delete is not cached
+        self.assertEqual(len(cache), 0)
+        with self.assertRaises(ObjectNotFoundError):
+            self.project.stat_object("alpha", "data.txt")
+
+        stat_bucket = self.library.uplink_stat_bucket
+
+        def racing_stat_bucket(*args):
+            result = stat_bucket(*args)
+            cache.invalidate_bucket("alpha")
+            return result
+
+        self.library.uplink_stat_bucket = racing_stat_bucket
+        self.project.stat_bucket("alpha")
+        self.assertEqual(len(cache), 0)
+        self.library.uplink_stat_bucket = stat_bucket
+        self.project.stat_bucket("alpha")
+        self.assertEqual(len(cache), 1)
+        self.project.close()
+        self.assertBalanced()
+
+
+if __name__ == '__main__':
+    unittest.main()
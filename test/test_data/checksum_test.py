@@ -0,0 +1,84 @@
+# pylint: disable=missing-docstring
+import hashlib
+import io
+import unittest
+import zlib
+
+from uplink_python.compression import Compression
+from uplink_python.digest import CHECKSUMS
+from uplink_python.errors import ChecksumMismatchError
+from uplink_python.module_classes import DownloadOptions
+
+from .helper import LocalTestCase
+
+
+class ChecksumTest(LocalTestCase):
+    """Tests of the checksums computed on upload and verified on download."""
+
+    def test1_checksums(self):
+        data = b"".join(b"line %d\n" % i for i in range(100000))
+        expected = {"sha256": hashlib.sha256(data).hexdigest(),
+                    "crc32": "{:08x}".format(zlib.crc32(data))}
+        for key, compression in (("plain", None), ("compressed", Compression())):
+            with self.project.upload_object("alpha", key, compression=compression,
+                                            checksums=CHECKSUMS) as upload:
+                upload.write_file(io.BytesIO(data))
+                self.assertEqual({name: upload.checksums()[name] for name in expected}, expected)
+            custom = self.library.buckets["alpha"][key][1]
+            self.assertEqual(custom["uplink-python:sha256"], expected["sha256"])
+            self.assertEqual(custom["uplink-python:crc32"], expected["crc32"])
+            output = io.BytesIO()
+            with self.project.download_object("alpha", key) as download:
+                download.read_file(output)
+                self.assertEqual(download.checksums()["sha256"], expected["sha256"])
+            self.assertEqual(output.getvalue(), data)
+
+        # flip a byte of the stored data, keeping its metadata
+        stored, custom, created = self.library.buckets["alpha"]["plain"]
+        corrupted = stored[:1000] + bytes([stored[1000] ^ 1]) + stored[1001:]
+        self.library.buckets["alpha"]["plain"] = (corrupted, custom, created)
+        with self.project.download_object("alpha", "plain") as download:
+            with self.assertRaises(ChecksumMismatchError) as context:
+                download.read_file(io.BytesIO())
+        self.assertIn("plain: ", context.exception.details)
+        for download_options, verify in ((None, False), (DownloadOptions(0, 2000), True)):
+            with self.project.download_object("alpha", "plain", download_options,
+                                              verify=verify) as download:
+                download.read_file(io.BytesIO())
+                self.assertEqual(download.checksums(), {})
+        with self.assertRaises(ValueError):
+            self.project.upload_object("alpha", "md5", checksums=["md5"])
+        self.project.close()
+        self.assertBalanced()
+
+    def test2_empty_reads(self):
+        data = b"".join(b"line %d\n" % i for i in range(1000))
+        for key, compression in (("plain", None), ("compressed", Compression())):
+            with self.project.upload_object("alpha", key, compression=compression,
+                                            checksums=["sha256"]) as upload:
+                upload.write(data)
+            # reads of nothing in the middle of the object are not its end
+            with self.project.download_object("alpha", key) as download:
+                first = download.read(10)[0]
+                self.assertEqual(download.read(0), (b"", 0))
+                self.assertEqual(download.readinto(bytearray(0)), 0)
+                output = io.BytesIO()
+                download.read_file(output)
+                self.assertEqual(download.read(100), (b"", 0))
+            self.assertEqual(first + output.getvalue(), data)
+
+        # a mismatch is raised at the end of the object, once
+        stored, custom, created = self.library.buckets["alpha"]["plain"]
+        self.library.buckets["alpha"]["plain"] = (stored[:-1] + b"!", custom, created)
+        with self.project.download_object("alpha", "plain") as download:
+            download.read(10)
+            download.read(0)
+            with self.assertRaises(ChecksumMismatchError):
+                download.read_file(io.BytesIO())
+            self.assertEqual(download.read(100), (b"", 0))
+        self.project.close()
+        self.assertBalanced()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+# pylint: disable=missing-docstring
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from uplink_python.compression import Compression, CODECS
+from uplink_python.module_classes import CustomMetadata, DownloadOptions
+
+from .helper import LocalTestCase
+
+
+class CompressionTest(LocalTestCase):
+    """Tests of the streaming compression of uploads and decompression of downloads."""
+
+    def test1_compression(self):
+        rows = [{"id": i, "name": "row-{}".format(i), "tags": ["a", "b"]} for i in range(20000)]
+        data = json.dumps(rows).encode("utf-8")
+        for codec in CODECS:
+            key = "rows-{}.json".format(codec)
+            with self.project.upload_object("alpha", key, compression=Compression(codec)) as upload:
+                upload.set_custom_metadata(CustomMetadata.from_mapping({"type": "json"}))
+                upload.write_file(io.BytesIO(data))
+            stored, custom, _ = self.library.buckets["alpha"][key]
+            self.assertLess(len(stored), len(data) // 4)
+            self.assertEqual(custom, {"type": "json", "uplink-python:compression": codec})
+
+            output = io.BytesIO()
+            with self.project.download_object("alpha", key) as download:
+                download.read_file(output)
+            self.assertEqual(output.getvalue(), data)
+            # reads are decompressed into the caller's buffer, at most its size at a time
+            buffer, chunks = bytearray(1000), list()
+            with self.project.download_object("alpha", key) as download:
+                while True:
+                    size = download.readinto(buffer)
+                    if not size:
+                        break
+                    chunks.append(bytes(buffer[:size]))
+            self.assertEqual(b"".join(chunks), data)
+            # ranges and decompress=False return the data as stored
+            with self.project.download_object("alpha", key, DownloadOptions(0, 10)) as download:
+                self.assertEqual(download.read(10)[0], stored[:10])
+            with self.project.download_object("alpha", key, decompress=False) as download:
+                self.assertEqual(download.read(len(stored) + 1)[0], stored)
+
+        path = os.path.join(tempfile.mkdtemp(), "rows.json")
+        self.addCleanup(shutil.rmtree, os.path.dirname(path))
+        self.project.download_file_parallel("alpha", "rows-zlib.json", path)
+        with open(path, 'rb') as file_handle:
+            self.assertEqual(file_handle.read(), data)
+        with self.assertRaises(ValueError):
+            Compression("lz4")
+        self.project.close()
+        self.assertBalanced()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+# pylint: disable=missing-docstring
+import os
+import shutil
+import tempfile
+import unittest
+
+from uplink_python.digest import DigestIndex
+
+from .helper import LocalTestCase
+
+
+class DedupTest(LocalTestCase):
+    """Tests of the content addressed, deduplicating uploads of files."""
+
+    def test1_upload_file_dedup(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        first, second = os.path.join(directory, "first"), os.path.join(directory, "second")
+        for path in (first, second):
+            with open(path, 'wb') as file_handle:
+                file_handle.write(b"same content")
+        index = DigestIndex(os.path.join(directory, "index.json"))
+
+        result = self.project.upload_file_dedup("alpha", "file", first, index=index)
+        self.assertTrue(result.uploaded)
+        self.assertEqual(self.library.buckets["alpha"]["file"][1]["uplink-python:sha256"],
+                         result.sha256)
+        stored = self.library.buckets["alpha"]["file"]
+        for _ in range(3):
+            result = self.project.upload_file_dedup("alpha", "file", first, index=index)
+            self.assertFalse(result.uploaded)
+        self.assertIs(self.library.buckets["alpha"]["file"], stored)
+        self.assertEqual((index.hits, index.misses), (3, 1))
+
+        # identical files share one content addressed key
+        results = [self.project.upload_file_dedup("alpha", "cas/", path, content_addressed=True)
+                   for path in (first, second)]
+        self.assertEqual([(result.key, result.uploaded) for result in results],
+                         [("cas/" + results[0].sha256, True), ("cas/" + results[0].sha256, False)])
+
+        with open(first, 'ab') as file_handle:
+            file_handle.write(b" changed")
+        result = self.project.upload_file_dedup("alpha", "file", first, index=index)
+        self.assertEqual((result.uploaded, result.size), (True, 20))
+        index.save()
+        self.assertEqual(DigestIndex(index.path).get(first), result.sha256)
+        self.project.close()
+        self.assertBalanced()
+
+
+if __name__ == '__main__':
+    unittest.main()
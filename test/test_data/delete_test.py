@@ -0,0 +1,38 @@
+# pylint: disable=missing-docstring
+import unittest
+
+from uplink_python.errors import ObjectNotFoundError
+
+from .helper import LocalTestCase
+
+
+class DeleteTest(LocalTestCase):
+    """Tests of the bulk deletes of objects, prefixes and buckets."""
+
+    def test1_bulk_delete(self):
+        for i in range(30):
+            self.upload("dir/data-{:02}".format(i), b"x")
+        self.upload("other/data", b"x")
+        results = self.project.delete_prefix("alpha", "dir/", concurrency=4)
+        self.assertEqual([result.key for result in results],
+                         ["dir/data-{:02}".format(i) for i in range(30)])
+        self.assertFalse([result for result in results if result.error is not None])
+        self.assertEqual(results[0].get_dict()["deleted"]["key"], "dir/data-00")
+        results = self.project.delete_objects("alpha", iter(["other/data", "missing"]))
+        self.assertIsNone(results[0].error)
+        self.assertIsInstance(results[1].error, ObjectNotFoundError)
+        self.assertEqual(self.library.buckets["alpha"], {})
+        self.project.close()
+        self.assertBalanced()
+
+    def test2_delete_bucket_force(self):
+        for i in range(30):
+            self.upload("dir/data-{:02}".format(i), b"x")
+        self.project.delete_bucket("alpha", force=True)
+        self.assertNotIn("alpha", self.library.buckets)
+        self.project.close()
+        self.assertBalanced()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,30 @@
+# pylint: disable=missing-docstring
+import tempfile
+import unittest
+
+from .helper import LocalTestCase
+
+
+class DownloadTest(LocalTestCase):
+    """Tests of downloads read to the end of the object."""
+
+    def test1_read_file_without_stat(self):
+        self.upload("data.txt", b"hello world")
+
+        def stat_object(*args):
+            raise AssertionError("read_file must not stat the object")
+
+        self.library.uplink_stat_object = stat_object
+        with self.project.download_object("alpha", "data.txt") as download, \
+                tempfile.TemporaryFile() as file_handle:
+            download.read_file(file_handle, 4)
+            self.assertEqual(download.file_size(), 11)
+            self.assertIs(download.info(), download.info())
+            file_handle.seek(0)
+            self.assertEqual(file_handle.read(), b"hello world")
+        self.project.close()
+        self.assertBalanced()
+
+
+if __name__ == '__main__':
+    unittest.main()
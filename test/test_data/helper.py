@@ -1,8 +1,16 @@
 # pylint: disable=missing-docstring
+import gc
+import os
 import unittest
 
+from uplink_python.access import Access
+from uplink_python.local import LocalLibrary
+from uplink_python.module_classes import CustomMetadata, CustomMetadataEntry
 from uplink_python.uplink import Uplink
 
+# without a secret.txt the tests run offline, against one in-process backend shared by all
+LOCAL_LIBRARY = LocalLibrary()
+
 
 class TestPy:
     """
@@ -12,14 +20,18 @@ class TestPy:
     def __init__(self):
         super().__init__()
         # method to get satellite, api key and passphrase
-        file_handle = open("secret.txt", 'r')
-        self.api_key = file_handle.read()
-        file_handle.close()
+        self.offline = not os.path.exists("secret.txt")
+        if self.offline:
+            self.api_key = "local"
+        else:
+            file_handle = open("secret.txt", 'r')
+            self.api_key = file_handle.read()
+            file_handle.close()
 
         self.satellite = "12EayRS2V1kEsWESU9QMRseFhdxYxKicsiFmxrsLZHeLUtdps3S@us-central-1.tardigrade.io:7777"
         self.encryption_phrase = "test"
 
-        self.uplink = Uplink()
+        self.uplink = Uplink(LOCAL_LIBRARY) if self.offline else Uplink()
         self.access = None
         self.project = None
 
@@ -43,10 +55,42 @@ class InitializationTest(unittest.TestCase):
         self.assertIsNotNone(self.test_py, "TestPy initialization failed.")
 
     def test2_get_credentials(self):
+        if self.test_py.offline:
+            self.skipTest("no secret.txt, running against LocalLibrary")
         file_handle = open("secret.txt", 'r')
         self.assertIsNotNone(file_handle, "Credentials retrieval failed.")
         file_handle.close()
 
 
+class LocalTestCase(unittest.TestCase):
+    """
+    Base of the tests run against a LocalLibrary of their own, which assert the binding frees
+    every native allocation. Unless with_project is False, a project is opened on it with an
+    empty bucket "alpha".
+    """
+
+    with_project = True
+
+    def setUp(self):
+        self.uplink = Uplink(LocalLibrary())
+        self.library = self.uplink.m_libuplink
+        self.access = Access(None, self.uplink)
+        self.project = None
+        if self.with_project:
+            self.project = self.access.open_project()
+            self.project.ensure_bucket("alpha")
+
+    def assertBalanced(self):
+        gc.collect()
+        self.assertEqual(self.library.allocations, self.library.frees,
+                         "native allocations not freed")
+        self.assertFalse(self.library.allocated, "native allocations not freed")
+
+    def upload(self, key, data):
+        with self.project.upload_object("alpha", key) as upload:
+            upload.set_custom_metadata(CustomMetadata([CustomMetadataEntry("k", 1, "v", 1)], 1))
+            upload.write(data)
+
+
 if __name__ == '__main__':
     unittest.main()
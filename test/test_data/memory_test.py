@@ -0,0 +1,170 @@
+# pylint: disable=missing-docstring
+import mmap
+import tempfile
+import unittest
+
+from uplink_python.errors import ObjectNotFoundError, BucketNotFoundError
+from uplink_python.module_classes import ListObjectsOptions
+
+from .helper import LocalTestCase
+
+
+class MemoryTest(LocalTestCase):
+    """Soak tests asserting every native allocation is freed by the binding."""
+
+    iterations = 2000
+
+    def test1_stat_object(self):
+        self.upload("data.txt", b"hello")
+        for _ in range(self.iterations):
+            self.assertEqual(self.project.stat_object("alpha", "data.txt").key, "data.txt")
+            with self.assertRaises(ObjectNotFoundError):
+                self.project.stat_object("alpha", "missing.txt")
+            self.project.stat_bucket("alpha")
+        self.project.close()
+        self.assertBalanced()
+
+    def test2_upload_download(self):
+        data = bytes(range(256)) * 64
+        for i in range(self.iterations // 10):
+            self.upload("data-{}".format(i), data)
+            with self.project.download_object("alpha", "data-{}".format(i)) as download:
+                buffer = bytearray(1000)
+                downloaded = 0
+                while True:
+                    bytes_read = download.readinto(buffer)
+                    if not bytes_read:
+                        break
+                    downloaded += bytes_read
+                self.assertEqual(downloaded, len(data))
+                download.info()
+        self.project.close()
+        self.assertBalanced()
+
+    def test3_list(self):
+        for i in range(20):
+            self.upload("data-{}".format(i), b"x")
+        for _ in range(self.iterations // 20):
+            self.assertEqual(len(self.project.list_objects(
+                "alpha", ListObjectsOptions(recursive=True, system=True, custom=True))), 20)
+            self.assertEqual(len(self.project.list_buckets()), 1)
+        self.project.close()
+        self.assertBalanced()
+
+    def test4_unclosed_handles(self):
+        # uploads and downloads never closed are released when garbage collected
+        self.upload("data.txt", b"hello")
+        for _ in range(self.iterations // 10):
+            upload = self.project.upload_object("alpha", "aborted.txt")
+            upload.write(b"data")
+            upload.abort()
+            download = self.project.download_object("alpha", "data.txt")
+            download.read(2)
+        del upload, download
+        self.project.close()
+        self.assertBalanced()
+
+    def test5_iterate_early_break(self):
+        for i in range(20):
+            self.upload("data-{}".format(i), b"x")
+        for _ in range(self.iterations // 20):
+            # the native iterator is released when the generator is closed mid-listing
+            for object_ in self.project.iterate_objects("alpha"):
+                if object_.key == "data-5":
+                    break
+            objects = self.project.iterate_objects("alpha", ListObjectsOptions(cursor="data-5"))
+            self.assertEqual(next(objects).key, "data-6")
+            del objects
+            with self.assertRaises(BucketNotFoundError):
+                list(self.project.iterate_objects("missing"))
+        self.project.close()
+        self.assertBalanced()
+
+    def test6_list_columnar(self):
+        for i in range(20):
+            self.upload("data-{:02}".format(i), b"x" * i)
+        options = ListObjectsOptions(recursive=True, system=True, custom=True)
+        for _ in range(self.iterations // 20):
+            columns = self.project.list_objects("alpha", options, columnar=True)
+            self.assertEqual(columns.keys, ["data-{:02}".format(i) for i in range(20)])
+            self.assertEqual(sum(columns.content_length), sum(range(20)))
+            self.assertEqual(columns.custom[0], {"k": "v"})
+            batches = list(self.project.iterate_object_batches("alpha", batch_size=8))
+            self.assertEqual([len(batch) for batch in batches], [8, 8, 4])
+            self.assertIsNone(batches[0].custom)
+        self.project.close()
+        self.assertBalanced()
+
+    def test7_listed_objects_are_slotted(self):
+        self.upload("data.txt", b"hello")
+        object_ = self.project.list_objects("alpha", ListObjectsOptions(system=True,
+                                                                       custom=True))[0]
+        for model in (object_, object_.system, object_.custom, object_.custom.entries[0],
+                      self.project.stat_bucket("alpha")):
+            self.assertFalse(hasattr(model, "__dict__"))
+        with self.assertRaises(AttributeError):
+            object_.key = "other.txt"
+        self.assertEqual(object_.get_dict()["custom"]["entries"][0]["key"], "k")
+        self.project.close()
+        self.assertBalanced()
+
+    def test8_read_only_buffers(self):
+        data = bytes(range(256)) * 64
+        with tempfile.TemporaryFile() as file_handle:
+            file_handle.write(data)
+            file_handle.flush()
+            mapped = mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+            self.addCleanup(mapped.close)
+            for _ in range(self.iterations // 10):
+                # read-only buffers are written in place, and released after every write
+                with self.project.upload_object("alpha", "data") as upload:
+                    with memoryview(data) as view:
+                        upload.write(view[100:])
+                    upload.write(mapped)
+            self.assertEqual(self.library.buckets["alpha"]["data"][0], data[100:] + data)
+            # no export of the map is left behind, BufferError would be raised otherwise
+            mapped.close()
+        self.project.close()
+        self.assertBalanced()
+
+    def test9_freed_handles(self):
+        # freed uploads and closed downloads drop their native handle, freeing or closing
+        # them again does nothing and using them raises ValueError
+        with self.project.upload_object("alpha", "data") as upload:
+            upload.write(b"hello")
+        self.assertIsNone(upload.upload)
+        upload.free()
+        for call in (lambda: upload.write(b"data"), upload.commit, upload.abort, upload.info,
+                     upload.set_custom_metadata):
+            with self.assertRaisesRegex(ValueError, "upload is closed"):
+                call()
+
+        download = self.project.download_object("alpha", "data")
+        self.assertEqual(download.read(5), (b"hello", 5))
+        download.close()
+        self.assertIsNone(download.download)
+        download.close()
+        for call in (lambda: download.read(5), lambda: download.readinto(bytearray(5)),
+                     download.info, download.file_size):
+            with self.assertRaisesRegex(ValueError, "download is closed"):
+                call()
+        self.project.close()
+        self.assertBalanced()
+
+    def test10_project_closed_twice(self):
+        # closing a project again does not pass its freed handle to libuplinkc
+        closed = list()
+        close_project = self.library.uplink_close_project
+        self.library.uplink_close_project = lambda project: closed.append(project) or \
+            close_project(project)
+        with self.access.open_project() as project:
+            project.stat_bucket("alpha")
+        project.close()
+        self.project.close()
+        self.project.close()
+        self.assertEqual(len(closed), 2)
+        self.assertBalanced()
+
+
+if __name__ == '__main__':
+    unittest.main()
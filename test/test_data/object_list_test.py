@@ -60,6 +60,32 @@ class ObjectListTest(unittest.TestCase):
         self.assertTrue(all(item in retrieved_object_names for item in expected_names),
                         "Not all objects found in object list")
 
+    def test4a_iterate_objects(self):
+        # objects are yielded as the listing advances
+        objects = self.project.iterate_objects("py-unit-test",
+                                               ListObjectsOptions(recursive=True))
+        first = next(objects)
+        objects.close()
+        #
+        # resume the listing after the first object
+        retrieved_object_names = [first.key]
+        for item in self.project.iterate_objects("py-unit-test",
+                                                 ListObjectsOptions(recursive=True,
+                                                                    cursor=first.key)):
+            retrieved_object_names.append(item.key)
+        #
+        self.assertTrue(all(item in retrieved_object_names for item in self.object_names),
+                        "Not all objects found in object iteration")
+
+    def test4b_list_objects_columnar(self):
+        columns = self.project.list_objects("py-unit-test",
+                                            ListObjectsOptions(recursive=True, system=True),
+                                            columnar=True)
+        self.assertTrue(all(item in columns.keys for item in self.object_names),
+                        "Not all objects found in columnar object list")
+        self.assertEqual(sum(columns.content_length), 5 * len(self.object_names),
+                         "list_objects columnar sizes mismatch")
+
     def test5_delete_objects(self):
         for name in self.object_names:
             object_ = self.project.delete_object("py-unit-test", name)
@@ -1,9 +1,11 @@
 # pylint: disable=missing-docstring
+import io
 import random
 import string
 import unittest
 
 from uplink_python.errors import StorjException, ERROR_OBJECT_NOT_FOUND
+from uplink_python.module_classes import CustomMetadata
 from .helper import TestPy
 
 
@@ -59,6 +61,19 @@ class ObjectTest(unittest.TestCase):
         # commit upload data to bucket
         upload.commit()
 
+    def test2a_upload_stream(self):
+        data_bytes = bytes(''.join(random.choices(string.ascii_uppercase +
+                                                  string.digits, k=self.data_len)), 'utf-8')
+        #
+        # small writes are coalesced, the object is committed when the stream is closed
+        with self.project.upload_stream("alpha", "stream.txt", buffer_size=1024) as stream:
+            for i in range(0, self.data_len, 100):
+                stream.write(data_bytes[i:i + 100])
+
+        object_ = self.project.stat_object("alpha", "stream.txt")
+        self.assertEqual(object_.system.content_length, self.data_len, "upload_stream failed")
+        self.project.delete_object("alpha", "stream.txt")
+
     def test3_basic_download(self):
         data_bytes = bytes()
         download = self.project.download_object("alpha", "data.txt")
@@ -92,10 +107,47 @@ class ObjectTest(unittest.TestCase):
         # close downloader and free downloader access
         download.close()
 
+    def test3a_download_readinto(self):
+        download = self.project.download_object("alpha", "data.txt")
+        self.assertIsNotNone(download, "download_object failed")
+        #
+        # read into one caller-owned buffer, reused for every chunk
+        buffer = bytearray(256)
+        downloaded_total = 0
+        while True:
+            bytes_read = download.readinto(buffer)
+            if bytes_read == 0:
+                break
+            downloaded_total += bytes_read
+
+        self.assertEqual(downloaded_total, self.data_len, "download_readinto failed")
+        download.close()
+
+    def test3b_download_stream(self):
+        with self.project.download_stream("alpha", "data.txt") as stream:
+            data_bytes = stream.read()
+            self.assertEqual(len(data_bytes), self.data_len, "download_stream read failed")
+            #
+            # seek re-opens the download at the requested offset
+            stream.seek(-256, io.SEEK_END)
+            self.assertEqual(stream.read(), data_bytes[-256:], "download_stream seek failed")
+            self.assertEqual(stream.tell(), self.data_len, "download_stream tell failed")
+
     def test4_stat_object(self):
         object_ = self.project.stat_object("alpha", "data.txt")
         self.assertIsNotNone(object_, "stat_object failed")
 
+    def test4a_custom_metadata(self):
+        with self.project.upload_object("alpha", "custom.txt") as upload:
+            upload.set_custom_metadata(CustomMetadata.from_mapping({"clé": "valeur ✓"}))
+            upload.write(b"data")
+        object_ = self.project.stat_object("alpha", "custom.txt")
+        entry = object_.custom.entries[0]
+        self.assertEqual((entry.key, entry.value), ("clé", "valeur ✓"), "custom metadata failed")
+        self.assertEqual((entry.key_length, entry.value_length), (4, 10),
+                         "custom metadata lengths are not in bytes")
+        self.project.delete_object("alpha", "custom.txt")
+
     def test5_delete_existing_object(self):
         object_ = self.project.delete_object("alpha", "data.txt")
         self.assertIsNotNone(object_, "delete_object failed")
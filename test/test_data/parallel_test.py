@@ -0,0 +1,126 @@
+# pylint: disable=missing-docstring
+import os
+import tempfile
+import unittest
+
+from uplink_python.errors import InternalError, ObjectNotFoundError
+from uplink_python.local import LocalLibrary
+from uplink_python.module_classes import CustomMetadata, CustomMetadataEntry,\
+    CommitUploadOptions
+
+from .helper import LocalTestCase
+
+
+class ParallelTest(LocalTestCase):
+    """Tests of the parallel multipart uploads and ranged downloads of files."""
+
+    def test1_upload_file_parallel(self):
+        data = os.urandom(300 * 1024 + 7)
+        with tempfile.NamedTemporaryFile(delete=False) as file_handle:
+            file_handle.write(data)
+        self.addCleanup(os.remove, file_handle.name)
+        custom = CommitUploadOptions(CustomMetadata([CustomMetadataEntry("k", 1, "v", 1)], 1))
+        progress = list()
+        object_ = self.project.upload_file_parallel(
+            "alpha", "parallel.bin", file_handle.name, part_size=64 * 1024, workers=4,
+            commit_upload_options=custom, progress=lambda *done: progress.append(done))
+        self.assertEqual(object_.system.content_length, len(data))
+        self.assertEqual(self.library.buckets["alpha"]["parallel.bin"][:2], (data, {"k": "v"}))
+        self.assertEqual(progress[-1], (len(data), len(data)))
+        self.project.close()
+        self.assertBalanced()
+
+    def test2_upload_file_parallel_failure_aborts(self):
+        with tempfile.NamedTemporaryFile(delete=False) as file_handle:
+            file_handle.write(os.urandom(300 * 1024))
+        self.addCleanup(os.remove, file_handle.name)
+        self.library.fail("uplink_part_upload_write")
+        with self.assertRaises(InternalError):
+            self.project.upload_file_parallel("alpha", "parallel.bin", file_handle.name,
+                                              part_size=64 * 1024, workers=4)
+        self.assertFalse(self.library.uploads)
+        self.assertNotIn("parallel.bin", self.library.buckets["alpha"])
+        # a failed commit aborts the multipart upload as well
+        self.library.fail("uplink_commit_upload")
+        with self.assertRaises(InternalError):
+            self.project.upload_file_parallel("alpha", "parallel.bin", file_handle.name,
+                                              part_size=64 * 1024, workers=4)
+        self.assertFalse(self.library.uploads)
+        self.assertNotIn("parallel.bin", self.library.buckets["alpha"])
+        self.project.close()
+        self.assertBalanced()
+
+    def test2a_upload_file_parallel_without_multipart(self):
+        # libuplinkc v1.2.2 does not export the multipart upload functions
+        begin_upload = LocalLibrary.uplink_begin_upload
+        del LocalLibrary.uplink_begin_upload
+        self.addCleanup(setattr, LocalLibrary, "uplink_begin_upload", begin_upload)
+        data = os.urandom(300 * 1024 + 7)
+        with tempfile.NamedTemporaryFile(delete=False) as file_handle:
+            file_handle.write(data)
+        self.addCleanup(os.remove, file_handle.name)
+        custom = CommitUploadOptions(CustomMetadata([CustomMetadataEntry("k", 1, "v", 1)], 1))
+        progress = list()
+        object_ = self.project.upload_file_parallel(
+            "alpha", "parallel.bin", file_handle.name, part_size=64 * 1024, workers=4,
+            commit_upload_options=custom, progress=lambda *done: progress.append(done))
+        self.assertEqual(object_.system.content_length, len(data))
+        self.assertEqual(self.library.buckets["alpha"]["parallel.bin"][:2], (data, {"k": "v"}))
+        self.assertEqual(progress[-1], (len(data), len(data)))
+        self.assertFalse(self.library.uploads)
+        self.project.close()
+        self.assertBalanced()
+
+    def test3_download_file_parallel(self):
+        data = os.urandom(300 * 1024 + 7)
+        self.upload("parallel.bin", data)
+        with tempfile.NamedTemporaryFile(delete=False) as file_handle:
+            pass
+        self.addCleanup(os.remove, file_handle.name)
+        progress = list()
+        # failed reads of a segment are retried
+        self.library.fail("uplink_download_read", 2)
+        object_ = self.project.download_file_parallel(
+            "alpha", "parallel.bin", file_handle.name, segment_size=64 * 1024, workers=4,
+            progress=lambda *done: progress.append(done))
+        self.assertEqual(object_.system.content_length, len(data))
+        with open(file_handle.name, 'rb') as downloaded:
+            self.assertEqual(downloaded.read(), data)
+        self.assertEqual(progress[-1], (len(data), len(data)))
+        self.library.fail("uplink_download_read", 1000)
+        with self.assertRaises(InternalError):
+            self.project.download_file_parallel("alpha", "parallel.bin", file_handle.name,
+                                                segment_size=64 * 1024, workers=4, retries=1)
+        self.library.fail("uplink_download_read", 0)
+        with self.assertRaises(ObjectNotFoundError):
+            self.project.download_file_parallel("alpha", "missing.bin", file_handle.name)
+        self.project.close()
+        self.assertBalanced()
+
+    def test4_download_file_parallel_current_size(self):
+        self.upload("parallel.bin", os.urandom(100 * 1024))
+        cache = self.project.enable_cache()
+        self.project.stat_object("alpha", "parallel.bin")
+        # overwritten behind the cache of the project
+        data = os.urandom(300 * 1024 + 7)
+        self.library.buckets["alpha"]["parallel.bin"] = (data, {}, 0)
+        with tempfile.NamedTemporaryFile(delete=False) as file_handle:
+            pass
+        self.addCleanup(os.remove, file_handle.name)
+        retry = self.project.enable_retries(max_attempts=3, base_delay=0.001)
+        # a segment whose download gave up is resumed as the retry policy decides, not retries
+        self.library.fail("uplink_download_read", 3)
+        object_ = self.project.download_file_parallel(
+            "alpha", "parallel.bin", file_handle.name, segment_size=64 * 1024, workers=1,
+            retries=0)
+        self.assertEqual(object_.system.content_length, len(data))
+        with open(file_handle.name, 'rb') as downloaded:
+            self.assertEqual(downloaded.read(), data)
+        self.assertEqual(cache.get("alpha", "parallel.bin").system.content_length, 100 * 1024)
+        self.assertEqual((sum(retry.retries.values()), sum(retry.exhausted.values())), (3, 1))
+        self.project.close()
+        self.assertBalanced()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+# pylint: disable=missing-docstring
+import threading
+import unittest
+
+from uplink_python.errors import InternalError, PoolTimeoutError
+from uplink_python.pool import ProjectPool
+
+from .helper import LocalTestCase
+
+
+class PoolTest(LocalTestCase):
+    """Tests of ProjectPool against the in-memory LocalLibrary."""
+
+    with_project = False
+
+    def test1_threads_share_bounded_projects(self):
+        pool = ProjectPool(self.access, min_size=1, max_size=4)
+        errors = list()
+
+        def worker():
+            try:
+                for i in range(50):
+                    with pool.project() as project:
+                        project.ensure_bucket("bucket-{}".format(i % 3))
+            except Exception as exception:  # pylint: disable=broad-except
+                errors.append(exception)
+
+        threads = [threading.Thread(target=worker) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        metrics = pool.get_dict()
+        self.assertLessEqual(metrics["created"], 4)
+        self.assertEqual(metrics["checkouts"], 16 * 50)
+        self.assertEqual(metrics["in_use"], 0)
+        pool.close()
+        self.assertEqual(pool.get_dict()["size"], 0)
+        self.assertBalanced()
+
+    def test2_checkout_timeout(self):
+        with ProjectPool(self.access, max_size=1) as pool:
+            project = pool.checkout()
+            with self.assertRaises(PoolTimeoutError):
+                pool.checkout(timeout=0.05)
+            self.assertEqual(pool.get_dict()["timeouts"], 1)
+            pool.checkin(project)
+            pool.checkin(pool.checkout(timeout=0.05))
+        self.assertBalanced()
+
+    def test3_health_check_replaces_project(self):
+        with ProjectPool(self.access, check_interval=0,
+                         health_check=lambda project: False) as pool:
+            first = pool.checkout()
+            pool.checkin(first)
+            second = pool.checkout()
+            self.assertIsNot(first, second)
+            pool.checkin(second)
+            self.assertEqual((pool.created, pool.discarded), (2, 1))
+        self.assertBalanced()
+
+    def test4_idle_eviction_and_broken_projects(self):
+        with ProjectPool(self.access, min_size=1, max_size=4, max_idle=0) as pool:
+            projects = [pool.checkout() for _ in range(3)]
+            for project in projects:
+                pool.checkin(project)
+            self.assertEqual(pool.get_dict()["size"], 1)
+            with self.assertRaises(InternalError):
+                with pool.project():
+                    raise InternalError("connection lost")
+            self.assertEqual(pool.get_dict()["size"], 0)
+        self.assertBalanced()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+# pylint: disable=missing-docstring
+import io
+import os
+import unittest
+
+from uplink_python.compression import Compression
+from uplink_python.errors import InternalError, BucketNotFoundError, ERROR_INTERNAL,\
+    ERROR_TOO_MANY_REQUESTS
+from uplink_python.module_classes import DownloadOptions, ListObjectsOptions
+from uplink_python.retry import RetryPolicy
+
+from .helper import LocalTestCase
+
+
+class RetryTest(LocalTestCase):
+    """Tests of the retry policy of a Project, against LocalLibrary injecting errors."""
+
+    def setUp(self):
+        super().setUp()
+        self.retry = self.project.enable_retries(max_attempts=4, base_delay=0.001)
+
+    def test1_policy(self):
+        policy = RetryPolicy(max_attempts=3, base_delay=0.5, max_delay=1.0, jitter=0.0)
+        self.assertEqual([policy.delay(attempt) for attempt in range(1, 5)],
+                         [0.5, 1.0, 1.0, 1.0])
+        policy.jitter = 1.0
+        for attempt in range(1, 5):
+            self.assertTrue(0 <= policy.delay(attempt) <= 1.0)
+
+        policy = RetryPolicy(max_attempts=3, base_delay=0.001)
+        calls = list()
+
+        def flaky(result, failures):
+            calls.append(result)
+            if len(calls) <= failures:
+                raise InternalError("flaky")
+            return result
+
+        self.assertEqual(policy.call(flaky, "ok", 2), "ok")
+        calls.clear()
+        with self.assertRaises(InternalError):
+            policy.call(flaky, "ok", 3)
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(policy.get_dict()["retries"], {ERROR_INTERNAL: 4})
+        self.assertEqual(policy.get_dict()["exhausted"], {ERROR_INTERNAL: 1})
+        # errors which are not transient are raised at once
+        calls.clear()
+        with self.assertRaises(BucketNotFoundError):
+            policy.call(lambda: calls.append(1) or self.project.stat_bucket("missing"))
+        self.assertEqual(len(calls), 1)
+        # no retry is made past the deadline
+        policy = RetryPolicy(max_attempts=100, base_delay=1.0, jitter=0.0, deadline=0.5)
+        calls.clear()
+        with self.assertRaises(InternalError):
+            policy.call(flaky, "ok", 1)
+        self.assertEqual(len(calls), 1)
+
+    def test2_stat_object(self):
+        with self.project.upload_object("alpha", "data") as upload:
+            upload.write(b"data")
+        self.library.fail("uplink_stat_object", 1, ERROR_TOO_MANY_REQUESTS)
+        self.assertEqual(self.project.stat_object("alpha", "data").key, "data")
+        self.assertEqual(self.retry.retries, {ERROR_TOO_MANY_REQUESTS: 1})
+        self.library.fail("uplink_stat_object", 4)
+        with self.assertRaises(InternalError):
+            self.project.stat_object("alpha", "data")
+        self.assertEqual(self.retry.exhausted, {ERROR_INTERNAL: 1})
+        self.project.close()
+        self.assertBalanced()
+
+    def test3_list_objects_resumes(self):
+        keys = ["object-{:03d}".format(i) for i in range(50)]
+        for key in keys:
+            self.library.buckets["alpha"][key] = (b"", {}, 0)
+        self.library.fail("uplink_list_objects")
+        self.assertEqual([object_.key for object_ in self.project.list_objects("alpha")], keys)
+
+        listed = list()
+        for object_ in self.project.iterate_objects("alpha", ListObjectsOptions(recursive=True)):
+            listed.append(object_.key)
+            if len(listed) in (10, 30):
+                # the listing fails twice in a row after 10 objects, then after 30
+                self.library.fail("uplink_object_iterator_next", 2 if len(listed) == 10 else 1)
+        self.assertEqual(listed, keys)
+        self.assertEqual(self.retry.retries[ERROR_INTERNAL], 4)
+        self.project.close()
+        self.assertBalanced()
+
+    def test4_download_resumes(self):
+        data = os.urandom(1024 * 1024)
+        with self.project.upload_object("alpha", "plain") as upload:
+            upload.write(data)
+        with self.project.upload_object("alpha", "packed", compression=Compression(),
+                                        checksums=["sha256"]) as upload:
+            upload.write(data)
+
+        for key in ("plain", "packed"):
+            self.library.fail("uplink_download_object")
+            with self.project.download_object("alpha", key) as download:
+                first, _ = download.read(1000)
+                self.library.fail("uplink_download_read", 2, ERROR_TOO_MANY_REQUESTS)
+                output = io.BytesIO()
+                download.read_file(output)
+            self.assertEqual(first + output.getvalue(), data)
+
+        # a range is resumed within its bounds
+        with self.project.download_object("alpha", "plain",
+                                          DownloadOptions(1000, 5000)) as download:
+            first, _ = download.read(1024)
+            self.library.fail("uplink_download_read", 1)
+            output = io.BytesIO()
+            download.read_file(output, 1024)
+        self.assertEqual(first + output.getvalue(), data[1000:6000])
+
+        self.library.fail("uplink_download_read", 4)
+        with self.project.download_object("alpha", "plain") as download:
+            with self.assertRaises(InternalError):
+                download.read_file(io.BytesIO())
+        self.assertEqual(self.retry.exhausted, {ERROR_INTERNAL: 1})
+        self.project.close()
+        self.assertBalanced()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,30 @@
+# pylint: disable=missing-docstring
+import unittest
+
+from uplink_python.errors import BucketNotFoundError
+
+from .helper import LocalTestCase
+
+
+class StatTest(LocalTestCase):
+    """Tests of the bulk stat of objects with bounded concurrency."""
+
+    def test1_stat_objects(self):
+        for i in range(20):
+            self.upload("data-{:02}".format(i), b"x" * i)
+        keys = ["data-{:02}".format(i) for i in range(0, 40, 2)]
+        results = self.project.stat_objects("alpha", iter(keys), concurrency=4)
+        self.assertEqual([key for key, _ in results], keys)
+        self.assertEqual([object_.system.content_length for _, object_ in results[:10]],
+                         list(range(0, 20, 2)))
+        self.assertEqual([object_ for _, object_ in results[10:]], [None] * 10)
+        results = self.project.stat_objects("alpha", keys, concurrency=4, ordered=False)
+        self.assertEqual(sorted(key for key, _ in results), keys)
+        with self.assertRaises(BucketNotFoundError):
+            self.project.stat_objects("missing", keys)
+        self.project.close()
+        self.assertBalanced()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+# pylint: disable=missing-docstring
+import unittest
+
+from uplink_python.errors import InternalError, TooManyRequestsError
+
+from .helper import LocalTestCase
+
+
+class StreamTest(LocalTestCase):
+    """Tests of UploadStream against LocalLibrary."""
+
+    def test1_pass_through(self):
+        data = bytes(range(256)) * 16
+        with self.project.upload_stream("alpha", "stream", buffer_size=1024) as stream:
+            write = stream.upload.write
+            written = list()
+            stream.upload.write = lambda chunk: written.append(chunk) or write(chunk)
+            stream.write(data)
+            stream.write(b"tail")
+        # the large write reaches the upload as the bytes object itself
+        self.assertIs(written[0], data)
+        self.assertEqual(self.library.buckets["alpha"]["stream"][0], data + b"tail")
+        self.project.close()
+        self.assertBalanced()
+
+    def test2_no_progress(self):
+        stream = self.project.upload_stream("alpha", "stream", buffer_size=1024)
+        stream.upload.write = lambda chunk: 0
+        with self.assertRaises(InternalError):
+            stream.write(bytes(4096))
+        stream.abort()
+        self.assertNotIn("stream", self.library.buckets["alpha"])
+        self.project.close()
+        self.assertBalanced()
+
+    def test3_commit_error_kept(self):
+        stream = self.project.upload_stream("alpha", "stream")
+        stream.write(b"data")
+        self.library.fail("uplink_upload_commit")
+        abort = stream.upload.abort
+
+        def failing_abort():
+            abort()
+            raise TooManyRequestsError("abort failed")
+
+        stream.upload.abort = failing_abort
+        # the commit error is raised, not the one of the abort which followed
+        with self.assertRaises(InternalError):
+            stream.close()
+        self.assertTrue(stream.closed)
+        self.project.close()
+        self.assertBalanced()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+# pylint: disable=missing-docstring
+import os
+import shutil
+import tempfile
+import unittest
+
+from uplink_python.errors import InternalError
+from uplink_python.project import _merge_remote
+
+from .helper import LocalTestCase
+
+
+class SyncTest(LocalTestCase):
+    """Tests of the incremental mirroring of a directory tree to a bucket."""
+
+    def test1_sync(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        os.makedirs(os.path.join(directory, "sub"))
+        paths = [os.path.join(directory, name) for name in ("a.txt", "b.txt", "sub/c.txt")]
+        for path in paths:
+            with open(path, 'wb') as file_handle:
+                file_handle.write(path.encode("utf-8"))
+        keys = ["tree/a.txt", "tree/b.txt", "tree/sub/c.txt"]
+
+        result = self.project.sync(directory, "alpha", "tree", dry_run=True)
+        self.assertEqual((result.uploaded, result.dry_run), (keys, True))
+        self.assertEqual(self.library.buckets["alpha"], {})
+        result = self.project.sync(directory, "alpha", "tree", checksum=True, concurrency=2)
+        self.assertEqual(result.uploaded, keys)
+        self.assertEqual(result.bytes_uploaded, sum(len(path) for path in paths))
+        self.assertEqual(self.library.buckets["alpha"]["tree/a.txt"][0], paths[0].encode("utf-8"))
+        result = self.project.sync(directory, "alpha", "tree")
+        self.assertEqual((result.uploaded, result.skipped), ([], 3))
+
+        # same content with a new mtime is only skipped when comparing digests
+        stat = os.stat(paths[0])
+        os.utime(paths[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        self.assertEqual(self.project.sync(directory, "alpha", "tree", checksum=True,
+                                           dry_run=True).uploaded, [])
+        self.assertEqual(self.project.sync(directory, "alpha", "tree").uploaded, keys[:1])
+        with open(paths[1], 'ab') as file_handle:
+            file_handle.write(b"changed")
+        os.remove(paths[2])
+        result = self.project.sync(directory, "alpha", "tree", delete=True, dry_run=True)
+        self.assertEqual((result.uploaded, result.deleted), (keys[1:2], keys[2:]))
+        self.assertIn("tree/sub/c.txt", self.library.buckets["alpha"])
+        result = self.project.sync(directory, "alpha", "tree", delete=True)
+        self.assertEqual((result.uploaded, result.deleted, result.skipped),
+                         (keys[1:2], keys[2:], 1))
+        self.assertEqual(sorted(self.library.buckets["alpha"]), keys[:2])
+        self.assertEqual(result.get_dict()["errors"], {})
+
+        self.library.fail("uplink_upload_commit")
+        with open(paths[0], 'ab') as file_handle:
+            file_handle.write(b"changed")
+        result = self.project.sync(directory, "alpha", "tree")
+        self.assertEqual([key for key, _ in result.errors], keys[:1])
+        self.assertIsInstance(result.errors[0][1], InternalError)
+        self.project.close()
+        self.assertBalanced()
+
+    def test2_sync_key_order(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        os.makedirs(os.path.join(directory, "sub"))
+        # "sub.txt" < "sub/c.txt" < "z.txt", the directory is walked between the files
+        for name in ("z.txt", "sub.txt", "sub/c.txt", "a.txt"):
+            with open(os.path.join(directory, name), 'wb') as file_handle:
+                file_handle.write(name.encode("utf-8"))
+        keys = ["a.txt", "sub.txt", "sub/c.txt", "z.txt"]
+        self.assertEqual(self.project.sync(directory, "alpha").uploaded, keys)
+        self.upload("sub/b.txt", b"x")
+        self.upload("zz.txt", b"x")
+        result = self.project.sync(directory, "alpha", delete=True)
+        self.assertEqual((result.uploaded, result.skipped), ([], 4))
+        self.assertEqual(result.deleted, ["sub/b.txt", "zz.txt"])
+        self.assertEqual(sorted(self.library.buckets["alpha"]), keys)
+        self.project.close()
+        self.assertBalanced()
+
+    def test3_merge_streams_listing(self):
+        read = list()
+
+        def listing(keys):
+            for key in keys:
+                read.append(key)
+                yield key, key.upper()
+
+        files = [(key, None, None) for key in ("b", "d", "e")]
+        orphans = list()
+        merged = _merge_remote(iter(files), listing(["a", "b", "c", "e", "f"]), orphans)
+        # the listing is read no further than the file being compared
+        self.assertEqual(next(merged)[::3], ("b", "B"))
+        self.assertEqual((read, orphans), (["a", "b"], ["a"]))
+        # "d" may still be listed later, it is held until the end of the listing
+        self.assertEqual(next(merged)[::3], ("e", "E"))
+        self.assertEqual((read, orphans), (["a", "b", "c", "e"], ["a", "c"]))
+        self.assertEqual([item[::3] for item in merged], [("d", None)])
+        self.assertEqual(orphans, ["a", "c", "f"])
+
+        # a file whose copy is not read yet waits for it, whatever the order of the listing
+        orphans = list()
+        merged = _merge_remote(iter(files), iter([("b", 1), ("a", 3), ("e", 2), ("d", 4)]),
+                               orphans)
+        self.assertEqual([item[::3] for item in merged], [("b", 1), ("e", 2), ("d", 4)])
+        self.assertEqual(orphans, ["a"])
+        orphans = list()
+        merged = _merge_remote(iter([(key, None, None) for key in ("A", "B", "C")]),
+                               iter([("A", 1), ("C", 3), ("B", 2)]), orphans)
+        self.assertEqual(sorted(item[::3] for item in merged), [("A", 1), ("B", 2), ("C", 3)])
+        self.assertEqual(orphans, [])
+
+    def test4_sync_listing_out_of_order(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        keys = ["data-{}".format(i) for i in range(5)]
+        for key in keys:
+            with open(os.path.join(directory, key), 'wb') as file_handle:
+                file_handle.write(key.encode("utf-8"))
+        self.project.sync(directory, "alpha")
+        self.upload("orphan", b"x")
+        sync_listing = self.project._sync_listing  # pylint: disable=protected-access
+        self.project._sync_listing = lambda *args: reversed(list(sync_listing(*args)))
+        # unchanged files are neither uploaded again nor deleted
+        result = self.project.sync(directory, "alpha", delete=True)
+        self.assertEqual((result.uploaded, result.skipped), ([], 5))
+        self.assertEqual(result.deleted, ["orphan"])
+        self.assertEqual(sorted(self.library.buckets["alpha"]), keys)
+        self.project.close()
+        self.assertBalanced()
+
+
+if __name__ == '__main__':
+    unittest.main()
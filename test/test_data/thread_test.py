@@ -0,0 +1,59 @@
+# pylint: disable=missing-docstring
+import threading
+import unittest
+
+from .helper import LocalTestCase
+
+
+class ThreadTest(LocalTestCase):
+    """Stress tests of one Project shared by many threads, against LocalLibrary."""
+
+    def cycle(self, key, data):
+        with self.project.upload_object("alpha", key) as upload:
+            upload.write(data)
+        buffer = bytearray(len(data) + 1)
+        with self.project.download_object("alpha", key) as download:
+            size = download.readinto(buffer)
+            self.assertEqual(download.readinto(buffer), 0)
+        self.assertEqual(bytes(buffer[:size]), data)
+        keys = [object_.key for object_ in self.project.list_objects("alpha")]
+        self.assertIn(key, keys)
+
+    def run_threads(self, threads, cycles):
+        """Runs cycles upload, download and list cycles from each of threads threads."""
+
+        errors = list()
+
+        def worker(index):
+            try:
+                for i in range(cycles):
+                    key = "thread-{}-object-{}".format(index, i)
+                    self.cycle(key, key.encode("utf-8") * (i + 1))
+            except Exception as exception:  # pylint: disable=broad-except
+                errors.append(exception)
+
+        workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        self.assertEqual(errors, [])
+
+    def test1_concurrent_transfers(self):
+        self.run_threads(16, 25)
+        self.assertEqual(len(self.project.list_objects("alpha")), 16 * 25)
+        self.project.close()
+        self.assertBalanced()
+
+    def test2_concurrent_transfers_with_latency(self):
+        # native calls overlap while they wait, the throughput gained from it is measured by
+        # benchmarks/bench_thread_scaling.py against the compiled stub libuplinkc
+        self.library.latency = 0.002
+        self.run_threads(8, 20)
+        self.assertEqual(len(self.project.list_objects("alpha")), 8 * 20)
+        self.project.close()
+        self.assertBalanced()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,11 +1,10 @@
 """Module with Access class and access methods to get access grant to access project"""
 import ctypes
 import hashlib
+import weakref
 
 from uplink_python.module_classes import Permission, SharePrefix, Config
-from uplink_python.module_def import _ConfigStruct, _PermissionStruct, _SharePrefixStruct, \
-    _AccessStruct, _ProjectResult, _StringResult, _AccessResult, _EncryptionKeyResult,\
-    _EncryptionKeyStruct
+from uplink_python.module_def import _ConfigStruct, _PermissionStruct, _SharePrefixStruct
 from uplink_python.project import Project
 from uplink_python.errors import _storj_exception
 
@@ -41,11 +40,14 @@ class Access:
         Access
     """
 
-    def __init__(self, access, uplink):
+    def __init__(self, access, uplink, access_result=None):
         """Constructs all the necessary attributes for the Access object."""
 
         self.access = access
         self.uplink = uplink
+        # native access result is freed when the Access object is garbage collected
+        if access_result is not None:
+            weakref.finalize(self, uplink.m_libuplink.uplink_free_access_result, access_result)
 
     def derive_encryption_key(self, passphrase: str, salt: str):
         """
@@ -59,13 +61,6 @@ class Access:
         EncryptionKey
         """
 
-        #
-        # declare types of arguments and response of the corresponding golang function
-        self.uplink.m_libuplink.uplink_derive_encryption_key.argtypes = [ctypes.c_char_p,
-                                                                         ctypes.c_void_p,
-                                                                         ctypes.c_size_t]
-        self.uplink.m_libuplink.uplink_derive_encryption_key.restype = _EncryptionKeyResult
-        #
         # prepare the input for the function
         passphrase_ptr = ctypes.c_char_p(passphrase.encode('utf-8'))
         hash_value = hashlib.sha256()  # Choose SHA256 and update with bytes
@@ -80,8 +75,10 @@ class Access:
         #
         # if error occurred
         if bool(encryption_key_result.error):
-            raise _storj_exception(encryption_key_result.error.contents.code,
-                                   encryption_key_result.error.contents.message.decode("utf-8"))
+            exception = _storj_exception(encryption_key_result.error.contents.code,
+                                         encryption_key_result.error.contents.message.decode("utf-8"))
+            self.uplink.m_libuplink.uplink_free_encryption_key_result(encryption_key_result)
+            raise exception
         return encryption_key_result.encryption_key
 
     def override_encryption_key(self, bucket_name: str, prefix: str, encryption_key):
@@ -96,14 +93,6 @@ class Access:
         None
         """
 
-        #
-        # declare types of arguments and response of the corresponding golang function
-        self.uplink.m_libuplink.uplink_access_override_encryption_key.argtypes =\
-            [ctypes.POINTER(_AccessStruct), ctypes.c_char_p, ctypes.c_char_p,
-             ctypes.POINTER(_EncryptionKeyStruct)]
-        self.uplink.m_libuplink.uplink_access_override_encryption_key.restype =\
-            _EncryptionKeyResult
-        #
         # prepare the input for the function
         bucket_name_ptr = ctypes.c_char_p(bucket_name.encode('utf-8'))
         prefix_ptr = ctypes.c_char_p(prefix.encode('utf-8'))
@@ -115,8 +104,10 @@ class Access:
         #
         # if error occurred
         if bool(error_result):
-            raise _storj_exception(error_result.contents.code,
-                                   error_result.contents.message.decode("utf-8"))
+            exception = _storj_exception(error_result.contents.code,
+                                         error_result.contents.message.decode("utf-8"))
+            self.uplink.m_libuplink.uplink_free_error(error_result)
+            raise exception
 
     def open_project(self):
         """
@@ -127,19 +118,16 @@ class Access:
         Project
         """
 
-        #
-        # declare types of arguments and response of the corresponding golang function
-        self.uplink.m_libuplink.uplink_open_project.argtypes = [ctypes.POINTER(_AccessStruct)]
-        self.uplink.m_libuplink.uplink_open_project.restype = _ProjectResult
-        #
         # open project by calling the exported golang function
         project_result = self.uplink.m_libuplink.uplink_open_project(self.access)
         #
         # if error occurred
         if bool(project_result.error):
-            raise _storj_exception(project_result.error.contents.code,
-                                   project_result.error.contents.message.decode("utf-8"))
-        return Project(project_result.project, self.uplink)
+            exception = _storj_exception(project_result.error.contents.code,
+                                         project_result.error.contents.message.decode("utf-8"))
+            self.uplink.m_libuplink.uplink_free_project_result(project_result)
+            raise exception
+        return Project(project_result.project, self.uplink, project_result)
 
     def config_open_project(self, config: Config):
         """
@@ -154,12 +142,6 @@ class Access:
         Project
         """
 
-        #
-        # declare types of arguments and response of the corresponding golang function
-        self.uplink.m_libuplink.uplink_config_open_project.argtypes =\
-            [_ConfigStruct, ctypes.POINTER(_AccessStruct)]
-        self.uplink.m_libuplink.uplink_config_open_project.restype = _ProjectResult
-        #
         # prepare the input for the function
         if config is None:
             config_obj = _ConfigStruct()
@@ -171,9 +153,11 @@ class Access:
         #
         # if error occurred
         if bool(project_result.error):
-            raise _storj_exception(project_result.error.contents.code,
-                                   project_result.error.contents.message.decode("utf-8"))
-        return Project(project_result.project, self.uplink)
+            exception = _storj_exception(project_result.error.contents.code,
+                                         project_result.error.contents.message.decode("utf-8"))
+            self.uplink.m_libuplink.uplink_free_project_result(project_result)
+            raise exception
+        return Project(project_result.project, self.uplink, project_result)
 
     def serialize(self):
         """
@@ -185,19 +169,17 @@ class Access:
         String
         """
 
-        #
-        # declare types of arguments and response of the corresponding golang function
-        self.uplink.m_libuplink.uplink_access_serialize.argtypes = [ctypes.POINTER(_AccessStruct)]
-        self.uplink.m_libuplink.uplink_access_serialize.restype = _StringResult
-        #
         # get serialized access by calling the exported golang function
         string_result = self.uplink.m_libuplink.uplink_access_serialize(self.access)
-        #
-        # if error occurred
-        if bool(string_result.error):
-            raise _storj_exception(string_result.error.contents.code,
-                                   string_result.error.contents.message.decode("utf-8"))
-        return string_result.string.decode("utf-8")
+        try:
+            #
+            # if error occurred
+            if bool(string_result.error):
+                raise _storj_exception(string_result.error.contents.code,
+                                       string_result.error.contents.message.decode("utf-8"))
+            return string_result.string.decode("utf-8")
+        finally:
+            self.uplink.m_libuplink.uplink_free_string_result(string_result)
 
     def share(self, permission: Permission = None, shared_prefix: [SharePrefix] = None):
         """
@@ -220,14 +202,6 @@ class Access:
         Access
         """
 
-        #
-        # declare types of arguments and response of the corresponding golang function
-        self.uplink.m_libuplink.uplink_access_share.argtypes = [ctypes.POINTER(_AccessStruct),
-                                                                _PermissionStruct,
-                                                                ctypes.POINTER(_SharePrefixStruct),
-                                                                ctypes.c_size_t]
-        self.uplink.m_libuplink.uplink_access_share.restype = _AccessResult
-        #
         # prepare the input for the function
         # check and create valid _PermissionStruct parameter
         if permission is None:
@@ -254,6 +228,8 @@ class Access:
         #
         # if error occurred
         if bool(access_result.error):
-            raise _storj_exception(access_result.error.contents.code,
-                                   access_result.error.contents.message.decode("utf-8"))
-        return Access(access_result.access, self.uplink)
+            exception = _storj_exception(access_result.error.contents.code,
+                                         access_result.error.contents.message.decode("utf-8"))
+            self.uplink.m_libuplink.uplink_free_access_result(access_result)
+            raise exception
+        return Access(access_result.access, self.uplink, access_result)
@@ -0,0 +1,9 @@
+"""
+asyncio interface to Storj (V3), coroutines backed by a bounded executor running the blocking
+calls of uplink_python, so the event loop is never blocked by libuplinkc. Requires Python 3.7+.
+"""
+from uplink_python.aio.project import AsyncProject, open_project
+from uplink_python.aio.upload import AsyncUpload
+from uplink_python.aio.download import AsyncDownload
+
+__all__ = ["AsyncProject", "AsyncUpload", "AsyncDownload", "open_project"]
@@ -0,0 +1,128 @@
+"""Module with AsyncDownload class, coroutines to work with object download"""
+from uplink_python.aio.executor import run_in_executor
+
+
+class AsyncDownload:
+    """
+    AsyncDownload is a download from Storj Network with coroutine methods, wrapping a Download.
+
+    As an async context manager it closes the download on exit.
+
+    ...
+
+    Attributes
+    ----------
+    download : Download
+        blocking download the coroutines run on the executor
+    executor : concurrent.futures.Executor
+        executor of the AsyncProject the download was started from
+
+    Methods
+    -------
+    readinto():
+        Int
+    read():
+        bytes, Int
+    read_file():
+        None
+    file_size():
+        Int
+    close():
+        None
+    info():
+        Object
+    """
+
+    def __init__(self, download, executor):
+        """Constructs all the necessary attributes for the AsyncDownload object."""
+
+        self.download = download
+        self.executor = executor
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def readinto(self, buffer):
+        """
+        function downloads up to len(buffer) bytes from the object's data stream directly into
+        buffer. It returns the number of bytes read, 0 at the end of the object.
+
+        Parameters
+        ----------
+        buffer : writable bytes-like object
+
+        Returns
+        -------
+        int
+        """
+
+        return await run_in_executor(self.executor, self.download.readinto, buffer)
+
+    async def read(self, size_to_read: int):
+        """
+        function downloads up to len size_to_read bytes from the object's data stream.
+        It returns the data_read in bytes and number of bytes read, 0 at the end of the object.
+
+        Parameters
+        ----------
+        size_to_read : int
+
+        Returns
+        -------
+        bytes, int
+        """
+
+        return await run_in_executor(self.executor, self.download.read, size_to_read)
+
+    async def read_file(self, file_handle, buffer_size: int = 0):
+        """
+        function downloads complete object from it's data stream and writes it to the file whose
+        handle is passed as parameter.
+
+        Parameters
+        ----------
+        file_handle : BinaryIO
+        buffer_size : int
+
+        Returns
+        -------
+        None
+        """
+
+        await run_in_executor(self.executor, self.download.read_file, file_handle, buffer_size)
+
+    async def file_size(self):
+        """
+        function returns the size of object on Storj network for which download has been created.
+
+        Returns
+        -------
+        int
+        """
+
+        return await run_in_executor(self.executor, self.download.file_size)
+
+    async def close(self):
+        """
+        function closes the download.
+
+        Returns
+        -------
+        None
+        """
+
+        await run_in_executor(self.executor, self.download.close)
+
+    async def info(self):
+        """
+        function returns information about the downloaded object.
+
+        Returns
+        -------
+        Object
+        """
+
+        return await run_in_executor(self.executor, self.download.info)
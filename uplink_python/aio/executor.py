@@ -0,0 +1,71 @@
+"""Helpers running blocking uplink_python calls on an executor from coroutines."""
+import asyncio
+import functools
+import itertools
+
+# threads of the executor created by AsyncProject, i.e. the calls in flight at the same time
+DEFAULT_MAX_WORKERS = 64
+
+
+async def run_in_executor(executor, function, *args, **kwargs):
+    """runs function(*args, **kwargs) on executor and returns its result."""
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, functools.partial(function, *args, **kwargs))
+
+
+class AsyncContext:
+    """
+    Awaitable of a coroutine returning an async context manager, which can also be used
+    directly in an async with statement: `async with project.upload_object(...) as upload`.
+    """
+
+    def __init__(self, coroutine):
+        self._coroutine = coroutine
+        self._result = None
+
+    def __await__(self):
+        return self._coroutine.__await__()
+
+    async def __aenter__(self):
+        self._result = await self._coroutine
+        return await self._result.__aenter__()
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        return await self._result.__aexit__(exc_type, exc_value, traceback)
+
+
+class AsyncIterator:
+    """
+    Async iterator over a blocking iterator, whose items are fetched on executor in batches
+    of batch_size, so an executor round trip is not paid per item.
+    """
+
+    def __init__(self, iterator, executor, batch_size: int = 1000):
+        self._iterator = iterator
+        self._executor = executor
+        self._batch_size = batch_size
+        self._batch = iter(())
+        self._exhausted = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        for item in self._batch:
+            return item
+        if not self._exhausted:
+            batch = await run_in_executor(self._executor, list,
+                                          itertools.islice(self._iterator, self._batch_size))
+            self._exhausted = len(batch) < self._batch_size
+            self._batch = iter(batch)
+            for item in self._batch:
+                return item
+        raise StopAsyncIteration
+
+    async def aclose(self):
+        """closes the underlying iterator, releasing its native resources."""
+
+        close = getattr(self._iterator, "close", None)
+        if close is not None:
+            await run_in_executor(self._executor, close)
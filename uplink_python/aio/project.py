@@ -0,0 +1,254 @@
+"""Module with AsyncProject class, coroutines to work with buckets and objects"""
+import concurrent.futures
+
+from uplink_python.aio.download import AsyncDownload
+from uplink_python.aio.executor import run_in_executor, AsyncContext, AsyncIterator,\
+    DEFAULT_MAX_WORKERS
+from uplink_python.aio.upload import AsyncUpload
+from uplink_python.compression import Compression
+from uplink_python.module_classes import ListBucketsOptions, ListObjectsOptions,\
+    UploadOptions, DownloadOptions, Config
+
+
+async def open_project(access, config: Config = None, max_workers: int = DEFAULT_MAX_WORKERS):
+    """
+    function opens the project of an Access without blocking the event loop.
+
+    Parameters
+    ----------
+    access : Access
+    config : Config (optional)
+    max_workers : int (optional)
+        size of the executor of the returned AsyncProject.
+
+    Returns
+    -------
+    AsyncProject
+    """
+
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers)
+    try:
+        if config is None:
+            project = await run_in_executor(executor, access.open_project)
+        else:
+            project = await run_in_executor(executor, access.config_open_project, config)
+    except BaseException:
+        executor.shutdown(wait=False)
+        raise
+    return AsyncProject(project, executor=executor, own_executor=True)
+
+
+class AsyncProject:
+    """
+    AsyncProject provides coroutines managing buckets and objects, wrapping a Project.
+
+    Every blocking call runs on a dedicated executor bounded to max_workers threads, which is
+    shared by the uploads and downloads started from the project.
+
+    ...
+
+    Attributes
+    ----------
+    project : Project
+        blocking project the coroutines run on the executor
+    executor : concurrent.futures.Executor
+        executor running the blocking calls
+
+    Methods
+    -------
+    create_bucket():
+        Bucket
+    ensure_bucket():
+        Bucket
+    stat_bucket():
+        Bucket
+    list_buckets():
+        list of Bucket
+    iterate_buckets():
+        async iterator of Bucket
+    delete_bucket():
+        Bucket
+    stat_object():
+        Object
+    list_objects():
+        list of Object or ObjectColumns
+    iterate_objects():
+        async iterator of Object
+    delete_object():
+        Object
+    close():
+        None
+    upload_object():
+        AsyncUpload
+    download_object():
+        AsyncDownload
+    """
+
+    def __init__(self, project, max_workers: int = DEFAULT_MAX_WORKERS, executor=None,
+                 own_executor: bool = False):
+        """Constructs all the necessary attributes for the AsyncProject object."""
+
+        self.project = project
+        if executor is None:
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers)
+            own_executor = True
+        self.executor = executor
+        # an executor created for the project is shut down when the project is closed
+        self._own_executor = own_executor
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def _run(self, function, *args, **kwargs):
+        return await run_in_executor(self.executor, function, *args, **kwargs)
+
+    async def create_bucket(self, bucket_name: str):
+        """function creates a new bucket."""
+
+        return await self._run(self.project.create_bucket, bucket_name)
+
+    async def ensure_bucket(self, bucket_name: str):
+        """function ensures the bucket exists, creating it when it does not."""
+
+        return await self._run(self.project.ensure_bucket, bucket_name)
+
+    async def stat_bucket(self, bucket_name: str):
+        """function returns information about a bucket."""
+
+        return await self._run(self.project.stat_bucket, bucket_name)
+
+    async def list_buckets(self, list_bucket_options: ListBucketsOptions = None):
+        """function returns a list of buckets with all its information."""
+
+        return await self._run(self.project.list_buckets, list_bucket_options)
+
+    def iterate_buckets(self, list_bucket_options: ListBucketsOptions = None,
+                        batch_size: int = 1000):
+        """
+        function returns an async iterator over the buckets, fetched from the executor in
+        batches of batch_size.
+
+        Parameters
+        ----------
+        list_bucket_options : ListBucketsOptions (optional)
+        batch_size : int (optional)
+
+        Returns
+        -------
+        async iterator of Bucket
+        """
+
+        return AsyncIterator(self.project.iterate_buckets(list_bucket_options), self.executor,
+                             batch_size)
+
+    async def delete_bucket(self, bucket_name: str):
+        """function deletes a bucket."""
+
+        return await self._run(self.project.delete_bucket, bucket_name)
+
+    async def stat_object(self, bucket_name: str, storj_path: str):
+        """function returns information about an object at the specific key."""
+
+        return await self._run(self.project.stat_object, bucket_name, storj_path)
+
+    async def list_objects(self, bucket_name: str, list_object_options: ListObjectsOptions = None,
+                           columnar: bool = False):
+        """function returns a list of objects, or ObjectColumns when columnar."""
+
+        return await self._run(self.project.list_objects, bucket_name, list_object_options,
+                               columnar)
+
+    def iterate_objects(self, bucket_name: str, list_object_options: ListObjectsOptions = None,
+                        batch_size: int = 1000):
+        """
+        function returns an async iterator over the objects of a bucket, fetched from the
+        executor in batches of batch_size.
+
+        Parameters
+        ----------
+        bucket_name : str
+        list_object_options : ListObjectsOptions (optional)
+        batch_size : int (optional)
+
+        Returns
+        -------
+        async iterator of Object
+        """
+
+        return AsyncIterator(self.project.iterate_objects(bucket_name, list_object_options),
+                             self.executor, batch_size)
+
+    async def delete_object(self, bucket_name: str, storj_path: str):
+        """function deletes an object at the specific key."""
+
+        return await self._run(self.project.delete_object, bucket_name, storj_path)
+
+    async def close(self):
+        """function closes the project and shuts down its own executor."""
+
+        try:
+            await self._run(self.project.close)
+        finally:
+            if self._own_executor:
+                self.executor.shutdown(wait=False)
+
+    def upload_object(self, bucket_name: str, storj_path: str,
+                      upload_options: UploadOptions = None, compression: Compression = None,
+                      checksums=None):
+        """
+        function starts an upload to the specified key. The result can be awaited, or used
+        directly in an async with statement, which commits the upload on exit.
+
+        Parameters
+        ----------
+        bucket_name : str
+        storj_path : str
+        upload_options : UploadOptions (optional)
+        compression : Compression (optional)
+        checksums : list of str (optional)
+
+        Returns
+        -------
+        AsyncUpload
+        """
+
+        return AsyncContext(self._upload_object(bucket_name, storj_path, upload_options,
+                                                compression, checksums))
+
+    async def _upload_object(self, bucket_name, storj_path, upload_options, compression,
+                             checksums):
+        upload = await self._run(self.project.upload_object, bucket_name, storj_path,
+                                 upload_options, compression, checksums)
+        return AsyncUpload(upload, self.executor)
+
+    def download_object(self, bucket_name: str, storj_path: str,
+                        download_options: DownloadOptions = None, decompress: bool = True,
+                        verify: bool = True):
+        """
+        function starts download to the specified key. The result can be awaited, or used
+        directly in an async with statement, which closes the download on exit.
+
+        Parameters
+        ----------
+        bucket_name : str
+        storj_path : str
+        download_options : DownloadOptions (optional)
+        decompress : bool (optional)
+        verify : bool (optional)
+
+        Returns
+        -------
+        AsyncDownload
+        """
+
+        return AsyncContext(self._download_object(bucket_name, storj_path, download_options,
+                                                  decompress, verify))
+
+    async def _download_object(self, bucket_name, storj_path, download_options, decompress,
+                               verify):
+        download = await self._run(self.project.download_object, bucket_name, storj_path,
+                                   download_options, decompress, verify)
+        return AsyncDownload(download, self.executor)
@@ -0,0 +1,133 @@
+"""Module with AsyncUpload class, coroutines to work with object upload"""
+from uplink_python.aio.executor import run_in_executor
+from uplink_python.module_classes import CustomMetadata
+
+
+class AsyncUpload:
+    """
+    AsyncUpload is an upload to Storj Network with coroutine methods, wrapping an Upload.
+
+    As an async context manager it commits the upload on exit, or aborts it on exception.
+    Buffers passed to write() must not be modified until the write is awaited.
+
+    ...
+
+    Attributes
+    ----------
+    upload : Upload
+        blocking upload the coroutines run on the executor
+    executor : concurrent.futures.Executor
+        executor of the AsyncProject the upload was started from
+
+    Methods
+    -------
+    write():
+        Int
+    write_file():
+        None
+    commit():
+        None
+    abort():
+        None
+    set_custom_metadata():
+        None
+    info():
+        Object
+    """
+
+    def __init__(self, upload, executor):
+        """Constructs all the necessary attributes for the AsyncUpload object."""
+
+        self.upload = upload
+        self.executor = executor
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """commits the upload, or aborts it on exception, unless already done."""
+
+        await run_in_executor(self.executor, self.upload.__exit__, exc_type, exc_value,
+                              traceback)
+
+    async def write(self, data_to_write, size_to_write: int = None):
+        """
+        function uploads bytes data passed as parameter to the object's data stream.
+
+        Parameters
+        ----------
+        data_to_write : bytes-like object
+        size_to_write : int (optional)
+
+        Returns
+        -------
+        int
+        """
+
+        return await run_in_executor(self.executor, self.upload.write, data_to_write,
+                                     size_to_write)
+
+    async def write_file(self, file_handle, buffer_size: int = 0):
+        """
+        function uploads complete file whose handle is passed as parameter to the
+        object's data stream.
+
+        Parameters
+        ----------
+        file_handle : BinaryIO
+        buffer_size : int
+
+        Returns
+        -------
+        None
+        """
+
+        await run_in_executor(self.executor, self.upload.write_file, file_handle, buffer_size)
+
+    async def commit(self):
+        """
+        function commits the uploaded data.
+
+        Returns
+        -------
+        None
+        """
+
+        await run_in_executor(self.executor, self.upload.commit)
+
+    async def abort(self):
+        """
+        function aborts an ongoing upload.
+
+        Returns
+        -------
+        None
+        """
+
+        await run_in_executor(self.executor, self.upload.abort)
+
+    async def set_custom_metadata(self, custom_metadata: CustomMetadata = None):
+        """
+        function to set custom meta information while uploading data
+
+        Parameters
+        ----------
+        custom_metadata : CustomMetadata
+
+        Returns
+        -------
+        None
+        """
+
+        await run_in_executor(self.executor, self.upload.set_custom_metadata, custom_metadata)
+
+    async def info(self):
+        """
+        function returns the last information about the uploaded object.
+
+        Returns
+        -------
+        Object
+        """
+
+        return await run_in_executor(self.executor, self.upload.info)
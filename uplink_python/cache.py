@@ -0,0 +1,152 @@
+"""Module with MetadataCache class, caching stat results of a project"""
+import collections
+import threading
+import time
+
+# key of the invalidations of a whole bucket
+_WHOLE_BUCKET = object()
+
+
+class MetadataCache:
+    """
+    MetadataCache is a size bounded, least recently used cache of Object and Bucket results,
+    each valid for ttl seconds. It is safe to use from several threads.
+
+    A result fetched while its key is invalidated must not be stored, it may predate the
+    change invalidating it. Fetches take a generation before they start and pass it to put,
+    which drops the result when the key was invalidated since.
+
+    ...
+
+    Attributes
+    ----------
+    max_entries : int
+        number of results kept, the least recently used one is evicted beyond it.
+    ttl : float
+        seconds a result is served from the cache after it was stored.
+    hits : int
+    misses : int
+    evictions : int
+
+    Methods
+    -------
+    get():
+        Object, Bucket or None
+    generation():
+        int
+    put():
+        None
+    invalidate():
+        None
+    invalidate_bucket():
+        None
+    clear():
+        None
+    get_dict():
+        converts python class object to python dictionary
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl: float = 60.0):
+        """Constructs all the necessary attributes for the MetadataCache object."""
+
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = collections.OrderedDict()
+        # generation of the last invalidation of keys, bounded like the entries, generations
+        # before floor are treated as invalidated
+        self._generation = 0
+        self._invalidated = collections.OrderedDict()
+        self._floor = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, bucket_name: str, storj_path: str = None):
+        """
+        function returns the cached Object at the key, or the cached Bucket when storj_path
+        is None, and None when it is not cached or expired.
+        """
+
+        key = (bucket_name, storj_path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self._entries[key]
+            self.misses += 1
+        return None
+
+    def generation(self):
+        """
+        function returns the current generation, taken before fetching a result to put.
+        """
+
+        with self._lock:
+            return self._generation
+
+    def put(self, bucket_name: str, storj_path, value, generation: int = None):
+        """
+        function stores an Object at the key, or a Bucket when storj_path is None. Given the
+        generation taken before the value was fetched, the value is not stored when the key
+        was invalidated since.
+        """
+
+        key = (bucket_name, storj_path)
+        with self._lock:
+            if generation is not None and \
+                    (generation < self._floor or
+                     self._invalidated.get(key, 0) > generation or
+                     self._invalidated.get((bucket_name, _WHOLE_BUCKET), 0) > generation):
+                return
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, bucket_name: str, storj_path: str = None):
+        """function drops the cached Object at the key, or the Bucket when storj_path is None."""
+
+        with self._lock:
+            self._entries.pop((bucket_name, storj_path), None)
+            self._invalidate((bucket_name, storj_path))
+
+    def invalidate_bucket(self, bucket_name: str):
+        """function drops the cached Bucket and all the cached Objects of the bucket."""
+
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == bucket_name]:
+                del self._entries[key]
+            self._invalidate((bucket_name, _WHOLE_BUCKET))
+
+    def clear(self):
+        """function drops all the cached results, counters are kept."""
+
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+            self._floor = self._generation
+
+    def _invalidate(self, key):
+        """records the invalidation of a key in a new generation, the lock being held."""
+
+        self._generation += 1
+        self._invalidated[key] = self._generation
+        self._invalidated.move_to_end(key)
+        while len(self._invalidated) > self.max_entries:
+            _, generation = self._invalidated.popitem(last=False)
+            self._floor = max(self._floor, generation)
+
+    def get_dict(self):
+        """Converts python class object to python dictionary"""
+
+        return {"entries": len(self._entries), "max_entries": self.max_entries,
+                "ttl": self.ttl, "hits": self.hits, "misses": self.misses,
+                "evictions": self.evictions}
@@ -0,0 +1,119 @@
+"""Module with Compression class and the codecs of compressed uploads and downloads"""
+import zlib
+
+try:
+    import zstandard
+except ImportError:
+    # zstd is optional, only zlib of the standard library is always available
+    zstandard = None
+
+# names of the codecs available, zstd needs the zstandard package
+CODECS = ("zlib", "zstd") if zstandard is not None else ("zlib",)
+# levels used when none is given, the default ones of zlib and zstd
+DEFAULT_LEVELS = {"zlib": 6, "zstd": 3}
+
+
+class Compression:
+    """
+    Compression selects the codec data is compressed with while it is uploaded, as data is
+    written, so memory use does not depend on the size of the object.
+
+    The codec is recorded in custom metadata, and downloads of the whole object decompress
+    it transparently.
+
+    ...
+
+    Attributes
+    ----------
+    codec : str
+        "zlib", or "zstd" when the zstandard package is installed.
+    level : int
+        compression level of the codec, its default one when None.
+
+    Methods
+    -------
+    compressor():
+        compression object
+    """
+
+    def __init__(self, codec: str = "zlib", level: int = None):
+        """Constructs all the necessary attributes for the Compression object."""
+
+        if codec not in CODECS:
+            raise ValueError("compression codec {!r} is not available, use one of {}"
+                             .format(codec, ", ".join(CODECS)))
+        self.codec = codec
+        self.level = DEFAULT_LEVELS[codec] if level is None else level
+
+    def compressor(self):
+        """
+        function returns a new compression object, whose compress(data) returns the
+        compressed data available so far and flush() the rest.
+
+        Returns
+        -------
+        compression object
+        """
+
+        if self.codec == "zstd":
+            return zstandard.ZstdCompressor(level=self.level).compressobj()
+        return zlib.compressobj(self.level)
+
+
+class _ZlibReader:
+    """
+    Reader decompressing zlib data read through read_stored(buffer), which returns the
+    number of bytes read into buffer, 0 at the end. At most buffer_size compressed bytes
+    and len(buffer) decompressed bytes are held at a time.
+    """
+
+    def __init__(self, read_stored, buffer_size: int):
+        self._read_stored = read_stored
+        self._decompressor = zlib.decompressobj()
+        self._input = bytearray(buffer_size)
+        self._pending = b""
+        self._end = False
+
+    def readinto(self, buffer):
+        """decompresses up to len(buffer) bytes into buffer, returning 0 at the end."""
+
+        with memoryview(buffer) as view, view.cast('B') as output:
+            while output.nbytes and not self._decompressor.eof:
+                if not self._pending and not self._end:
+                    bytes_read = self._read_stored(self._input)
+                    self._pending = memoryview(self._input)[:bytes_read]
+                    self._end = not bytes_read
+                data = self._decompressor.decompress(self._pending, output.nbytes)
+                self._pending = self._decompressor.unconsumed_tail
+                if data:
+                    output[:len(data)] = data
+                    return len(data)
+                if self._end and not self._pending and not self._decompressor.eof:
+                    raise zlib.error("compressed object is truncated")
+            return 0
+
+
+class _StoredReader:
+    """file-like adapter of read_stored(buffer), the source of the zstandard reader."""
+
+    def __init__(self, read_stored):
+        self._read_stored = read_stored
+
+    def read(self, size: int = -1):
+        buffer = bytearray(size if size >= 0 else 1024 * 1024)
+        return bytes(buffer[:self._read_stored(buffer)])
+
+
+def _decompressing_reader(codec: str, read_stored, buffer_size: int):
+    """
+    Returns a reader with a readinto(buffer) method decompressing the data of codec read
+    through read_stored(buffer).
+    """
+
+    if codec == "zlib":
+        return _ZlibReader(read_stored, buffer_size)
+    if codec == "zstd" and zstandard is not None:
+        return zstandard.ZstdDecompressor().stream_reader(_StoredReader(read_stored),
+                                                          read_size=buffer_size,
+                                                          read_across_frames=True)
+    raise ValueError("object is compressed with {!r}, which is not available".format(codec))
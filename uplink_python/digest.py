@@ -0,0 +1,233 @@
+"""Module with DigestIndex class, a local index of the SHA-256 digests of files, and the
+checksums computed inline by uploads and downloads"""
+import hashlib
+import json
+import os
+import threading
+import zlib
+
+from uplink_python.module_classes import METADATA_SHA256, METADATA_CRC32C, METADATA_CRC32
+
+try:
+    import crc32c
+except ImportError:
+    # CRC32C is optional, CRC32 of zlib and SHA-256 are always available
+    crc32c = None
+
+_WINDOWS = os.name == 'nt'
+COPY_BUFSIZE = 1024 * 1024 if _WINDOWS else 64 * 1024
+# names of the checksums available, crc32c needs the crc32c package
+CHECKSUMS = ("sha256", "crc32", "crc32c") if crc32c is not None else ("sha256", "crc32")
+# custom metadata entry each checksum is recorded in
+CHECKSUM_METADATA = {"sha256": METADATA_SHA256, "crc32": METADATA_CRC32,
+                     "crc32c": METADATA_CRC32C}
+
+
+def file_sha256(path: str):
+    """Returns the hex SHA-256 digest of the content of the file at path."""
+
+    digest = hashlib.sha256()
+    buf = bytearray(COPY_BUFSIZE)
+    with open(path, 'rb') as file_handle, memoryview(buf) as view:
+        while True:
+            bytes_read = file_handle.readinto(view)
+            if not bytes_read:
+                return digest.hexdigest()
+            digest.update(view[:bytes_read])
+
+
+class DigestIndex:
+    """
+    DigestIndex remembers the SHA-256 digest of files by path, along with their size and
+    modification time, so a file left unchanged is not hashed again.
+
+    The index is kept in memory, and loaded from and saved to a JSON file when given a path.
+    It can be shared by threads.
+
+    ...
+
+    Attributes
+    ----------
+    path : str
+        JSON file the index is loaded from and saved to, None to keep it in memory only.
+    hits : int
+        number of digests found for unchanged files.
+    misses : int
+        number of files missing from the index or changed since indexed.
+
+    Methods
+    -------
+    get():
+        str
+    put():
+        None
+    digest():
+        str
+    save():
+        None
+    """
+
+    def __init__(self, path: str = None):
+        """Constructs all the necessary attributes for the DigestIndex object."""
+
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries = dict()
+        self._lock = threading.Lock()
+        if path is not None and os.path.exists(path):
+            with open(path, 'r') as file_handle:
+                self._entries = {file_path: tuple(entry)
+                                 for file_path, entry in json.load(file_handle).items()}
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, file_path: str, file_stat: os.stat_result = None):
+        """
+        function returns the indexed digest of a file, None if it is not indexed or its size
+        or modification time changed since.
+
+        Parameters
+        ----------
+        file_path : str
+        file_stat : os.stat_result (optional)
+            current stat of the file, taken when not given.
+
+        Returns
+        -------
+        str
+        """
+
+        file_stat = file_stat or os.stat(file_path)
+        with self._lock:
+            entry = self._entries.get(os.path.abspath(file_path))
+            if entry is None or entry[:2] != (file_stat.st_size, file_stat.st_mtime_ns):
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry[2]
+
+    def put(self, file_path: str, file_stat: os.stat_result, digest: str):
+        """
+        function records the digest of a file as of the given stat.
+
+        Parameters
+        ----------
+        file_path : str
+        file_stat : os.stat_result
+        digest : str
+
+        Returns
+        -------
+        None
+        """
+
+        with self._lock:
+            self._entries[os.path.abspath(file_path)] = (file_stat.st_size,
+                                                         file_stat.st_mtime_ns, digest)
+
+    def digest(self, file_path: str, file_stat: os.stat_result = None):
+        """
+        function returns the digest of a file from the index, hashing and indexing the file
+        when it is not indexed or changed.
+
+        Parameters
+        ----------
+        file_path : str
+        file_stat : os.stat_result (optional)
+
+        Returns
+        -------
+        str
+        """
+
+        file_stat = file_stat or os.stat(file_path)
+        digest = self.get(file_path, file_stat)
+        if digest is None:
+            digest = file_sha256(file_path)
+            self.put(file_path, file_stat, digest)
+        return digest
+
+    def save(self):
+        """
+        function writes the index to its JSON file, replacing the previous one atomically.
+
+        Returns
+        -------
+        None
+        """
+
+        if self.path is None:
+            return
+        with self._lock:
+            entries = dict(self._entries)
+        temporary_path = self.path + ".tmp"
+        with open(temporary_path, 'w') as file_handle:
+            json.dump(entries, file_handle)
+        os.replace(temporary_path, self.path)
+
+
+class _Crc:
+    """hashlib like interface to a CRC function of (data, value)."""
+
+    def __init__(self, function):
+        self._function = function
+        self._value = 0
+
+    def update(self, data):
+        self._value = self._function(data, self._value)
+
+    def hexdigest(self):
+        return "{:08x}".format(self._value)
+
+
+class _Checksums:
+    """
+    Checksums of a stream of data, updated with every chunk on the buffer it is transferred
+    from or into, so the data is not read twice.
+    """
+
+    def __init__(self, names):
+        for name in names:
+            if name not in CHECKSUMS:
+                raise ValueError("checksum {!r} is not available, use some of {}"
+                                 .format(name, ", ".join(CHECKSUMS)))
+        self._hashes = dict()
+        for name in names:
+            if name == "sha256":
+                self._hashes[name] = hashlib.sha256()
+            elif name == "crc32":
+                self._hashes[name] = _Crc(zlib.crc32)
+            else:
+                self._hashes[name] = _Crc(crc32c.crc32c)
+
+    @classmethod
+    def recorded(cls, mapping):
+        """
+        Returns the checksums of the available names recorded in a custom metadata mapping,
+        and their recorded values by name, None when there are none.
+        """
+
+        expected = {name: mapping[key] for name, key in CHECKSUM_METADATA.items()
+                    if key in mapping and name in CHECKSUMS}
+        if not expected:
+            return None, None
+        return cls(expected), expected
+
+    def update(self, data):
+        """adds a chunk of data to every checksum."""
+
+        for checksum in self._hashes.values():
+            checksum.update(data)
+
+    def hexdigests(self):
+        """returns the hex value of every checksum of the data so far, by name."""
+
+        return {name: checksum.hexdigest() for name, checksum in self._hashes.items()}
+
+    def metadata(self):
+        """returns the custom metadata entries recording the checksums of the data so far."""
+
+        return {CHECKSUM_METADATA[name]: value for name, value in self.hexdigests().items()}
@@ -1,20 +1,116 @@
 """Module with Download class and dowload methods to work with object download"""
 # pylint: disable=too-many-arguments
 import ctypes
+import io
 import os
+import threading
+import time
+import weakref
 
-from uplink_python.module_def import _DownloadStruct, _ReadResult, _ProjectStruct,\
-    _ObjectResult, _Error
-from uplink_python.errors import _storj_exception
+from uplink_python.module_classes import DownloadOptions, METADATA_COMPRESSION
+from uplink_python.errors import _storj_exception, ChecksumMismatchError, ERROR_EOF
+from uplink_python.compression import _decompressing_reader
+from uplink_python.digest import _Checksums
 
 _WINDOWS = os.name == 'nt'
 COPY_BUFSIZE = 1024 * 1024 if _WINDOWS else 64 * 1024
+# default size of the ranged downloads of a parallel download, and of the reads within one
+SEGMENT_SIZE = 64 * 1024 * 1024
+SEGMENT_BUFSIZE = 1024 * 1024
+# serializes seek and write where os.pwrite is not available
+_SEEK_LOCK = threading.Lock()
+
+
+def _preallocate(fd, size):
+    """
+    Sizes the file of descriptor fd to size bytes, reserving its blocks up front with
+    posix_fallocate where the platform and file system support it.
+    """
+
+    if size and hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(fd, 0, size)
+            return
+        except OSError:
+            pass
+    os.ftruncate(fd, size)
+
+
+def _pwrite(fd, data, offset):
+    """Writes all of data to the file of descriptor fd at offset, leaving its position as is."""
+
+    with memoryview(data) as view:
+        while view:
+            if hasattr(os, "pwrite"):
+                written = os.pwrite(fd, view, offset)
+            else:
+                with _SEEK_LOCK:
+                    os.lseek(fd, offset, os.SEEK_SET)
+                    written = os.write(fd, view)
+            view = view[written:]
+            offset += written
+
+
+class _BufferPool:
+    """
+    Bounded pool of reusable bytearrays, shared by all downloads to read into.
+
+    ...
+
+    Attributes
+    ----------
+    max_buffers : int
+        number of released buffers kept for reuse, further ones are left to be freed.
+
+    Methods
+    -------
+    acquire():
+        bytearray
+    release():
+        None
+    """
+
+    def __init__(self, max_buffers: int = 16):
+        """Constructs all the necessary attributes for the _BufferPool object."""
+
+        self.max_buffers = max_buffers
+        self._buffers = list()
+        self._lock = threading.Lock()
+
+    def acquire(self, size: int):
+        """function returns a buffer of at least size bytes, reused when one is available."""
+
+        with self._lock:
+            for i, buffer in enumerate(self._buffers):
+                if len(buffer) >= size:
+                    return self._buffers.pop(i)
+        return bytearray(size)
+
+    def release(self, buffer: bytearray):
+        """function returns a buffer acquired from the pool back to it."""
+
+        with self._lock:
+            if len(self._buffers) < self.max_buffers:
+                self._buffers.append(buffer)
+
+
+_READ_BUFFERS = _BufferPool()
 
 
 class Download:
     """
     Download is a download from Storj Network.
 
+    A Download must be used by one thread at a time, distinct downloads can be read from
+    many threads concurrently.
+
+    With decompress, an object uploaded with compression is decompressed as it is read,
+    chunk by chunk. Its file_size and info are those of the object as stored.
+    With verify, the checksums recorded by an upload are computed on the buffers read into
+    and compared at the end of the object, raising ChecksumMismatchError on a difference.
+    With retry, a read failing with a retryable error closes the native download and opens
+    it again through reopen, from the last byte read.
+
     ...
 
     Attributes
@@ -29,11 +125,21 @@ class Download:
         bucket_name to which upload is being processed
     storj_path : Str
         storj_path on which upload is to be done
+    decompress : bool
+        whether an object uploaded with compression is decompressed, False by default.
+    verify : bool
+        whether the checksums recorded by the upload are verified, False by default.
+    retry : RetryPolicy
+        policy retrying failed reads, None by default.
 
     Methods
     -------
-    read():
+    readinto():
         Int
+    checksums():
+        dict
+    read():
+        bytes, Int
     read_file():
         None
     file_size():
@@ -44,7 +150,9 @@ class Download:
         Object
     """
 
-    def __init__(self, download, uplink, project, bucket_name, storj_path):
+    def __init__(self, download, uplink, project, bucket_name, storj_path,
+                 download_result=None, decompress: bool = False, verify: bool = False,
+                 retry=None, reopen=None):
         """Constructs all the necessary attributes for the Download object."""
 
         self.download = download
@@ -52,51 +160,207 @@ class Download:
         self.bucket_name = bucket_name
         self.storj_path = storj_path
         self.uplink = uplink
+        self.decompress = decompress
+        self.verify = verify
+        self.retry = retry
+        # called with the number of bytes read to open the download again from there,
+        # returns the new download result
+        self._reopen = reopen
+        self._position = 0
+        # whether the native download is open, it is not after a failed read until resumed
+        self._open = True
+        self._closed = False
+        # decompressing reader and checksums, chosen on the first read from custom metadata
+        self._started = False
+        self._reader = None
+        self._checksums = None
+        self._expected = None
+        # information about the object, immutable for the lifetime of the download
+        self._info = None
+        # native download result is freed on close, or when garbage collected if never closed
+        self._finalizer = None
+        if download_result is not None:
+            self._finalizer = weakref.finalize(self,
+                                               uplink.m_libuplink.uplink_free_download_result,
+                                               download_result)
 
-    def read(self, size_to_read: int):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def readinto(self, buffer):
         """
-        function downloads up to len size_to_read bytes from the object's data stream.
-        It returns the data_read in bytes and number of bytes read
+        function downloads up to len(buffer) bytes from the object's data stream directly into
+        buffer, which can be any writable object supporting the buffer protocol (bytearray,
+        memoryview, mmap, array.array, NumPy arrays). No memory is allocated per call.
+        It returns the number of bytes read, 0 at the end of the object.
 
         Parameters
         ----------
-        size_to_read : int
+        buffer : writable bytes-like object
 
         Returns
         -------
-        bytes, int
+        int
         """
-        #
-        # declare types of arguments and response of the corresponding golang function
-        self.uplink.m_libuplink.uplink_download_read.argtypes = [ctypes.POINTER(_DownloadStruct),
-                                                                 ctypes.POINTER(ctypes.c_uint8),
-                                                                 ctypes.c_size_t]
-        self.uplink.m_libuplink.uplink_download_read.restype = _ReadResult
-        #
+
+        self._check_open()
+        if not self._started:
+            self._start()
+        if self._reader is not None:
+            bytes_read = self._reader.readinto(buffer)
+        else:
+            bytes_read = self._readinto(buffer)
+        if self._checksums is not None:
+            with memoryview(buffer) as view, view.cast('B') as data:
+                if bytes_read:
+                    self._checksums.update(data[:bytes_read])
+                elif data.nbytes:
+                    # only an empty read into a non empty buffer is the end of the object
+                    self._verify()
+        return bytes_read
+
+    def checksums(self):
+        """
+        function returns the hex value of the checksums verified, of the data read so far,
+        by name. It is empty unless verify is set and the upload recorded checksums.
+
+        Returns
+        -------
+        dict
+        """
+
+        return dict() if self._checksums is None else self._checksums.hexdigests()
+
+    def _start(self):
+        """chooses how to read the object from its custom metadata, before the first read."""
+
+        self._started = True
+        if not (self.decompress or self.verify):
+            return
+        custom = self.info().custom.get_mapping()
+        codec = custom.get(METADATA_COMPRESSION)
+        if codec is not None and self.decompress:
+            self._reader = _decompressing_reader(codec, self._readinto, COPY_BUFSIZE)
+        # checksums are those of the data uploaded, before compression
+        if self.verify and (codec is None or self._reader is not None):
+            self._checksums, self._expected = _Checksums.recorded(custom)
+
+    def _verify(self):
+        """compares the checksums of the data read with the recorded ones, once."""
+
+        # cleared first, so a mismatch is raised once and a later read at the end does not
+        # compare again
+        expected, self._expected = self._expected, None
+        if not expected:
+            return
+        key = self.storj_path
+        if isinstance(key, ctypes.c_char_p):
+            key = key.value.decode("utf-8")
+        for name, value in self._checksums.hexdigests().items():
+            if value != expected[name]:
+                raise ChecksumMismatchError("{}: {} expected {}, got {}".format(
+                    key, name, expected[name], value))
+
+    def _readinto(self, buffer):
+        """reads the data of the object as stored into buffer, resuming it on retries."""
+
+        if self.retry is None or self._reopen is None:
+            bytes_read = self._read_native(buffer)
+            self._position += bytes_read
+            return bytes_read
+        start, attempt = time.monotonic(), 0
+        while True:
+            try:
+                if not self._open:
+                    self._resume()
+                bytes_read = self._read_native(buffer)
+                self._position += bytes_read
+                return bytes_read
+            except self.retry.retryable as exception:
+                attempt += 1
+                if not self.retry.retry(exception, attempt, start):
+                    raise
+                self._drop()
+
+    def _drop(self):
+        """closes and frees the native download after a failure, ignoring its errors."""
+
+        if self._open:
+            self._open = False
+            error = self.uplink.m_libuplink.uplink_close_download(self.download)
+            if bool(error):
+                self.uplink.m_libuplink.uplink_free_error(error)
+            if self._finalizer is not None:
+                self._finalizer()
+            self.download = None
+
+    def _check_open(self):
+        """raises ValueError once the download is closed."""
+
+        if self._closed:
+            raise ValueError("download is closed")
+
+    def _resume(self):
+        """opens the native download again from the last byte read."""
+
+        download_result = self._reopen(self._position)
+        self.download = download_result.download
+        self._finalizer = weakref.finalize(self,
+                                           self.uplink.m_libuplink.uplink_free_download_result,
+                                           download_result)
+        self._open = True
+
+    def _read_native(self, buffer):
+        """reads the data of the object as stored into buffer through libuplinkc."""
+
         # prepare the inputs for the function
-        data_size = ctypes.c_int32(size_to_read)
-        data_to_write = [0]
-        data_to_write = (ctypes.c_uint8 * data_size.value)(*data_to_write)
-        data_to_write_ptr = ctypes.cast(data_to_write, ctypes.POINTER(ctypes.c_uint8))
-        size_to_read = ctypes.c_size_t(size_to_read)
+        view = memoryview(buffer)
+        if view.ndim != 1 or view.itemsize != 1:
+            view = view.cast('B')
+        # raises TypeError for read-only buffers
+        data_to_write = (ctypes.c_uint8 * view.nbytes).from_buffer(view)
+        size_to_read = ctypes.c_size_t(view.nbytes)
 
         # read data from Storj by calling the exported golang function
-        read_result = self.uplink.m_libuplink.uplink_download_read(self.download, data_to_write_ptr,
+        read_result = self.uplink.m_libuplink.uplink_download_read(self.download, data_to_write,
                                                                    size_to_read)
         #
         # if error occurred
         if bool(read_result.error):
-            raise _storj_exception(read_result.error.contents.code,
-                                   read_result.error.contents.message.decode("utf-8"))
+            exception = None
+            if read_result.error.contents.code != ERROR_EOF:
+                exception = _storj_exception(read_result.error.contents.code,
+                                             read_result.error.contents.message.decode("utf-8"))
+            self.uplink.m_libuplink.uplink_free_read_result(read_result)
+            if exception is not None:
+                raise exception
+        return int(read_result.bytes_read)
 
-        data_read = bytes()
-        if int(read_result.bytes_read) != 0:
-            #
-            # --------------------------------------------
-            # data conversion to type python readable form
-            # conversion of LP_c_ubyte to python readable data variable
-            data_read = ctypes.string_at(data_to_write_ptr, int(read_result.bytes_read))
-        return data_read, int(read_result.bytes_read)
+    def read(self, size_to_read: int):
+        """
+        function downloads up to len size_to_read bytes from the object's data stream.
+        It returns the data_read in bytes and number of bytes read, 0 at the end of the object.
+
+        Parameters
+        ----------
+        size_to_read : int
+
+        Returns
+        -------
+        bytes, int
+        """
+
+        buffer = _READ_BUFFERS.acquire(size_to_read)
+        try:
+            with memoryview(buffer) as view:
+                bytes_read = self.readinto(view[:size_to_read])
+                data_read = bytes(view[:bytes_read])
+        finally:
+            _READ_BUFFERS.release(buffer)
+        return data_read, bytes_read
 
     def read_file(self, file_handle, buffer_size: int = 0):
         """
@@ -119,78 +383,231 @@ class Download:
         """
         if not buffer_size:
             buffer_size = COPY_BUFSIZE
-        file_size = self.file_size()
-        if buffer_size > file_size:
-            buffer_size = file_size
-        while file_size:
-            buf, bytes_read = self.read(buffer_size)
-            if buf:
-                file_handle.write(buf)
-            file_size -= bytes_read
+        #
+        # read into one pooled buffer, which is written out without copying, until the end of
+        # the object, the size does not need to be known up front
+        buffer = _READ_BUFFERS.acquire(buffer_size)
+        try:
+            with memoryview(buffer) as view:
+                while True:
+                    bytes_read = self.readinto(view[:buffer_size])
+                    if not bytes_read:
+                        break
+                    file_handle.write(view[:bytes_read])
+        finally:
+            _READ_BUFFERS.release(buffer)
 
     def file_size(self):
         """
         function returns the size of object on Storj network for which download has been created.
+        It is taken from the download's own info, without a separate stat of the object.
 
         Returns
         -------
         int
         """
 
-        # declare types of arguments and response of the corresponding golang function
-        self.uplink.m_libuplink.uplink_stat_object.argtypes = [ctypes.POINTER(_ProjectStruct),
-                                                               ctypes.c_char_p, ctypes.c_char_p]
-        self.uplink.m_libuplink.uplink_stat_object.restype = _ObjectResult
-        #
-        # get object information by calling the exported golang function
-        object_result = self.uplink.m_libuplink.uplink_stat_object(self.project, self.bucket_name,
-                                                                   self.storj_path)
-        # if error occurred
-        if bool(object_result.error):
-            raise _storj_exception(object_result.error.contents.code,
-                                   object_result.error.contents.message.decode("utf-8"))
-        # find object size
-        return int(object_result.object.contents.system.content_length)
+        return int(self.info().system.content_length)
 
     def close(self):
         """
-        function closes the download.
+        function closes the download, it can't be read afterwards and closing it again does
+        nothing.
 
         Returns
         -------
         None
         """
-        #
-        # declare types of arguments and response of the corresponding golang function
-        self.uplink.m_libuplink.uplink_close_download.argtypes = [ctypes.POINTER(_DownloadStruct)]
-        self.uplink.m_libuplink.uplink_close_download.restype = ctypes.POINTER(_Error)
-        #
+        if self._closed:
+            return
+        self._closed = True
+        if not self._open:
+            # native download already closed after a failed read which could not be resumed
+            return
+        self._open = False
         # close downloader by calling the exported golang function
         error = self.uplink.m_libuplink.uplink_close_download(self.download)
+        if self._finalizer is not None:
+            self._finalizer()
+        self.download = None
         #
         # if error occurred
         if bool(error):
-            raise _storj_exception(error.contents.code,
-                                   error.contents.message.decode("utf-8"))
+            exception = _storj_exception(error.contents.code,
+                                         error.contents.message.decode("utf-8"))
+            self.uplink.m_libuplink.uplink_free_error(error)
+            raise exception
 
     def info(self):
         """
-        function returns information about the downloaded object.
+        function returns information about the downloaded object, fetched once and cached.
 
         Returns
         -------
         Object
         """
-        #
-        # declare types of arguments and response of the corresponding golang function
-        self.uplink.m_libuplink.uplink_download_info.argtypes = [ctypes.POINTER(_DownloadStruct)]
-        self.uplink.m_libuplink.uplink_download_info.restype = _ObjectResult
-        #
+        self._check_open()
+        if self._info is not None:
+            return self._info
         # get last download info by calling the exported golang function
         object_result = self.uplink.m_libuplink.uplink_download_info(self.download)
-        #
-        # if error occurred
-        if bool(object_result.error):
-            raise _storj_exception(object_result.error.contents.code,
-                                   object_result.error.contents.message.decode("utf-8"))
-        return self.uplink.object_from_result(object_result.object)
+        try:
+            #
+            # if error occurred
+            if bool(object_result.error):
+                raise _storj_exception(object_result.error.contents.code,
+                                       object_result.error.contents.message.decode("utf-8"))
+            self._info = self.uplink.object_from_result(object_result.object)
+            return self._info
+        finally:
+            self.uplink.m_libuplink.uplink_free_object_result(object_result)
+
+
+class DownloadStream(io.RawIOBase):
+    """
+    DownloadStream is a seekable, read-only raw stream over an object on Storj Network.
+
+    It can be passed to anything expecting a binary file object (shutil.copyfileobj, tarfile,
+    zipfile, gzip, pandas, pyarrow), and is best wrapped in io.BufferedReader.
+    Seeking closes the current download and lazily opens a ranged download at the new
+    position on the next read. The object is read as stored, compressed objects are not
+    decompressed.
+
+    ...
+
+    Attributes
+    ----------
+    project : Project
+        project object used to open downloads
+    bucket_name : Str
+        bucket_name of the object
+    storj_path : Str
+        storj_path of the object
+
+    Methods
+    -------
+    readinto():
+        Int
+    seek():
+        Int
+    tell():
+        Int
+    close():
+        None
+    """
+
+    def __init__(self, project, bucket_name: str, storj_path: str):
+        """Constructs all the necessary attributes for the DownloadStream object."""
+
+        super().__init__()
+        self.project = project
+        self.bucket_name = bucket_name
+        self.storj_path = storj_path
+        self._download = None
+        self._position = 0
+        self._size = None
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def size(self):
+        """
+        function returns the size of the object, fetched once and cached.
+
+        Returns
+        -------
+        int
+        """
+
+        if self._size is None:
+            if self._download is not None:
+                object_ = self._download.info()
+            else:
+                object_ = self.project.stat_object(self.bucket_name, self.storj_path)
+            self._size = int(object_.system.content_length)
+        return self._size
+
+    def readinto(self, buffer):
+        """
+        function downloads up to len(buffer) bytes at the current position into buffer.
+        It returns the number of bytes read, 0 at the end of the object.
+
+        Parameters
+        ----------
+        buffer : writable bytes-like object
+
+        Returns
+        -------
+        int
+        """
+
+        self._checkClosed()
+        if self._download is None:
+            if self._position and self._position >= self.size():
+                return 0
+            self._download = self.project.download_object(
+                self.bucket_name, self.storj_path,
+                DownloadOptions(self._position, -1) if self._position else None, False)
+        bytes_read = self._download.readinto(buffer)
+        self._position += bytes_read
+        return bytes_read
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET):
+        """
+        function changes the stream position to offset, relative to whence.
+
+        Parameters
+        ----------
+        offset : int
+        whence : int
+            io.SEEK_SET, io.SEEK_CUR or io.SEEK_END
+
+        Returns
+        -------
+        int
+        """
+
+        self._checkClosed()
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self.size() + offset
+        else:
+            raise ValueError("invalid whence ({}, should be 0, 1 or 2)".format(whence))
+        if position < 0:
+            raise ValueError("negative seek position {}".format(position))
+        if position != self._position:
+            self._close_download()
+            self._position = position
+        return self._position
+
+    def tell(self):
+        self._checkClosed()
+        return self._position
+
+    def close(self):
+        """
+        function closes the current download and the stream.
+
+        Returns
+        -------
+        None
+        """
+
+        if not self.closed:
+            try:
+                self._close_download()
+            finally:
+                super().close()
+
+    def _close_download(self):
+        """closes the current download, the next read opens a new one."""
+
+        if self._download is not None:
+            download, self._download = self._download, None
+            download.close()
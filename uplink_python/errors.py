@@ -1,5 +1,7 @@
 """Python user-defined exceptions for uplink errors"""
 
+ERROR_EOF = -1
+
 ERROR_INTERNAL = 0x02
 ERROR_CANCELED = 0x03
 ERROR_INVALID_HANDLE = 0x04
@@ -14,6 +16,8 @@ ERROR_BUCKET_NOT_FOUND = 0x13
 ERROR_OBJECT_KEY_INVALID = 0x20
 ERROR_OBJECT_NOT_FOUND = 0x21
 ERROR_UPLOAD_DONE = 0x22
+ERROR_CHECKSUM_MISMATCH = 0x9997
+ERROR_POOL_TIMEOUT = 0x9998
 ERROR_LIBUPLINK_SO_NOT_FOUND = 0x9999
 """_Error defines"""
 
@@ -184,6 +188,28 @@ class LibUplinkSoError(StorjException):
                          "to build libuplinkc.so manually.")
 
 
+class PoolTimeoutError(StorjException):
+    """Exception raised if no project of a ProjectPool became available in time.
+
+    Attributes:
+        details -- pool size and timeout
+    """
+
+    def __init__(self, details):
+        super().__init__("project pool checkout timed out", ERROR_POOL_TIMEOUT, details)
+
+
+class ChecksumMismatchError(StorjException):
+    """Exception raised if the data downloaded does not match the checksum of the object.
+
+    Attributes:
+        details -- key, checksum, expected and actual values
+    """
+
+    def __init__(self, details):
+        super().__init__("checksum mismatch", ERROR_CHECKSUM_MISMATCH, details)
+
+
 def _storj_exception(code, details):
     switcher = {
         ERROR_INTERNAL: InternalError,
@@ -59,19 +59,8 @@ if __name__ == "__main__":
         except BucketNotEmptyError as exception:
             print("Error while deleting bucket: ", exception.message)
             print("Deleting object's inside bucket and try to delete bucket again...")
-            # list objects in given bucket recursively using ListObjectsOptions
-            print("Listing and deleting object's inside bucket...")
-            objects_list = project.list_objects(MY_BUCKET, ListObjectsOptions(recursive=True))
-            # iterate through all objects path
-            for obj in objects_list:
-                # delete selected object
-                print("Deleting '" + obj.key)
-                _ = project.delete_object(MY_BUCKET, obj.key)
-            print("Delete all objects inside the bucket : COMPLETE!")
-
-            # try to delete given bucket
-            print("Deleting '" + MY_BUCKET + "' bucket...")
-            _ = project.delete_bucket(MY_BUCKET)
+            # force deletes all objects inside the bucket concurrently, then the bucket
+            _ = project.delete_bucket(MY_BUCKET, force=True)
             print("Desired bucket: DELETED")
         except BucketNotFoundError as exception:
             print("Desired bucket delete error: ", exception.message)
@@ -0,0 +1,608 @@
+# pylint: disable=too-many-public-methods, unused-argument, protected-access
+"""Module with LocalLibrary, an in-process stand-in for libuplinkc keeping objects in memory"""
+import ctypes
+import functools
+import itertools
+import json
+import threading
+import time
+
+from uplink_python.errors import ERROR_EOF, ERROR_INTERNAL, ERROR_BUCKET_NOT_FOUND,\
+    ERROR_OBJECT_NOT_FOUND, ERROR_BUCKET_ALREADY_EXISTS, ERROR_BUCKET_NOT_EMPTY
+from uplink_python.module_def import _FUNCTION_SIGNATURES, _Error, _AccessStruct,\
+    _AccessResult, _StringResult, _EncryptionKeyStruct, _EncryptionKeyResult, _ProjectStruct,\
+    _ProjectResult, _BucketStruct, _BucketResult, _ObjectStruct, _ObjectResult,\
+    _SystemMetadataStruct, _UploadStruct, _UploadResult, _DownloadStruct, _DownloadResult,\
+    _WriteResult, _ReadResult, _BucketIterator, _ObjectIterator, _CustomMetadataStruct,\
+    _CustomMetadataEntryStruct, _UploadInfoStruct, _UploadInfoResult, _PartUploadStruct,\
+    _PartUploadResult, _CommitUploadResult
+
+_ACCESS_PREFIX = "local:"
+
+
+def _remote(function):
+    """
+    Decorates a LocalLibrary function standing in for a network call of libuplinkc: the call
+    is delayed by the latency of the library, and returns the next error injected for it
+    instead of running.
+    """
+
+    restype = _FUNCTION_SIGNATURES[function.__name__][1]
+
+    @functools.wraps(function)
+    def wrapper(self, *args):
+        self._round_trip()
+        error = self._injected(function.__name__)
+        if error is None:
+            return function(self, *args)
+        if restype is ctypes.POINTER(_Error):
+            return error
+        result = restype()
+        result.error = error
+        return result
+    return wrapper
+
+
+class LocalLibrary:
+    """
+    LocalLibrary implements the uplink_* functions of libuplinkc in process, on top of
+    dictionaries, for running the binding offline: Uplink(LocalLibrary()) behaves as an
+    Uplink talking to an empty satellite of its own.
+
+    Network bound calls are delayed by latency seconds, and reads and writes additionally
+    throttled to bandwidth bytes per second. Both sleep without holding the GIL, as the
+    calls of libuplinkc do. Errors are injected with fail. Every pointer handed out is
+    recorded in allocated until the matching uplink_free_* function releases it, so memory
+    leaks of the binding can be asserted.
+
+    ...
+
+    Attributes
+    ----------
+    buckets : dict
+        objects of every bucket by name, as dicts of (data, custom metadata, created) by key
+    uploads : dict
+        multipart uploads begun and neither committed nor aborted, by upload id
+    latency : float
+        seconds every network bound call is delayed by, 0 by default
+    bandwidth : int
+        bytes per second reads and writes are throttled to, 0 for unlimited by default
+    allocated : dict
+        structures handed out and not freed yet, by address
+    allocations : int
+        number of structures handed out
+    frees : int
+        number of structures freed
+
+    Methods
+    -------
+    fail():
+        None
+    """
+
+    def __init__(self, latency: float = 0.0, bandwidth: int = 0):
+        """Constructs all the necessary attributes for the LocalLibrary object."""
+
+        self.buckets = dict()
+        self.uploads = dict()
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.allocated = dict()
+        self.allocations = 0
+        self.frees = 0
+        self._created = dict()
+        self._failures = dict()
+        self._handles = dict()
+        self._next_handle = itertools.count(1)
+        # functions are called concurrently by threads sharing a project
+        self._lock = threading.Lock()
+
+    def fail(self, function: str, count: int = 1, code: int = ERROR_INTERNAL,
+             message: str = "injected error"):
+        """
+        function makes the next count calls of the named uplink_* function fail with an error
+        of the given code, a count of 0 clears the errors injected for it.
+
+        Parameters
+        ----------
+        function : str
+        count : int
+        code : int
+        message : str
+
+        Returns
+        -------
+        None
+        """
+
+        with self._lock:
+            if count > 0:
+                self._failures[function] = (count, code, message)
+            else:
+                self._failures.pop(function, None)
+
+    # simulation
+
+    def _round_trip(self):
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _transfer(self, size):
+        if self.bandwidth:
+            time.sleep(size / self.bandwidth)
+
+    def _injected(self, function):
+        with self._lock:
+            if function not in self._failures:
+                return None
+            count, code, message = self._failures[function]
+            if count > 1:
+                self._failures[function] = (count - 1, code, message)
+            else:
+                del self._failures[function]
+        return self._error(code, message)
+
+    # allocation tracking
+
+    def _malloc(self, struct):
+        with self._lock:
+            self.allocated[ctypes.addressof(struct)] = struct
+            self.allocations += 1
+        return ctypes.pointer(struct)
+
+    def _free(self, pointer):
+        if not pointer:
+            return
+        address = ctypes.addressof(pointer.contents)
+        with self._lock:
+            struct = self.allocated.pop(address, None)
+            if struct is None:
+                raise AssertionError("double free or free of foreign memory")
+            self.frees += 1
+            # the state of a handle lives as long as the structure pointing to it
+            self._handles.pop(getattr(struct, "_handle", None), None)
+
+    def _handle(self, struct_type, state):
+        handle = next(self._next_handle)
+        self._handles[handle] = state
+        return self._malloc(struct_type(handle))
+
+    def _state(self, pointer):
+        return self._handles[pointer.contents._handle]
+
+    def _error(self, code, message):
+        return self._malloc(_Error(code, message.encode("utf-8")))
+
+    def _object(self, key, entry, is_prefix=False):
+        data, custom, created = entry
+        entries = ctypes.POINTER(_CustomMetadataEntryStruct)()
+        if custom:
+            array = (_CustomMetadataEntryStruct * len(custom))()
+            for i, (name, value) in enumerate(custom.items()):
+                # lengths are those of the encoded key and value, in bytes
+                name, value = name.encode("utf-8"), value.encode("utf-8")
+                array[i] = _CustomMetadataEntryStruct(name, len(name), value, len(value))
+            entries = ctypes.cast(array, ctypes.POINTER(_CustomMetadataEntryStruct))
+        return self._malloc(_ObjectStruct(key.encode("utf-8"), is_prefix,
+                                          _SystemMetadataStruct(created, 0, len(data)),
+                                          _CustomMetadataStruct(entries, len(custom))))
+
+    @staticmethod
+    def _string(pointer):
+        return pointer.value.decode("utf-8")
+
+    @staticmethod
+    def _custom(custom):
+        return {custom.entries[i].key.decode("utf-8"): custom.entries[i].value.decode("utf-8")
+                for i in range(custom.count)}
+
+    @staticmethod
+    def _options(options):
+        return getattr(options, "_obj", None)
+
+    @staticmethod
+    def _no_error():
+        return ctypes.POINTER(_Error)()
+
+    def _lookup(self, bucket, key):
+        if bucket not in self.buckets:
+            return None, self._error(ERROR_BUCKET_NOT_FOUND, bucket)
+        if key not in self.buckets[bucket]:
+            return None, self._error(ERROR_OBJECT_NOT_FOUND, key)
+        return self.buckets[bucket][key], self._no_error()
+
+    # access grant
+
+    def _access_result(self, state):
+        return _AccessResult(self._handle(_AccessStruct, state), self._no_error())
+
+    @_remote
+    def uplink_request_access_with_passphrase(self, satellite, api_key, passphrase):
+        return self._access_result({"satellite": self._string(satellite),
+                                    "api_key": self._string(api_key)})
+
+    def uplink_config_request_access_with_passphrase(self, config, satellite, api_key,
+                                                     passphrase):
+        return self.uplink_request_access_with_passphrase(satellite, api_key, passphrase)
+
+    def uplink_parse_access(self, serialized_access):
+        serialized_access = self._string(serialized_access)
+        if not serialized_access.startswith(_ACCESS_PREFIX):
+            return _AccessResult(ctypes.POINTER(_AccessStruct)(),
+                                 self._error(ERROR_INTERNAL, "invalid access grant format"))
+        return self._access_result(json.loads(serialized_access[len(_ACCESS_PREFIX):]))
+
+    def uplink_access_serialize(self, access):
+        serialized = _ACCESS_PREFIX + json.dumps(self._state(access))
+        return _StringResult(serialized.encode("utf-8"), self._no_error())
+
+    def uplink_access_share(self, access, permission, prefixes, prefixes_count):
+        return self._access_result(dict(self._state(access)))
+
+    def uplink_derive_encryption_key(self, passphrase, salt, length):
+        return _EncryptionKeyResult(self._handle(_EncryptionKeyStruct, None), self._no_error())
+
+    def uplink_access_override_encryption_key(self, access, bucket, prefix, encryption_key):
+        return self._no_error()
+
+    # project
+
+    @_remote
+    def uplink_open_project(self, access):
+        return _ProjectResult(self._handle(_ProjectStruct, None), self._no_error())
+
+    def uplink_config_open_project(self, config, access):
+        return self.uplink_open_project(access)
+
+    def uplink_close_project(self, project):
+        return self._no_error()
+
+    # buckets
+
+    def _bucket_result(self, name, error=None):
+        if error:
+            return _BucketResult(ctypes.POINTER(_BucketStruct)(), error)
+        return _BucketResult(self._malloc(_BucketStruct(name.encode("utf-8"),
+                                                        self._created[name])),
+                             self._no_error())
+
+    @_remote
+    def uplink_create_bucket(self, project, name):
+        name = self._string(name)
+        with self._lock:
+            exists = name in self.buckets
+            if not exists:
+                self.buckets[name] = dict()
+                self._created[name] = int(time.time())
+        if exists:
+            return self._bucket_result(name, self._error(ERROR_BUCKET_ALREADY_EXISTS, name))
+        return self._bucket_result(name)
+
+    @_remote
+    def uplink_ensure_bucket(self, project, name):
+        name = self._string(name)
+        with self._lock:
+            if name not in self.buckets:
+                self.buckets[name] = dict()
+                self._created[name] = int(time.time())
+        return self._bucket_result(name)
+
+    @_remote
+    def uplink_stat_bucket(self, project, name):
+        name = self._string(name)
+        if name not in self.buckets:
+            return self._bucket_result(name, self._error(ERROR_BUCKET_NOT_FOUND, name))
+        return self._bucket_result(name)
+
+    @_remote
+    def uplink_delete_bucket(self, project, name):
+        name = self._string(name)
+        if name not in self.buckets:
+            return self._bucket_result(name, self._error(ERROR_BUCKET_NOT_FOUND, name))
+        if self.buckets[name]:
+            return self._bucket_result(name, self._error(ERROR_BUCKET_NOT_EMPTY, name))
+        result = self._bucket_result(name)
+        with self._lock:
+            del self.buckets[name]
+        return result
+
+    def uplink_list_buckets(self, project, options):
+        self._round_trip()
+        error = self._injected("uplink_list_buckets")
+        with self._lock:
+            names = sorted(self.buckets)
+        options = self._options(options)
+        if options is not None and options.cursor:
+            names = [name for name in names if name > options.cursor.decode("utf-8")]
+        return self._handle(_BucketIterator, {"items": names, "index": -1, "error": error})
+
+    def uplink_bucket_iterator_next(self, iterator):
+        state = self._state(iterator)
+        state["index"] += 1
+        return state["index"] < len(state["items"])
+
+    def uplink_bucket_iterator_item(self, iterator):
+        state = self._state(iterator)
+        name = state["items"][state["index"]]
+        return self._malloc(_BucketStruct(name.encode("utf-8"), self._created.get(name, 0)))
+
+    def uplink_bucket_iterator_err(self, iterator):
+        error = self._state(iterator)["error"]
+        return error if error is not None else self._no_error()
+
+    # objects
+
+    @_remote
+    def uplink_stat_object(self, project, bucket, key):
+        bucket, key = self._string(bucket), self._string(key)
+        entry, error = self._lookup(bucket, key)
+        if entry is None:
+            return _ObjectResult(ctypes.POINTER(_ObjectStruct)(), error)
+        return _ObjectResult(self._object(key, entry), error)
+
+    @_remote
+    def uplink_delete_object(self, project, bucket, key):
+        bucket, key = self._string(bucket), self._string(key)
+        with self._lock:
+            entry = self.buckets.get(bucket, {}).pop(key, None)
+        if entry is None:
+            return _ObjectResult(ctypes.POINTER(_ObjectStruct)(), self._lookup(bucket, key)[1])
+        return _ObjectResult(self._object(key, entry), self._no_error())
+
+    def uplink_list_objects(self, project, bucket, options):
+        self._round_trip()
+        bucket = self._string(bucket)
+        options = self._options(options)
+        prefix = options.prefix.decode("utf-8") if options and options.prefix else ""
+        cursor = options.cursor.decode("utf-8") if options and options.cursor else ""
+        recursive = bool(options and options.recursive)
+        items, error = list(), self._injected("uplink_list_objects")
+        if bucket not in self.buckets:
+            error = self._error(ERROR_BUCKET_NOT_FOUND, bucket)
+        elif error is None:
+            with self._lock:
+                keys = sorted(self.buckets[bucket])
+            for key in keys:
+                if not key.startswith(prefix):
+                    continue
+                # keys below a "/" of the listed prefix collapse into one prefix entry
+                slash = -1 if recursive else key.find("/", len(prefix))
+                item = (key, False) if slash < 0 else (key[:slash + 1], True)
+                if item[0] > cursor and (not items or items[-1] != item):
+                    items.append(item)
+        return self._handle(_ObjectIterator, {"bucket": bucket, "items": items, "index": -1,
+                                              "error": error})
+
+    def uplink_object_iterator_next(self, iterator):
+        error = self._injected("uplink_object_iterator_next")
+        if error is not None:
+            # the listing fails while fetching its next page
+            self._state(iterator)["error"] = error
+            return False
+        return self.uplink_bucket_iterator_next(iterator)
+
+    def uplink_object_iterator_item(self, iterator):
+        state = self._state(iterator)
+        key, is_prefix = state["items"][state["index"]]
+        if is_prefix:
+            return self._object(key, (b"", {}, 0), True)
+        entry = self.buckets[state["bucket"]].get(key, (b"", {}, 0))
+        return self._object(key, entry)
+
+    def uplink_object_iterator_err(self, iterator):
+        return self.uplink_bucket_iterator_err(iterator)
+
+    # upload
+
+    @_remote
+    def uplink_upload_object(self, project, bucket, key, options):
+        bucket, key = self._string(bucket), self._string(key)
+        if bucket not in self.buckets:
+            return _UploadResult(ctypes.POINTER(_UploadStruct)(),
+                                 self._error(ERROR_BUCKET_NOT_FOUND, bucket))
+        return _UploadResult(self._handle(_UploadStruct, {"bucket": bucket, "key": key,
+                                                          "data": bytearray(), "custom": {}}),
+                             self._no_error())
+
+    @_remote
+    def uplink_upload_write(self, upload, data, size):
+        size = getattr(size, "value", size)
+        self._state(upload)["data"] += ctypes.string_at(data, size)
+        self._transfer(size)
+        return _WriteResult(size, self._no_error())
+
+    def uplink_upload_set_custom_metadata(self, upload, custom):
+        self._state(upload)["custom"] = self._custom(custom)
+        return self._no_error()
+
+    @_remote
+    def uplink_upload_commit(self, upload):
+        state = self._state(upload)
+        entry = (bytes(state["data"]), state["custom"], int(time.time()))
+        with self._lock:
+            if state["bucket"] not in self.buckets:
+                return self._error(ERROR_BUCKET_NOT_FOUND, state["bucket"])
+            self.buckets[state["bucket"]][state["key"]] = entry
+        return self._no_error()
+
+    def uplink_upload_abort(self, upload):
+        return self._no_error()
+
+    def uplink_upload_info(self, upload):
+        state = self._state(upload)
+        return _ObjectResult(self._object(state["key"], (state["data"], state["custom"], 0)),
+                             self._no_error())
+
+    # multipart upload
+
+    @_remote
+    def uplink_begin_upload(self, project, bucket, key, options):
+        bucket, key = self._string(bucket), self._string(key)
+        if bucket not in self.buckets:
+            return _UploadInfoResult(ctypes.POINTER(_UploadInfoStruct)(),
+                                     self._error(ERROR_BUCKET_NOT_FOUND, bucket))
+        upload_id = "upload-{}".format(next(self._next_handle))
+        with self._lock:
+            self.uploads[upload_id] = {"bucket": bucket, "key": key, "parts": dict()}
+        info = _UploadInfoStruct(upload_id.encode("utf-8"), key.encode("utf-8"), False,
+                                 _SystemMetadataStruct(), _CustomMetadataStruct())
+        return _UploadInfoResult(self._malloc(info), self._no_error())
+
+    @_remote
+    def uplink_upload_part(self, project, bucket, key, upload_id, part_number):
+        upload_id = self._string(upload_id)
+        if upload_id not in self.uploads:
+            return _PartUploadResult(ctypes.POINTER(_PartUploadStruct)(),
+                                     self._error(ERROR_INTERNAL, upload_id))
+        number = getattr(part_number, "value", part_number)
+        return _PartUploadResult(self._handle(_PartUploadStruct, {"upload_id": upload_id,
+                                                                  "number": number,
+                                                                  "data": bytearray()}),
+                                 self._no_error())
+
+    @_remote
+    def uplink_part_upload_write(self, part_upload, data, size):
+        size = getattr(size, "value", size)
+        self._state(part_upload)["data"] += ctypes.string_at(data, size)
+        self._transfer(size)
+        return _WriteResult(size, self._no_error())
+
+    @_remote
+    def uplink_part_upload_commit(self, part_upload):
+        state = self._state(part_upload)
+        with self._lock:
+            upload = self.uploads.get(state["upload_id"])
+            if upload is not None:
+                upload["parts"][state["number"]] = bytes(state["data"])
+        if upload is None:
+            return self._error(ERROR_INTERNAL, state["upload_id"])
+        return self._no_error()
+
+    def uplink_part_upload_abort(self, part_upload):
+        return self._no_error()
+
+    @_remote
+    def uplink_commit_upload(self, project, bucket, key, upload_id, options):
+        upload_id = self._string(upload_id)
+        with self._lock:
+            upload = self.uploads.pop(upload_id, None)
+        if upload is None:
+            return _CommitUploadResult(ctypes.POINTER(_ObjectStruct)(),
+                                       self._error(ERROR_INTERNAL, upload_id))
+        options = self._options(options)
+        custom = self._custom(options.custom_metadata) if options is not None else {}
+        data = b"".join(data for _, data in sorted(upload["parts"].items()))
+        entry = (data, custom, int(time.time()))
+        with self._lock:
+            self.buckets[upload["bucket"]][upload["key"]] = entry
+        return _CommitUploadResult(self._object(upload["key"], entry), self._no_error())
+
+    @_remote
+    def uplink_abort_upload(self, project, bucket, key, upload_id):
+        with self._lock:
+            upload = self.uploads.pop(self._string(upload_id), None)
+        if upload is None:
+            return self._error(ERROR_INTERNAL, self._string(upload_id))
+        return self._no_error()
+
+    # download
+
+    @_remote
+    def uplink_download_object(self, project, bucket, key, options):
+        bucket, key = self._string(bucket), self._string(key)
+        entry, error = self._lookup(bucket, key)
+        if entry is None:
+            return _DownloadResult(ctypes.POINTER(_DownloadStruct)(), error)
+        options = self._options(options)
+        data = entry[0]
+        if options is not None:
+            end = len(data) if options.length < 0 else options.offset + options.length
+            data = data[options.offset:end]
+        return _DownloadResult(self._handle(_DownloadStruct, {"key": key, "entry": entry,
+                                                              "data": data, "position": 0}),
+                               error)
+
+    @_remote
+    def uplink_download_read(self, download, buffer, size):
+        state = self._state(download)
+        position = state["position"]
+        chunk = state["data"][position:position + getattr(size, "value", size)]
+        if not chunk:
+            return _ReadResult(0, self._error(ERROR_EOF, "EOF"))
+        ctypes.memmove(buffer, chunk, len(chunk))
+        state["position"] += len(chunk)
+        self._transfer(len(chunk))
+        return _ReadResult(len(chunk), self._no_error())
+
+    def uplink_download_info(self, download):
+        state = self._state(download)
+        return _ObjectResult(self._object(state["key"], state["entry"]), self._no_error())
+
+    def uplink_close_download(self, download):
+        return self._no_error()
+
+    # memory release
+
+    def uplink_free_error(self, error):
+        self._free(error)
+
+    def uplink_free_access_result(self, result):
+        self._free(result.access)
+        self._free(result.error)
+
+    def uplink_free_string_result(self, result):
+        self._free(result.error)
+
+    def uplink_free_encryption_key_result(self, result):
+        self._free(result.encryption_key)
+        self._free(result.error)
+
+    def uplink_free_project_result(self, result):
+        self._free(result.project)
+        self._free(result.error)
+
+    def uplink_free_bucket_result(self, result):
+        self._free(result.bucket)
+        self._free(result.error)
+
+    def uplink_free_bucket(self, bucket):
+        self._free(bucket)
+
+    def uplink_free_object_result(self, result):
+        self._free(result.object)
+        self._free(result.error)
+
+    def uplink_free_object(self, object_):
+        self._free(object_)
+
+    def uplink_free_upload_result(self, result):
+        self._free(result.upload)
+        self._free(result.error)
+
+    def uplink_free_upload_info_result(self, result):
+        self._free(result.info)
+        self._free(result.error)
+
+    def uplink_free_part_upload_result(self, result):
+        self._free(result.part_upload)
+        self._free(result.error)
+
+    def uplink_free_commit_upload_result(self, result):
+        self._free(result.object)
+        self._free(result.error)
+
+    def uplink_free_download_result(self, result):
+        self._free(result.download)
+        self._free(result.error)
+
+    def uplink_free_write_result(self, result):
+        self._free(result.error)
+
+    def uplink_free_read_result(self, result):
+        self._free(result.error)
+
+    def uplink_free_bucket_iterator(self, iterator):
+        self._free(iterator)
+
+    def uplink_free_object_iterator(self, iterator):
+        self._free(iterator)
@@ -1,11 +1,22 @@
 """Classes for input and output interface of parameters and returns from uplink."""
 # pylint: disable=too-few-public-methods, too-many-arguments
+import array
 import ctypes
 
 from uplink_python.module_def import _ConfigStruct, _PermissionStruct, _SharePrefixStruct,\
     _BucketStruct, _DownloadOptionsStruct, _SystemMetadataStruct, _CustomMetadataStruct,\
     _UploadOptionsStruct, _ObjectStruct, _ListObjectsOptionsStruct, _ListBucketsOptionsStruct,\
-    _CustomMetadataEntryStruct
+    _CustomMetadataEntryStruct, _CommitUploadOptionsStruct
+
+# attributes of the immutable classes are set once, from __init__, through object.__setattr__
+_set = object.__setattr__
+
+# custom metadata keys written by the binding, prefixed as recommended for application keys
+METADATA_MTIME = "uplink-python:mtime"
+METADATA_SHA256 = "uplink-python:sha256"
+METADATA_CRC32C = "uplink-python:crc32c"
+METADATA_CRC32 = "uplink-python:crc32"
+METADATA_COMPRESSION = "uplink-python:compression"
 
 
 class Config:
@@ -144,7 +155,25 @@ class SharePrefix:
                                   ctypes.c_char_p(self.prefix.encode('utf-8')))
 
 
-class Bucket:
+class _Immutable:
+    """
+    Base of the read-only model classes returned by uplink, attributes are stored in
+    __slots__ (no per instance __dict__) and can not be changed once constructed.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError("'" + type(self).__name__ + "' object is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("'" + type(self).__name__ + "' object is immutable")
+
+    def __reduce__(self):
+        return type(self), tuple(getattr(self, name) for name in self.__slots__)
+
+
+class Bucket(_Immutable):
     """
     Bucket contains information about the bucket.
 
@@ -163,11 +192,13 @@ class Bucket:
         converts python class object to python dictionary
     """
 
+    __slots__ = ("name", "created")
+
     def __init__(self, name: str = "", created: int = 0):
         """Constructs all the necessary attributes for the Bucket object."""
 
-        self.name = name
-        self.created = created
+        _set(self, "name", name)
+        _set(self, "created", created)
 
     def get_structure(self):
         """Converts python class object to ctypes structure _BucketStruct"""
@@ -181,7 +212,7 @@ class Bucket:
         return {"name": self.name, "created": self.created}
 
 
-class SystemMetadata:
+class SystemMetadata(_Immutable):
     """
     SystemMetadata contains information about the object that cannot be changed directly.
 
@@ -201,12 +232,14 @@ class SystemMetadata:
         converts python class object to python dictionary
     """
 
+    __slots__ = ("created", "expires", "content_length")
+
     def __init__(self, created: int = 0, expires: int = 0, content_length: int = 0):
         """Constructs all the necessary attributes for the SystemMetadata object."""
 
-        self.created = created
-        self.expires = expires
-        self.content_length = content_length
+        _set(self, "created", created)
+        _set(self, "expires", expires)
+        _set(self, "content_length", content_length)
 
     def get_structure(self):
         """Converts python class object to ctypes structure _SystemMetadataStruct"""
@@ -222,7 +255,7 @@ class SystemMetadata:
                 "content_length": self.content_length}
 
 
-class CustomMetadataEntry:
+class CustomMetadataEntry(_Immutable):
     """
     CustomMetadata contains custom user metadata about the object.
 
@@ -246,13 +279,15 @@ class CustomMetadataEntry:
         converts python class object to python dictionary
     """
 
+    __slots__ = ("key", "key_length", "value", "value_length")
+
     def __init__(self, key: str = "", key_length: int = 0, value: str = "", value_length: int = 0):
         """Constructs all the necessary attributes for the CustomMetadataEntry object."""
 
-        self.key = key
-        self.key_length = key_length
-        self.value = value
-        self.value_length = value_length
+        _set(self, "key", key)
+        _set(self, "key_length", key_length)
+        _set(self, "value", value)
+        _set(self, "value_length", value_length)
 
     def get_structure(self):
         """Converts python class object to ctypes structure _CustomMetadataEntryStruct"""
@@ -269,7 +304,7 @@ class CustomMetadataEntry:
                 "value_length": self.value_length}
 
 
-class CustomMetadata:
+class CustomMetadata(_Immutable):
     """
     CustomMetadata contains a list of CustomMetadataEntry about the object.
 
@@ -282,43 +317,67 @@ class CustomMetadata:
 
     Methods
     -------
+    from_mapping():
+        CustomMetadata
+    get_mapping():
+        dict of str
     get_structure():
         _CustomMetadataStruct
     get_dict():
         converts python class object to python dictionary
     """
 
+    __slots__ = ("entries", "count")
+
     def __init__(self, entries: [CustomMetadataEntry] = None, count: int = 0):
         """Constructs all the necessary attributes for the CustomMetadata object."""
 
-        self.entries = entries
-        self.count = count
+        _set(self, "entries", entries)
+        _set(self, "count", count)
+
+    @classmethod
+    def from_mapping(cls, mapping):
+        """Returns CustomMetadata with one entry per key and value of a mapping of str."""
+
+        entries = [CustomMetadataEntry(key, len(key.encode('utf-8')), value,
+                                       len(value.encode('utf-8')))
+                   for key, value in mapping.items()]
+        return cls(entries, len(entries))
+
+    def get_mapping(self):
+        """Returns the entries as a dictionary of their values by key."""
+
+        if self.entries is None:
+            return dict()
+        return {entry.key: entry.value for entry in self.entries[:self.count]}
 
     def get_structure(self):
         """Converts python class object to ctypes structure _CustomMetadataStruct"""
 
-        if self.entries is None or self.count == 0:
-            self.count = 0
+        count = self.count
+        if self.entries is None or count == 0:
+            count = 0
             entries = ctypes.POINTER(_CustomMetadataEntryStruct)()
         else:
-            li_array_size = (_CustomMetadataEntryStruct * self.count)()
+            li_array_size = (_CustomMetadataEntryStruct * count)()
             entries = ctypes.cast(li_array_size, ctypes.POINTER(_CustomMetadataEntryStruct))
             for i, val in enumerate(self.entries):
                 entries[i] = val.get_structure()
 
-        return _CustomMetadataStruct(entries, ctypes.c_size_t(self.count))
+        return _CustomMetadataStruct(entries, ctypes.c_size_t(count))
 
     def get_dict(self):
         """Converts python class object to python dictionary"""
 
         entries = self.entries
-        if entries is None or self.count == 0:
-            self.count = 0
+        count = self.count
+        if entries is None or count == 0:
+            count = 0
             entries = [CustomMetadataEntry()]
-        return {"entries": [entry.get_dict() for entry in entries], "count": self.count}
+        return {"entries": [entry.get_dict() for entry in entries], "count": count}
 
 
-class Object:
+class Object(_Immutable):
     """
     Object contains information about an object.
 
@@ -340,14 +399,16 @@ class Object:
         converts python class object to python dictionary
     """
 
+    __slots__ = ("key", "is_prefix", "system", "custom")
+
     def __init__(self, key: str = "", is_prefix: bool = False, system: SystemMetadata = None,
                  custom: CustomMetadata = None):
         """Constructs all the necessary attributes for the Object object."""
 
-        self.key = key
-        self.is_prefix = is_prefix
-        self.system = system
-        self.custom = custom
+        _set(self, "key", key)
+        _set(self, "is_prefix", is_prefix)
+        _set(self, "system", system)
+        _set(self, "custom", custom)
 
     def get_structure(self):
         """Converts python class object to ctypes structure _ObjectStruct"""
@@ -378,6 +439,197 @@ class Object:
                 "custom": custom.get_dict()}
 
 
+class ObjectColumns:
+    """
+    ObjectColumns contains a listing of objects in columnar form, one entry per object in
+    each column, without building an Object per listed key.
+
+    The int64 columns are array.array('q'), they support the buffer protocol, so they can be
+    wrapped without copying e.g. with numpy.frombuffer(columns.content_length, dtype='int64').
+
+    ...
+
+    Attributes
+    ----------
+    keys : list of str
+    is_prefix : array of int8
+    created : array of int64
+    expires : array of int64
+    content_length : array of int64
+    custom : list of dict or None
+        custom metadata of every object as {key: value}, only when listed with custom=True.
+
+    Methods
+    -------
+    append():
+        None
+    get_dict():
+        converts python class object to python dictionary
+    """
+
+    def __init__(self, custom: bool = False):
+        """Constructs all the necessary attributes for the ObjectColumns object."""
+
+        self.keys = list()
+        self.is_prefix = array.array('b')
+        self.created = array.array('q')
+        self.expires = array.array('q')
+        self.content_length = array.array('q')
+        self.custom = list() if custom else None
+
+    def __len__(self):
+        return len(self.keys)
+
+    def append(self, object_):
+        """Appends the fields of a ctypes structure _ObjectStruct to the columns."""
+
+        self.keys.append(object_.key.decode("utf-8"))
+        self.is_prefix.append(object_.is_prefix)
+        system = object_.system
+        self.created.append(system.created)
+        self.expires.append(system.expires)
+        self.content_length.append(system.content_length)
+        if self.custom is not None:
+            custom = dict()
+            for i in range(object_.custom.count):
+                entry = object_.custom.entries[i]
+                if entry.key is not None:
+                    custom[entry.key.decode("utf-8")] = (entry.value or b"").decode("utf-8")
+            self.custom.append(custom)
+
+    def get_dict(self):
+        """Converts python class object to python dictionary"""
+
+        return {"keys": self.keys, "is_prefix": self.is_prefix.tolist(),
+                "created": self.created.tolist(), "expires": self.expires.tolist(),
+                "content_length": self.content_length.tolist(), "custom": self.custom}
+
+
+class DeleteResult(_Immutable):
+    """
+    DeleteResult contains the outcome of deleting one key of a bulk delete.
+
+    ...
+
+    Attributes
+    ----------
+    key : str
+    deleted : Object
+        the deleted object, None when it failed or did not exist.
+    error : StorjException
+        the error deleting the key, None when it succeeded.
+
+    Methods
+    -------
+    get_dict():
+        converts python class object to python dictionary
+    """
+
+    __slots__ = ("key", "deleted", "error")
+
+    def __init__(self, key: str = "", deleted: Object = None, error: Exception = None):
+        """Constructs all the necessary attributes for the DeleteResult object."""
+
+        _set(self, "key", key)
+        _set(self, "deleted", deleted)
+        _set(self, "error", error)
+
+    def get_dict(self):
+        """Converts python class object to python dictionary"""
+
+        return {"key": self.key,
+                "deleted": None if self.deleted is None else self.deleted.get_dict(),
+                "error": None if self.error is None else self.error.details}
+
+
+class SyncResult(_Immutable):
+    """
+    SyncResult contains the outcome of synchronizing a local directory to a bucket.
+
+    ...
+
+    Attributes
+    ----------
+    uploaded : list of str
+        keys uploaded, or to be uploaded by a dry run.
+    deleted : list of str
+        keys deleted, or to be deleted by a dry run.
+    skipped : int
+        number of files already up to date.
+    errors : list of (str, Exception)
+        keys whose upload or delete failed, with their error.
+    bytes_uploaded : int
+        size of the files uploaded, or to be uploaded by a dry run.
+    dry_run : bool
+
+    Methods
+    -------
+    get_dict():
+        converts python class object to python dictionary
+    """
+
+    __slots__ = ("uploaded", "deleted", "skipped", "errors", "bytes_uploaded", "dry_run")
+
+    def __init__(self, uploaded: [str] = None, deleted: [str] = None, skipped: int = 0,
+                 errors: list = None, bytes_uploaded: int = 0, dry_run: bool = False):
+        """Constructs all the necessary attributes for the SyncResult object."""
+
+        _set(self, "uploaded", uploaded or [])
+        _set(self, "deleted", deleted or [])
+        _set(self, "skipped", skipped)
+        _set(self, "errors", errors or [])
+        _set(self, "bytes_uploaded", bytes_uploaded)
+        _set(self, "dry_run", dry_run)
+
+    def get_dict(self):
+        """Converts python class object to python dictionary"""
+
+        return {"uploaded": self.uploaded, "deleted": self.deleted, "skipped": self.skipped,
+                "errors": {key: getattr(error, "details", str(error))
+                           for key, error in self.errors},
+                "bytes_uploaded": self.bytes_uploaded, "dry_run": self.dry_run}
+
+
+class DedupResult(_Immutable):
+    """
+    DedupResult contains the outcome of a deduplicating upload of a file.
+
+    ...
+
+    Attributes
+    ----------
+    key : str
+        key the content is stored at.
+    sha256 : str
+        hex SHA-256 digest of the content.
+    size : int
+        size of the content in bytes.
+    uploaded : bool
+        False when the key already held the same content and the transfer was skipped.
+
+    Methods
+    -------
+    get_dict():
+        converts python class object to python dictionary
+    """
+
+    __slots__ = ("key", "sha256", "size", "uploaded")
+
+    def __init__(self, key: str = "", sha256: str = "", size: int = 0, uploaded: bool = False):
+        """Constructs all the necessary attributes for the DedupResult object."""
+
+        _set(self, "key", key)
+        _set(self, "sha256", sha256)
+        _set(self, "size", size)
+        _set(self, "uploaded", uploaded)
+
+    def get_dict(self):
+        """Converts python class object to python dictionary"""
+
+        return {"key": self.key, "sha256": self.sha256, "size": self.size,
+                "uploaded": self.uploaded}
+
+
 class ListObjectsOptions:
     """
     ListObjectsOptions defines object listing options.
@@ -482,6 +734,36 @@ class UploadOptions:
         return _UploadOptionsStruct(ctypes.c_int64(self.expires))
 
 
+class CommitUploadOptions:
+    """
+    CommitUploadOptions contains additional options for committing a multipart upload.
+
+    ...
+
+    Attributes
+    ----------
+    custom_metadata : CustomMetadata
+        custom metadata of the assembled object.
+
+    Methods
+    -------
+    get_structure():
+        _CommitUploadOptionsStruct
+    """
+
+    def __init__(self, custom_metadata: CustomMetadata = None):
+        """Constructs all the necessary attributes for the CommitUploadOptions object."""
+
+        self.custom_metadata = custom_metadata
+
+    def get_structure(self):
+        """Converts python class object to ctypes structure _CommitUploadOptionsStruct"""
+
+        if self.custom_metadata is None:
+            return _CommitUploadOptionsStruct(_CustomMetadataStruct())
+        return _CommitUploadOptionsStruct(self.custom_metadata.get_structure())
+
+
 class DownloadOptions:
     """
     DownloadOptions contains additional options for downloading.
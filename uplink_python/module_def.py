@@ -112,6 +112,26 @@ class _UploadOptionsStruct(ctypes.Structure):
     _fields_ = [("expires", ctypes.c_int64)]
 
 
+class _UploadInfoStruct(ctypes.Structure):
+    """UploadInfo ctypes structure for internal processing."""
+
+    _fields_ = [("upload_id", ctypes.c_char_p), ("key", ctypes.c_char_p),
+                ("is_prefix", ctypes.c_bool), ("system", _SystemMetadataStruct),
+                ("custom", _CustomMetadataStruct)]
+
+
+class _PartUploadStruct(ctypes.Structure):
+    """PartUpload ctypes structure for internal processing."""
+
+    _fields_ = [("_handle", ctypes.c_size_t)]
+
+
+class _CommitUploadOptionsStruct(ctypes.Structure):
+    """CommitUploadOptions ctypes structure for internal processing."""
+
+    _fields_ = [("custom_metadata", _CustomMetadataStruct)]
+
+
 class _DownloadStruct(ctypes.Structure):
     """Download ctypes structure for internal processing."""
 
@@ -148,6 +168,25 @@ class _UploadResult(ctypes.Structure):
     _fields_ = [("upload", ctypes.POINTER(_UploadStruct)), ("error", ctypes.POINTER(_Error))]
 
 
+class _UploadInfoResult(ctypes.Structure):
+    """UploadInfoResult ctypes structure"""
+
+    _fields_ = [("info", ctypes.POINTER(_UploadInfoStruct)), ("error", ctypes.POINTER(_Error))]
+
+
+class _PartUploadResult(ctypes.Structure):
+    """PartUploadResult ctypes structure"""
+
+    _fields_ = [("part_upload", ctypes.POINTER(_PartUploadStruct)),
+                ("error", ctypes.POINTER(_Error))]
+
+
+class _CommitUploadResult(ctypes.Structure):
+    """CommitUploadResult ctypes structure"""
+
+    _fields_ = [("object", ctypes.POINTER(_ObjectStruct)), ("error", ctypes.POINTER(_Error))]
+
+
 class _DownloadResult(ctypes.Structure):
     """DownloadResult ctypes structure"""
 
@@ -189,3 +228,125 @@ class _EncryptionKeyResult(ctypes.Structure):
 
     _fields_ = [("encryption_key", ctypes.POINTER(_EncryptionKeyStruct)),
                 ("error", ctypes.POINTER(_Error))]
+
+
+# argtypes and restype of every libuplinkc function used by the binding, they are assigned
+# once when the library is loaded by Uplink, never per call.
+_FUNCTION_SIGNATURES = {
+    # access grant
+    "uplink_request_access_with_passphrase": ([ctypes.c_char_p, ctypes.c_char_p,
+                                               ctypes.c_char_p], _AccessResult),
+    "uplink_config_request_access_with_passphrase": ([_ConfigStruct, ctypes.c_char_p,
+                                                      ctypes.c_char_p, ctypes.c_char_p],
+                                                     _AccessResult),
+    "uplink_parse_access": ([ctypes.c_char_p], _AccessResult),
+    "uplink_derive_encryption_key": ([ctypes.c_char_p, ctypes.c_void_p, ctypes.c_size_t],
+                                     _EncryptionKeyResult),
+    "uplink_access_override_encryption_key": ([ctypes.POINTER(_AccessStruct), ctypes.c_char_p,
+                                               ctypes.c_char_p,
+                                               ctypes.POINTER(_EncryptionKeyStruct)],
+                                              ctypes.POINTER(_Error)),
+    "uplink_open_project": ([ctypes.POINTER(_AccessStruct)], _ProjectResult),
+    "uplink_config_open_project": ([_ConfigStruct, ctypes.POINTER(_AccessStruct)],
+                                   _ProjectResult),
+    "uplink_access_serialize": ([ctypes.POINTER(_AccessStruct)], _StringResult),
+    "uplink_access_share": ([ctypes.POINTER(_AccessStruct), _PermissionStruct,
+                             ctypes.POINTER(_SharePrefixStruct), ctypes.c_size_t],
+                            _AccessResult),
+    # project
+    "uplink_close_project": ([ctypes.POINTER(_ProjectStruct)], ctypes.POINTER(_Error)),
+    # buckets
+    "uplink_create_bucket": ([ctypes.POINTER(_ProjectStruct), ctypes.c_char_p], _BucketResult),
+    "uplink_ensure_bucket": ([ctypes.POINTER(_ProjectStruct), ctypes.c_char_p], _BucketResult),
+    "uplink_stat_bucket": ([ctypes.POINTER(_ProjectStruct), ctypes.c_char_p], _BucketResult),
+    "uplink_delete_bucket": ([ctypes.POINTER(_ProjectStruct), ctypes.c_char_p], _BucketResult),
+    "uplink_list_buckets": ([ctypes.POINTER(_ProjectStruct),
+                             ctypes.POINTER(_ListBucketsOptionsStruct)],
+                            ctypes.POINTER(_BucketIterator)),
+    "uplink_bucket_iterator_next": ([ctypes.POINTER(_BucketIterator)], ctypes.c_bool),
+    "uplink_bucket_iterator_item": ([ctypes.POINTER(_BucketIterator)],
+                                    ctypes.POINTER(_BucketStruct)),
+    "uplink_bucket_iterator_err": ([ctypes.POINTER(_BucketIterator)], ctypes.POINTER(_Error)),
+    # objects
+    "uplink_stat_object": ([ctypes.POINTER(_ProjectStruct), ctypes.c_char_p, ctypes.c_char_p],
+                           _ObjectResult),
+    "uplink_delete_object": ([ctypes.POINTER(_ProjectStruct), ctypes.c_char_p,
+                              ctypes.c_char_p], _ObjectResult),
+    "uplink_list_objects": ([ctypes.POINTER(_ProjectStruct), ctypes.c_char_p,
+                             ctypes.POINTER(_ListObjectsOptionsStruct)],
+                            ctypes.POINTER(_ObjectIterator)),
+    "uplink_object_iterator_next": ([ctypes.POINTER(_ObjectIterator)], ctypes.c_bool),
+    "uplink_object_iterator_item": ([ctypes.POINTER(_ObjectIterator)],
+                                    ctypes.POINTER(_ObjectStruct)),
+    "uplink_object_iterator_err": ([ctypes.POINTER(_ObjectIterator)], ctypes.POINTER(_Error)),
+    # upload
+    "uplink_upload_object": ([ctypes.POINTER(_ProjectStruct), ctypes.c_char_p, ctypes.c_char_p,
+                              ctypes.POINTER(_UploadOptionsStruct)], _UploadResult),
+    "uplink_upload_write": ([ctypes.POINTER(_UploadStruct), ctypes.POINTER(ctypes.c_uint8),
+                             ctypes.c_size_t], _WriteResult),
+    "uplink_upload_commit": ([ctypes.POINTER(_UploadStruct)], ctypes.POINTER(_Error)),
+    "uplink_upload_abort": ([ctypes.POINTER(_UploadStruct)], ctypes.POINTER(_Error)),
+    "uplink_upload_set_custom_metadata": ([ctypes.POINTER(_UploadStruct),
+                                           _CustomMetadataStruct], ctypes.POINTER(_Error)),
+    "uplink_upload_info": ([ctypes.POINTER(_UploadStruct)], _ObjectResult),
+    # multipart upload, exported by libuplinkc builds newer than the pinned v1.2.2
+    "uplink_begin_upload": ([ctypes.POINTER(_ProjectStruct), ctypes.c_char_p, ctypes.c_char_p,
+                             ctypes.POINTER(_UploadOptionsStruct)], _UploadInfoResult),
+    "uplink_commit_upload": ([ctypes.POINTER(_ProjectStruct), ctypes.c_char_p, ctypes.c_char_p,
+                              ctypes.c_char_p, ctypes.POINTER(_CommitUploadOptionsStruct)],
+                             _CommitUploadResult),
+    "uplink_abort_upload": ([ctypes.POINTER(_ProjectStruct), ctypes.c_char_p, ctypes.c_char_p,
+                             ctypes.c_char_p], ctypes.POINTER(_Error)),
+    "uplink_upload_part": ([ctypes.POINTER(_ProjectStruct), ctypes.c_char_p, ctypes.c_char_p,
+                            ctypes.c_char_p, ctypes.c_uint32], _PartUploadResult),
+    "uplink_part_upload_write": ([ctypes.POINTER(_PartUploadStruct),
+                                  ctypes.POINTER(ctypes.c_uint8), ctypes.c_size_t],
+                                 _WriteResult),
+    "uplink_part_upload_commit": ([ctypes.POINTER(_PartUploadStruct)], ctypes.POINTER(_Error)),
+    "uplink_part_upload_abort": ([ctypes.POINTER(_PartUploadStruct)], ctypes.POINTER(_Error)),
+    # download
+    "uplink_download_object": ([ctypes.POINTER(_ProjectStruct), ctypes.c_char_p,
+                                ctypes.c_char_p, ctypes.POINTER(_DownloadOptionsStruct)],
+                               _DownloadResult),
+    "uplink_download_read": ([ctypes.POINTER(_DownloadStruct), ctypes.POINTER(ctypes.c_uint8),
+                              ctypes.c_size_t], _ReadResult),
+    "uplink_download_info": ([ctypes.POINTER(_DownloadStruct)], _ObjectResult),
+    "uplink_close_download": ([ctypes.POINTER(_DownloadStruct)], ctypes.POINTER(_Error)),
+    # memory allocated by libuplinkc for results, released once they are converted
+    "uplink_free_error": ([ctypes.POINTER(_Error)], None),
+    "uplink_free_access_result": ([_AccessResult], None),
+    "uplink_free_project_result": ([_ProjectResult], None),
+    "uplink_free_bucket_result": ([_BucketResult], None),
+    "uplink_free_bucket": ([ctypes.POINTER(_BucketStruct)], None),
+    "uplink_free_object_result": ([_ObjectResult], None),
+    "uplink_free_object": ([ctypes.POINTER(_ObjectStruct)], None),
+    "uplink_free_upload_result": ([_UploadResult], None),
+    "uplink_free_download_result": ([_DownloadResult], None),
+    "uplink_free_upload_info_result": ([_UploadInfoResult], None),
+    "uplink_free_part_upload_result": ([_PartUploadResult], None),
+    "uplink_free_commit_upload_result": ([_CommitUploadResult], None),
+    "uplink_free_write_result": ([_WriteResult], None),
+    "uplink_free_read_result": ([_ReadResult], None),
+    "uplink_free_string_result": ([_StringResult], None),
+    "uplink_free_encryption_key_result": ([_EncryptionKeyResult], None),
+    "uplink_free_bucket_iterator": ([ctypes.POINTER(_BucketIterator)], None),
+    "uplink_free_object_iterator": ([ctypes.POINTER(_ObjectIterator)], None),
+}
+
+
+def _bind_functions(library):
+    """
+    Assigns argtypes and restype from _FUNCTION_SIGNATURES to the functions of a loaded
+    libuplinkc. ctypes caches the function objects on the library, so later attribute
+    lookups return the already configured functions. Functions missing from the library
+    are skipped, they fail with AttributeError when called.
+    """
+
+    for name, (argtypes, restype) in _FUNCTION_SIGNATURES.items():
+        try:
+            function = getattr(library, name)
+        except AttributeError:
+            continue
+        function.argtypes = argtypes
+        function.restype = restype
+    return library
@@ -0,0 +1,287 @@
+"""Module with ProjectPool class, sharing opened projects between threads"""
+import collections
+import contextlib
+import threading
+import time
+
+from uplink_python.errors import StorjException, InternalError, InvalidHandleError,\
+    PoolTimeoutError
+from uplink_python.module_classes import Config
+
+# errors after which a project is not returned to the pool but closed
+_BROKEN_PROJECT_ERRORS = (InternalError, InvalidHandleError)
+
+
+class ProjectPool:
+    """
+    ProjectPool keeps between min_size and max_size projects opened from an access, and
+    lends them to one thread at a time, so threads neither share a Project nor open one per
+    request.
+
+    Projects idle for longer than check_interval are health checked before being lent,
+    projects idle for longer than max_idle are closed down to min_size, and projects whose
+    use raised an InternalError or InvalidHandleError are closed instead of being reused.
+
+    ...
+
+    Attributes
+    ----------
+    access : Access
+        access the projects are opened with
+    config : Config
+        configuration of the projects, None to open them with the default one
+    min_size : int
+    max_size : int
+    timeout : float
+        seconds checkout waits for a project when max_size of them are in use.
+    max_idle : float
+        seconds after which an idle project above min_size is closed.
+    check_interval : float
+        seconds of idleness after which a project is health checked before being lent.
+    health_check : callable
+        called with a project, returns False or raises StorjException when it is not usable.
+        Lists the first bucket by default.
+
+    Methods
+    -------
+    checkout():
+        Project
+    checkin():
+        None
+    project():
+        context manager of Project
+    evict_idle():
+        None
+    close():
+        None
+    get_dict():
+        converts python class object to python dictionary
+    """
+
+    def __init__(self, access, config: Config = None, min_size: int = 0, max_size: int = 8,
+                 timeout: float = 30.0, max_idle: float = 300.0, check_interval: float = 30.0,
+                 health_check=None):
+        """Constructs all the necessary attributes for the ProjectPool object."""
+
+        self.access = access
+        self.config = config
+        self.min_size = min_size
+        self.max_size = max(max_size, min_size, 1)
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.check_interval = check_interval
+        self.health_check = health_check
+        # idle projects with the time they were checked in, most recently used last
+        self._idle = collections.deque()
+        self._size = 0
+        self._in_use = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        # metrics
+        self.checkouts = 0
+        self.created = 0
+        self.discarded = 0
+        self.timeouts = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+        for _ in range(min_size):
+            self._idle.append((self._open(), time.monotonic()))
+            self._size += 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def checkout(self, timeout: float = None):
+        """
+        function lends a project of the pool, opening one when none is idle and less than
+        max_size are open, or waiting for one to be checked in otherwise.
+
+        Parameters
+        ----------
+        timeout : float (optional)
+            seconds to wait, the timeout of the pool by default.
+
+        Returns
+        -------
+        Project
+        """
+
+        start = time.monotonic()
+        deadline = start + (self.timeout if timeout is None else timeout)
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise InternalError("project pool is closed")
+                if self._idle:
+                    project, checked_in = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    project, checked_in = None, None
+                    self._size += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.timeouts += 1
+                    raise PoolTimeoutError("{} projects in use for {:.1f}s"
+                                           .format(self._in_use, time.monotonic() - start))
+                self._condition.wait(remaining)
+            self._in_use += 1
+            self.checkouts += 1
+            wait_time = time.monotonic() - start
+            self.wait_time_total += wait_time
+            self.wait_time_max = max(self.wait_time_max, wait_time)
+        #
+        # open or health check outside of the lock, they take a round trip to the satellite
+        try:
+            if project is not None and time.monotonic() - checked_in > self.check_interval:
+                if not self._healthy(project):
+                    self._discard(project)
+                    project = None
+            if project is None:
+                project = self._open()
+        except BaseException:
+            with self._condition:
+                self._size -= 1
+                self._in_use -= 1
+                self._condition.notify()
+            raise
+        return project
+
+    def checkin(self, project, discard: bool = False):
+        """
+        function returns a project lent by checkout to the pool, or closes it when discard
+        is set or the pool is closed.
+
+        Parameters
+        ----------
+        project : Project
+        discard : bool (optional)
+
+        Returns
+        -------
+        None
+        """
+
+        with self._condition:
+            self._in_use -= 1
+            if discard or self._closed:
+                self._size -= 1
+            else:
+                self._idle.append((project, time.monotonic()))
+                project = None
+            self._condition.notify()
+        if project is not None:
+            self._discard(project)
+        self.evict_idle()
+
+    @contextlib.contextmanager
+    def project(self, timeout: float = None):
+        """
+        function lends a project for the duration of a with block, the project is closed
+        instead of being reused when the block raises InternalError or InvalidHandleError.
+
+        Parameters
+        ----------
+        timeout : float (optional)
+
+        Returns
+        -------
+        context manager of Project
+        """
+
+        project = self.checkout(timeout)
+        discard = False
+        try:
+            yield project
+        except _BROKEN_PROJECT_ERRORS:
+            discard = True
+            raise
+        finally:
+            self.checkin(project, discard)
+
+    def evict_idle(self):
+        """
+        function closes the projects idle for longer than max_idle, keeping min_size open.
+
+        Returns
+        -------
+        None
+        """
+
+        evicted = list()
+        with self._condition:
+            expired = time.monotonic() - self.max_idle
+            # the least recently used projects are first
+            while self._idle and self._size > self.min_size and self._idle[0][1] < expired:
+                evicted.append(self._idle.popleft()[0])
+                self._size -= 1
+        for project in evicted:
+            self._discard(project)
+
+    def close(self):
+        """
+        function closes the idle projects and the pool, projects still checked out are
+        closed when they are checked in.
+
+        Returns
+        -------
+        None
+        """
+
+        with self._condition:
+            self._closed = True
+            idle = [project for project, _ in self._idle]
+            self._idle.clear()
+            self._size -= len(idle)
+            self._condition.notify_all()
+        for project in idle:
+            self._discard(project)
+
+    def get_dict(self):
+        """Converts python class object to python dictionary"""
+
+        with self._condition:
+            return {"size": self._size, "idle": len(self._idle), "in_use": self._in_use,
+                    "max_size": self.max_size, "utilization": self._in_use / self.max_size,
+                    "checkouts": self.checkouts, "created": self.created,
+                    "discarded": self.discarded, "timeouts": self.timeouts,
+                    "wait_time_total": self.wait_time_total,
+                    "wait_time_max": self.wait_time_max,
+                    "wait_time_avg": self.wait_time_total / max(self.checkouts, 1)}
+
+    def _open(self):
+        """opens a new project from the access."""
+
+        if self.config is None:
+            project = self.access.open_project()
+        else:
+            project = self.access.config_open_project(self.config)
+        with self._condition:
+            self.created += 1
+        return project
+
+    def _healthy(self, project):
+        """returns whether the project passes the health check."""
+
+        try:
+            if self.health_check is not None:
+                return bool(self.health_check(project))
+            buckets = project.iterate_buckets()
+            next(buckets, None)
+            buckets.close()
+            return True
+        except StorjException:
+            return False
+
+    def _discard(self, project):
+        """closes a project which leaves the pool, ignoring errors closing it."""
+
+        with self._condition:
+            self.discarded += 1
+        try:
+            project.close()
+        except StorjException:
+            pass
@@ -1,21 +1,160 @@
 """Module with Project class and project methods to work with buckets and objects"""
+import collections
+import concurrent.futures
 import ctypes
+import functools
+import io
+import os
+import stat
+import threading
+import time
 
 from uplink_python.module_classes import ListBucketsOptions, ListObjectsOptions,\
-    UploadOptions, DownloadOptions
-from uplink_python.module_def import _BucketStruct, _ObjectStruct, _ListObjectsOptionsStruct,\
-    _ObjectResult, _ListBucketsOptionsStruct, _UploadOptionsStruct, _DownloadOptionsStruct,\
-    _ProjectStruct, _BucketResult, _BucketIterator, _ObjectIterator, _DownloadResult,\
-    _UploadResult, _Error
-from uplink_python.upload import Upload
-from uplink_python.download import Download
-from uplink_python.errors import _storj_exception
+    UploadOptions, DownloadOptions, ObjectColumns, CommitUploadOptions, DeleteResult,\
+    CustomMetadata, SyncResult, DedupResult, METADATA_MTIME, METADATA_SHA256,\
+    METADATA_COMPRESSION
+from uplink_python.module_def import _ListObjectsOptionsStruct, _ListBucketsOptionsStruct,\
+    _UploadOptionsStruct, _DownloadOptionsStruct, _CommitUploadOptionsStruct
+from uplink_python.cache import MetadataCache
+from uplink_python.compression import Compression
+from uplink_python.digest import DigestIndex, file_sha256
+from uplink_python.upload import Upload, UploadStream, PartUpload, PART_SIZE, PART_BUFSIZE
+from uplink_python.download import Download, DownloadStream, COPY_BUFSIZE, SEGMENT_SIZE,\
+    SEGMENT_BUFSIZE, _preallocate, _pwrite
+from uplink_python.errors import _storj_exception, StorjException, InternalError,\
+    ObjectNotFoundError
+from uplink_python.retry import RetryPolicy, RETRYABLE_ERRORS
+
+
+def _map_bounded(function, items, concurrency: int, ordered: bool = True):
+    """
+    Yields (item, function(item)) for every item, called from a pool of concurrency threads
+    with at most twice concurrency calls queued, so items can be a lazy iterable. Results are
+    yielded in the order of items, or as the calls complete when ordered is False.
+    """
+
+    concurrency = max(1, concurrency)
+    pending = collections.OrderedDict()
+    with concurrent.futures.ThreadPoolExecutor(concurrency) as executor:
+        for item in items:
+            if len(pending) >= 2 * concurrency:
+                yield from _pop_completed(pending, ordered)
+            pending[executor.submit(function, item)] = item
+        while pending:
+            yield from _pop_completed(pending, ordered)
+
+
+def _pop_completed(pending, ordered):
+    """Yields (item, result) of the oldest pending call, or of every completed one."""
+
+    if ordered:
+        future, item = pending.popitem(last=False)
+        yield item, future.result()
+    else:
+        done, _ = concurrent.futures.wait(pending,
+                                          return_when=concurrent.futures.FIRST_COMPLETED)
+        for future in done:
+            yield pending.pop(future), future.result()
+
+
+def _walk_files(local_dir, prefix):
+    """
+    Yields (key, path, stat) of every regular file below local_dir in the order of their keys,
+    a key being prefix followed by the relative path of the file with slash separators.
+    Symbolic links to directories are not followed, as with os.walk.
+    """
+
+    entries = list()
+    try:
+        with os.scandir(local_dir) as scan:
+            for entry in scan:
+                if entry.is_dir(follow_symlinks=False):
+                    # a directory sorts as its name followed by a slash, as its keys do
+                    entries.append((entry.name + "/", entry.path, None))
+                    continue
+                try:
+                    file_stat = os.stat(entry.path)
+                except OSError:
+                    # removed since listed, or a broken symbolic link
+                    continue
+                if stat.S_ISREG(file_stat.st_mode):
+                    entries.append((entry.name, entry.path, file_stat))
+    except OSError:
+        # removed since listed, or not readable
+        return
+    for name, path, file_stat in sorted(entries, key=lambda entry: entry[0]):
+        if file_stat is None:
+            yield from _walk_files(path, prefix + name)
+        else:
+            yield prefix + name, path, file_stat
+
+
+def _merge_remote(files, remote, orphans):
+    """
+    Yields (key, path, stat, remote copy) of files, as yielded by _walk_files, merged with
+    remote, an iterable of (key, copy). The listing is read no further than the key of the
+    file being compared, and the keys of remote below it without a file are appended to
+    orphans. remote needs not be in key order, as Storj lists objects by encrypted key: a
+    file whose copy was not read yet is held until it is, or until remote is exhausted,
+    only then is it yielded without a copy.
+    """
+
+    remote = iter(remote)
+    # entries of remote read and not matched yet, files read before their copy
+    pending = collections.OrderedDict()
+    deferred = collections.OrderedDict()
+    last = None
+    for key, path, file_stat in files:
+        while last is None or last < key:
+            entry = next(remote, None)
+            if entry is None:
+                break
+            last = entry[0]
+            if last in deferred:
+                yield (last,) + deferred.pop(last) + (entry[1],)
+            else:
+                pending[last] = entry[1]
+        # files come in key order, pending keys below this one have no file
+        while pending and next(iter(pending)) < key:
+            orphans.append(pending.popitem(last=False)[0])
+        if key in pending:
+            yield key, path, file_stat, pending.pop(key)
+        else:
+            deferred[key] = (path, file_stat)
+    for remote_key, copy in remote:
+        if remote_key in deferred:
+            yield (remote_key,) + deferred.pop(remote_key) + (copy,)
+        else:
+            orphans.append(remote_key)
+    orphans.extend(pending)
+    for key, (path, file_stat) in deferred.items():
+        yield key, path, file_stat, None
+
+
+def _sync_changed(path, file_stat, remote, checksum):
+    """
+    Returns whether a local file differs from its remote (size, mtime, sha256) copy: by size,
+    else by the mtime recorded on upload, else, with checksum, by content digest.
+    """
+
+    if remote is None:
+        return True
+    size, mtime, sha256 = remote
+    if size != file_stat.st_size:
+        return True
+    if mtime == str(file_stat.st_mtime_ns):
+        return False
+    return not checksum or sha256 is None or file_sha256(path) != sha256
 
 
 class Project:
     """
     Project provides access to managing buckets and objects.
 
+    A Project can be shared by many threads: libuplinkc project handles are safe for
+    concurrent use and the only python state, the optional cache, is locked. Uploads and
+    downloads opened from it are independent handles, one per thread.
+
     ...
 
     Attributes
@@ -24,9 +163,18 @@ class Project:
         Project _handle returned from libuplinkc project_result.project
     uplink : Uplink
         uplink object used to get access
+    cache : MetadataCache
+        cache of stat_object and stat_bucket results, None unless enabled by enable_cache.
+    retry : RetryPolicy
+        policy retrying stat_object, object listings and downloads, None unless enabled by
+        enable_retries.
 
     Methods
     -------
+    enable_cache():
+        MetadataCache
+    enable_retries():
+        RetryPolicy
     create_bucket():
         Bucket
     ensure_bucket():
@@ -35,27 +183,118 @@ class Project:
         Bucket
     list_buckets():
         list of Bucket
+    iterate_buckets():
+        generator of Bucket
     delete_bucket():
         Bucket
     stat_object():
         Object
+    stat_objects():
+        list of (str, Object)
     list_objects():
-        list of Object
+        list of Object or ObjectColumns
+    iterate_objects():
+        generator of Object
+    iterate_object_batches():
+        generator of ObjectColumns
     delete_object():
         Object
+    delete_objects():
+        list of DeleteResult
+    delete_prefix():
+        list of DeleteResult
     close():
         None
     upload_object():
         Upload
+    upload_stream():
+        UploadStream
+    begin_upload():
+        str
+    upload_part():
+        PartUpload
+    commit_upload():
+        Object
+    abort_upload():
+        None
+    upload_file_parallel():
+        Object
+    download_file_parallel():
+        Object
+    upload_file_dedup():
+        DedupResult
+    sync():
+        SyncResult
     download_object():
         Download
+    download_stream():
+        DownloadStream or io.BufferedReader
     """
 
-    def __init__(self, project, uplink):
+    def __init__(self, project, uplink, project_result=None):
         """Constructs all the necessary attributes for the Project object."""
 
         self.project = project
         self.uplink = uplink
+        # native project result is freed on close only, uploads and downloads opened from the
+        # project hold its handle and may outlive this object
+        self._project_result = project_result
+        self._closed = False
+        self.cache = None
+        self.retry = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def enable_cache(self, max_entries: int = 10000, ttl: float = 60.0):
+        """
+        function enables caching of stat_object and stat_bucket results in a least recently
+        used cache of max_entries results, each served for ttl seconds. Cached objects are
+        invalidated when they are deleted or uploaded again through this project.
+
+        Parameters
+        ----------
+        max_entries : int (optional)
+        ttl : float (optional)
+            seconds
+
+        Returns
+        -------
+        MetadataCache
+        """
+
+        self.cache = MetadataCache(max_entries, ttl)
+        return self.cache
+
+    def enable_retries(self, max_attempts: int = 5, base_delay: float = 0.1,
+                       max_delay: float = 10.0, jitter: float = 1.0, deadline: float = None):
+        """
+        function enables retries of the operations failing with InternalError or
+        TooManyRequestsError which are safe to repeat: stat_object, the pages of object
+        listings, opening downloads and reads, which resume the download from the last byte
+        read with DownloadOptions. Retries are counted by error code in the returned policy.
+
+        Parameters
+        ----------
+        max_attempts : int (optional)
+        base_delay : float (optional)
+            seconds waited before the first retry, doubled on every retry.
+        max_delay : float (optional)
+        jitter : float (optional)
+            fraction of the delay drawn at random.
+        deadline : float (optional)
+            seconds after the first attempt past which no retry is made.
+
+        Returns
+        -------
+        RetryPolicy
+        """
+
+        self.retry = RetryPolicy(max_attempts, base_delay, max_delay, jitter, deadline)
+        return self.retry
 
     def create_bucket(self, bucket_name: str):
         """
@@ -71,23 +310,20 @@ class Project:
         Bucket
         """
 
-        #
-        # declare types of arguments and response of the corresponding golang function
-        self.uplink.m_libuplink.uplink_create_bucket.argtypes = [ctypes.POINTER(_ProjectStruct),
-                                                                 ctypes.c_char_p]
-        self.uplink.m_libuplink.uplink_create_bucket.restype = _BucketResult
-        #
         # prepare the input for the function
         bucket_name_ptr = ctypes.c_char_p(bucket_name.encode('utf-8'))
 
         # create bucket by calling the exported golang function
         bucket_result = self.uplink.m_libuplink.uplink_create_bucket(self.project, bucket_name_ptr)
-        #
-        # if error occurred
-        if bool(bucket_result.error):
-            raise _storj_exception(bucket_result.error.contents.code,
-                                   bucket_result.error.contents.message.decode("utf-8"))
-        return self.uplink.bucket_from_result(bucket_result.bucket)
+        try:
+            #
+            # if error occurred
+            if bool(bucket_result.error):
+                raise _storj_exception(bucket_result.error.contents.code,
+                                       bucket_result.error.contents.message.decode("utf-8"))
+            return self.uplink.bucket_from_result(bucket_result.bucket)
+        finally:
+            self.uplink.m_libuplink.uplink_free_bucket_result(bucket_result)
 
     def ensure_bucket(self, bucket_name: str):
         """
@@ -104,23 +340,20 @@ class Project:
         Bucket
         """
 
-        #
-        # declare types of arguments and response of the corresponding golang function
-        self.uplink.m_libuplink.uplink_ensure_bucket.argtypes = [ctypes.POINTER(_ProjectStruct),
-                                                                 ctypes.c_char_p]
-        self.uplink.m_libuplink.uplink_ensure_bucket.restype = _BucketResult
-        #
         # prepare the input for the function
         bucket_name_ptr = ctypes.c_char_p(bucket_name.encode('utf-8'))
 
         # open bucket if doesn't exist by calling the exported golang function
         bucket_result = self.uplink.m_libuplink.uplink_ensure_bucket(self.project, bucket_name_ptr)
-        #
-        # if error occurred
-        if bool(bucket_result.error):
-            raise _storj_exception(bucket_result.error.contents.code,
-                                   bucket_result.error.contents.message.decode("utf-8"))
-        return self.uplink.bucket_from_result(bucket_result.bucket)
+        try:
+            #
+            # if error occurred
+            if bool(bucket_result.error):
+                raise _storj_exception(bucket_result.error.contents.code,
+                                       bucket_result.error.contents.message.decode("utf-8"))
+            return self.uplink.bucket_from_result(bucket_result.bucket)
+        finally:
+            self.uplink.m_libuplink.uplink_free_bucket_result(bucket_result)
 
     def stat_bucket(self, bucket_name: str):
         """
@@ -135,23 +368,29 @@ class Project:
         Bucket
         """
 
-        #
-        # declare types of arguments and response of the corresponding golang function
-        self.uplink.m_libuplink.uplink_stat_bucket.argtypes = [ctypes.POINTER(_ProjectStruct),
-                                                               ctypes.c_char_p]
-        self.uplink.m_libuplink.uplink_stat_bucket.restype = _BucketResult
-        #
+        cache = self.cache
+        if cache is not None:
+            bucket = cache.get(bucket_name)
+            if bucket is not None:
+                return bucket
+            generation = cache.generation()
         # prepare the input for the function
         bucket_name_ptr = ctypes.c_char_p(bucket_name.encode('utf-8'))
 
         # get bucket information by calling the exported golang function
         bucket_result = self.uplink.m_libuplink.uplink_stat_bucket(self.project, bucket_name_ptr)
-        #
-        # if error occurred
-        if bool(bucket_result.error):
-            raise _storj_exception(bucket_result.error.contents.code,
-                                   bucket_result.error.contents.message.decode("utf-8"))
-        return self.uplink.bucket_from_result(bucket_result.bucket)
+        try:
+            #
+            # if error occurred
+            if bool(bucket_result.error):
+                raise _storj_exception(bucket_result.error.contents.code,
+                                       bucket_result.error.contents.message.decode("utf-8"))
+            bucket = self.uplink.bucket_from_result(bucket_result.bucket)
+        finally:
+            self.uplink.m_libuplink.uplink_free_bucket_result(bucket_result)
+        if cache is not None:
+            cache.put(bucket_name, None, bucket, generation)
+        return bucket
 
     def list_buckets(self, list_bucket_options: ListBucketsOptions = None):
         """
@@ -166,82 +405,91 @@ class Project:
         list of Bucket
         """
 
-        #
-        # declare types of arguments and response of the corresponding golang function
-        self.uplink.m_libuplink.uplink_list_buckets.argtypes =\
-            [ctypes.POINTER(_ProjectStruct), ctypes.POINTER(_ListBucketsOptionsStruct)]
-        self.uplink.m_libuplink.uplink_list_buckets.restype =\
-            ctypes.POINTER(_BucketIterator)
-        #
-        self.uplink.m_libuplink.uplink_bucket_iterator_item.argtypes =\
-            [ctypes.POINTER(_BucketIterator)]
-        self.uplink.m_libuplink.uplink_bucket_iterator_item.restype =\
-            ctypes.POINTER(_BucketStruct)
-        #
-        self.uplink.m_libuplink.uplink_bucket_iterator_err.argtypes =\
-            [ctypes.POINTER(_BucketIterator)]
-        self.uplink.m_libuplink.uplink_bucket_iterator_err.restype =\
-            ctypes.POINTER(_Error)
-        #
-        self.uplink.m_libuplink.uplink_bucket_iterator_next.argtypes =\
-            [ctypes.POINTER(_BucketIterator)]
-        self.uplink.m_libuplink.uplink_bucket_iterator_next.restype =\
-            ctypes.c_bool
-        #
+        return list(self.iterate_buckets(list_bucket_options))
+
+    def iterate_buckets(self, list_bucket_options: ListBucketsOptions = None):
+        """
+        function returns a generator yielding buckets as the listing advances, without holding
+        the whole listing in memory.
+
+        The listing error, if any, is raised once all buckets have been yielded. The native
+        iterator is released when the generator is exhausted, closed or garbage collected.
+        To resume a listing pass the name of the last bucket seen as ListBucketsOptions cursor.
+
+        Parameters
+        ----------
+        list_bucket_options : ListBucketsOptions (optional)
+
+        Returns
+        -------
+        generator of Bucket
+        """
+
         # prepare the input for the function
         if list_bucket_options is None:
             list_bucket_options_obj = ctypes.POINTER(_ListBucketsOptionsStruct)()
         else:
             list_bucket_options_obj = ctypes.byref(list_bucket_options.get_structure())
 
-        # get bucket list by calling the exported golang function
+        # get bucket iterator by calling the exported golang function
         bucket_iterator = self.uplink.m_libuplink.uplink_list_buckets(self.project,
                                                                       list_bucket_options_obj)
-
-        bucket_iterator_err = self.uplink.m_libuplink.uplink_bucket_iterator_err(bucket_iterator)
-        if bool(bucket_iterator_err):
-            raise _storj_exception(bucket_iterator_err.contents.code,
-                                   bucket_iterator_err.contents.message.decode("utf-8"))
-
-        bucket_list = list()
-        while self.uplink.m_libuplink.uplink_bucket_iterator_next(bucket_iterator):
-            bucket = self.uplink.m_libuplink.uplink_bucket_iterator_item(bucket_iterator)
-            bucket_list.append(self.uplink.bucket_from_result(bucket))
-
-        return bucket_list
-
-    def delete_bucket(self, bucket_name: str):
+        try:
+            while self.uplink.m_libuplink.uplink_bucket_iterator_next(bucket_iterator):
+                bucket = self.uplink.m_libuplink.uplink_bucket_iterator_item(bucket_iterator)
+                try:
+                    bucket_ = self.uplink.bucket_from_result(bucket)
+                finally:
+                    self.uplink.m_libuplink.uplink_free_bucket(bucket)
+                yield bucket_
+            #
+            # if error occurred while listing
+            iterator_err = self.uplink.m_libuplink.uplink_bucket_iterator_err(bucket_iterator)
+            if bool(iterator_err):
+                exception = _storj_exception(iterator_err.contents.code,
+                                             iterator_err.contents.message.decode("utf-8"))
+                self.uplink.m_libuplink.uplink_free_error(iterator_err)
+                raise exception
+        finally:
+            self.uplink.m_libuplink.uplink_free_bucket_iterator(bucket_iterator)
+
+    def delete_bucket(self, bucket_name: str, force: bool = False, concurrency: int = 8):
         """
         function deletes a bucket.
 
-        When bucket is not empty it throws BucketNotEmptyError exception.
+        When bucket is not empty it throws BucketNotEmptyError exception, unless force is set,
+        in which case all its objects are deleted first with delete_prefix.
 
         Parameters
         ----------
         bucket_name : str
+        force : bool (optional)
+        concurrency : int (optional)
+            number of objects deleted at the same time when force is set.
 
         Returns
         -------
         Bucket
         """
 
-        #
-        # declare types of arguments and response of the corresponding golang function
-        self.uplink.m_libuplink.uplink_delete_bucket.argtypes = [ctypes.POINTER(_ProjectStruct),
-                                                                 ctypes.c_char_p]
-        self.uplink.m_libuplink.uplink_delete_bucket.restype = _BucketResult
-        #
+        if force:
+            self.delete_prefix(bucket_name, "", concurrency)
         # prepare the input for the function
         bucket_name_ptr = ctypes.c_char_p(bucket_name.encode('utf-8'))
 
         # delete bucket by calling the exported golang function
         bucket_result = self.uplink.m_libuplink.uplink_delete_bucket(self.project, bucket_name_ptr)
-        #
-        # if error occurred
-        if bool(bucket_result.error):
-            raise _storj_exception(bucket_result.error.contents.code,
-                                   bucket_result.error.contents.message.decode("utf-8"))
-        return self.uplink.bucket_from_result(bucket_result.bucket)
+        if self.cache is not None:
+            self.cache.invalidate_bucket(bucket_name)
+        try:
+            #
+            # if error occurred
+            if bool(bucket_result.error):
+                raise _storj_exception(bucket_result.error.contents.code,
+                                       bucket_result.error.contents.message.decode("utf-8"))
+            return self.uplink.bucket_from_result(bucket_result.bucket)
+        finally:
+            self.uplink.m_libuplink.uplink_free_bucket_result(bucket_result)
 
     def stat_object(self, bucket_name: str, storj_path: str):
         """
@@ -257,12 +505,23 @@ class Project:
         Object
         """
 
-        #
-        # declare types of arguments and response of the corresponding golang function
-        self.uplink.m_libuplink.uplink_stat_object.argtypes = [ctypes.POINTER(_ProjectStruct),
-                                                               ctypes.c_char_p, ctypes.c_char_p]
-        self.uplink.m_libuplink.uplink_stat_object.restype = _ObjectResult
-        #
+        cache = self.cache
+        if cache is not None:
+            object_ = cache.get(bucket_name, storj_path)
+            if object_ is not None:
+                return object_
+            generation = cache.generation()
+        if self.retry is None:
+            object_ = self._stat_object(bucket_name, storj_path)
+        else:
+            object_ = self.retry.call(self._stat_object, bucket_name, storj_path)
+        if cache is not None:
+            cache.put(bucket_name, storj_path, object_, generation)
+        return object_
+
+    def _stat_object(self, bucket_name, storj_path):
+        """stats one object through libuplinkc."""
+
         # prepare the input for the function
         bucket_name_ptr = ctypes.c_char_p(bucket_name.encode('utf-8'))
         storj_path_ptr = ctypes.c_char_p(storj_path.encode('utf-8'))
@@ -270,50 +529,164 @@ class Project:
         # get object information by calling the exported golang function
         object_result = self.uplink.m_libuplink.uplink_stat_object(self.project, bucket_name_ptr,
                                                                    storj_path_ptr)
-        #
-        # if error occurred
-        if bool(object_result.error):
-            raise _storj_exception(object_result.error.contents.code,
-                                   object_result.error.contents.message.decode("utf-8"))
-        return self.uplink.object_from_result(object_result.object)
+        try:
+            #
+            # if error occurred
+            if bool(object_result.error):
+                raise _storj_exception(object_result.error.contents.code,
+                                       object_result.error.contents.message.decode("utf-8"))
+            return self.uplink.object_from_result(object_result.object)
+        finally:
+            self.uplink.m_libuplink.uplink_free_object_result(object_result)
+
+    def stat_objects(self, bucket_name: str, keys, concurrency: int = 8, ordered: bool = True):
+        """
+        function returns information about the objects at the given keys, stat'ing
+        concurrency of them at the same time. Keys without an object map to None instead of
+        raising ObjectNotFoundError, other errors are raised.
+
+        keys can be any iterable, including a generator, it is consumed as the stats progress
+        with at most twice concurrency of them queued.
+
+        Parameters
+        ----------
+        bucket_name : str
+        keys : iterable of str
+        concurrency : int (optional)
+        ordered : bool (optional)
+            results in the order of keys when True, as they complete otherwise.
+
+        Returns
+        -------
+        list of (str, Object)
+            key and its Object, or None when there is no object at the key.
+        """
 
-    def list_objects(self, bucket_name: str, list_object_options: ListObjectsOptions = None):
+        stat = functools.partial(self._stat_object_or_none, bucket_name)
+        return list(_map_bounded(stat, keys, concurrency, ordered))
+
+    def _stat_object_or_none(self, bucket_name, storj_path):
+        """stats one object, returning None when it does not exist."""
+
+        try:
+            return self.stat_object(bucket_name, storj_path)
+        except ObjectNotFoundError:
+            return None
+
+    def list_objects(self, bucket_name: str, list_object_options: ListObjectsOptions = None,
+                     columnar: bool = False):
         """
         function returns a list of objects with all its information.
 
+        With columnar=True the listing is returned as one ObjectColumns, holding keys and
+        int64 arrays of created, expires and content_length instead of an Object per key.
+        Custom metadata is only collected when list_object_options has custom=True.
+
         Parameters
         ----------
         bucket_name : str
         list_object_options : ListObjectsOptions (optional)
+        columnar : bool (optional)
 
         Returns
         -------
-        list of Object
+        list of Object or ObjectColumns
         """
 
-        #
-        # declare types of arguments and response of the corresponding golang function
-        self.uplink.m_libuplink.uplink_list_objects.argtypes =\
-            [ctypes.POINTER(_ProjectStruct), ctypes.c_char_p,
-             ctypes.POINTER(_ListObjectsOptionsStruct)]
-        self.uplink.m_libuplink.uplink_list_objects.restype =\
-            ctypes.POINTER(_ObjectIterator)
-        #
-        self.uplink.m_libuplink.uplink_object_iterator_item.argtypes =\
-            [ctypes.POINTER(_ObjectIterator)]
-        self.uplink.m_libuplink.uplink_object_iterator_item.restype =\
-            ctypes.POINTER(_ObjectStruct)
-        #
-        self.uplink.m_libuplink.uplink_object_iterator_err.argtypes =\
-            [ctypes.POINTER(_ObjectIterator)]
-        self.uplink.m_libuplink.uplink_object_iterator_err.restype =\
-            ctypes.POINTER(_Error)
-        #
-        self.uplink.m_libuplink.uplink_object_iterator_next.argtypes =\
-            [ctypes.POINTER(_ObjectIterator)]
-        self.uplink.m_libuplink.uplink_object_iterator_next.restype =\
-            ctypes.c_bool
-        #
+        if columnar:
+            columns = ObjectColumns(custom=list_object_options is not None and
+                                    list_object_options.custom)
+            for object_ in self._iterate_object_structs(bucket_name, list_object_options):
+                columns.append(object_.contents)
+            return columns
+        return list(self.iterate_objects(bucket_name, list_object_options))
+
+    def iterate_objects(self, bucket_name: str, list_object_options: ListObjectsOptions = None):
+        """
+        function returns a generator yielding objects as the listing advances, without holding
+        the whole listing in memory.
+
+        The listing error, if any, is raised once all objects have been yielded. The native
+        iterator is released when the generator is exhausted, closed or garbage collected.
+        To resume a listing pass the key of the last object seen as ListObjectsOptions cursor.
+
+        Parameters
+        ----------
+        bucket_name : str
+        list_object_options : ListObjectsOptions (optional)
+
+        Returns
+        -------
+        generator of Object
+        """
+
+        for object_ in self._iterate_object_structs(bucket_name, list_object_options):
+            yield self.uplink.object_from_result(object_)
+
+    def iterate_object_batches(self, bucket_name: str,
+                               list_object_options: ListObjectsOptions = None,
+                               batch_size: int = 10000):
+        """
+        function returns a generator yielding the listing as ObjectColumns batches of up to
+        batch_size objects, see list_objects with columnar=True.
+
+        Parameters
+        ----------
+        bucket_name : str
+        list_object_options : ListObjectsOptions (optional)
+        batch_size : int (optional)
+
+        Returns
+        -------
+        generator of ObjectColumns
+        """
+
+        custom = list_object_options is not None and list_object_options.custom
+        columns = ObjectColumns(custom=custom)
+        for object_ in self._iterate_object_structs(bucket_name, list_object_options):
+            columns.append(object_.contents)
+            if len(columns) == batch_size:
+                yield columns
+                columns = ObjectColumns(custom=custom)
+        if len(columns):
+            yield columns
+
+    def _iterate_object_structs(self, bucket_name: str,
+                                list_object_options: ListObjectsOptions = None):
+        """
+        generator yielding the native _ObjectStruct pointers of a listing, each one is freed
+        as soon as the consumer asks for the next one. With retries enabled, a listing
+        failing with a retryable error is listed again from the last key yielded.
+        """
+
+        retry = self.retry
+        if retry is None:
+            yield from self._list_object_structs(bucket_name, list_object_options)
+            return
+        options = list_object_options or ListObjectsOptions()
+        start, attempt, cursor = time.monotonic(), 0, None
+        while True:
+            try:
+                for object_ in self._list_object_structs(bucket_name, options):
+                    cursor = object_.contents.key
+                    yield object_
+                return
+            except retry.retryable as exception:
+                attempt += 1
+                if cursor is not None:
+                    # the listing progressed, count attempts from the last failure
+                    start, attempt = time.monotonic(), 1
+                if not retry.retry(exception, attempt, start):
+                    raise
+                if cursor is not None:
+                    options = ListObjectsOptions(options.prefix, cursor.decode("utf-8"),
+                                                 options.recursive, options.system,
+                                                 options.custom)
+                    cursor = None
+
+    def _list_object_structs(self, bucket_name, list_object_options):
+        """generator yielding the native _ObjectStruct pointers of one libuplinkc listing."""
+
         # prepare the input for the function
         if list_object_options is None:
             list_object_options_obj = ctypes.POINTER(_ListObjectsOptionsStruct)()
@@ -321,20 +694,26 @@ class Project:
             list_object_options_obj = ctypes.byref(list_object_options.get_structure())
         bucket_name_ptr = ctypes.c_char_p(bucket_name.encode('utf-8'))
 
-        # get object list by calling the exported golang function
+        # get object iterator by calling the exported golang function
         object_iterator = self.uplink.m_libuplink.uplink_list_objects(self.project, bucket_name_ptr,
                                                                       list_object_options_obj)
-
-        object_iterator_err = self.uplink.m_libuplink.uplink_object_iterator_err(object_iterator)
-        if bool(object_iterator_err):
-            raise _storj_exception(object_iterator_err.contents.code,
-                                   object_iterator_err.contents.message.decode("utf-8"))
-
-        object_list = list()
-        while self.uplink.m_libuplink.uplink_object_iterator_next(object_iterator):
-            object_ = self.uplink.m_libuplink.uplink_object_iterator_item(object_iterator)
-            object_list.append(self.uplink.object_from_result(object_))
-        return object_list
+        try:
+            while self.uplink.m_libuplink.uplink_object_iterator_next(object_iterator):
+                object_ = self.uplink.m_libuplink.uplink_object_iterator_item(object_iterator)
+                try:
+                    yield object_
+                finally:
+                    self.uplink.m_libuplink.uplink_free_object(object_)
+            #
+            # if error occurred while listing
+            iterator_err = self.uplink.m_libuplink.uplink_object_iterator_err(object_iterator)
+            if bool(iterator_err):
+                exception = _storj_exception(iterator_err.contents.code,
+                                             iterator_err.contents.message.decode("utf-8"))
+                self.uplink.m_libuplink.uplink_free_error(iterator_err)
+                raise exception
+        finally:
+            self.uplink.m_libuplink.uplink_free_object_iterator(object_iterator)
 
     def delete_object(self, bucket_name: str, storj_path: str):
         """
@@ -348,14 +727,9 @@ class Project:
         Returns
         -------
         Object
+            None when libuplinkc reports no object at the key without an error.
         """
 
-        #
-        # declare types of arguments and response of the corresponding golang function
-        self.uplink.m_libuplink.uplink_delete_object.argtypes = [ctypes.POINTER(_ProjectStruct),
-                                                                 ctypes.c_char_p, ctypes.c_char_p]
-        self.uplink.m_libuplink.uplink_delete_object.restype = _ObjectResult
-        #
         # prepare the input for the function
         bucket_name_ptr = ctypes.c_char_p(bucket_name.encode('utf-8'))
         storj_path_ptr = ctypes.c_char_p(storj_path.encode('utf-8'))
@@ -363,36 +737,101 @@ class Project:
         # delete object by calling the exported golang function
         object_result = self.uplink.m_libuplink.uplink_delete_object(self.project, bucket_name_ptr,
                                                                      storj_path_ptr)
-        #
-        # if error occurred
-        if bool(object_result.error):
-            raise _storj_exception(object_result.error.contents.code,
-                                   object_result.error.contents.message.decode("utf-8"))
-        return self.uplink.object_from_result(object_result.object)
+        if self.cache is not None:
+            self.cache.invalidate(bucket_name, storj_path)
+        try:
+            #
+            # if error occurred
+            if bool(object_result.error):
+                raise _storj_exception(object_result.error.contents.code,
+                                       object_result.error.contents.message.decode("utf-8"))
+            if not object_result.object:
+                return None
+            return self.uplink.object_from_result(object_result.object)
+        finally:
+            self.uplink.m_libuplink.uplink_free_object_result(object_result)
+
+    def delete_objects(self, bucket_name: str, keys, concurrency: int = 8):
+        """
+        function deletes the objects at the given keys, concurrency of them at the same time.
+
+        keys can be any iterable, including a generator, it is consumed as the deletes
+        progress with at most twice concurrency deletes queued, so a listing can be streamed
+        into it. A failing key does not stop the others, its error is reported instead.
+
+        Parameters
+        ----------
+        bucket_name : str
+        keys : iterable of str
+        concurrency : int (optional)
+
+        Returns
+        -------
+        list of DeleteResult
+            one per key, in the order of keys.
+        """
+
+        delete = functools.partial(self._delete_object_result, bucket_name)
+        return [result for _, result in _map_bounded(delete, keys, concurrency)]
+
+    def delete_prefix(self, bucket_name: str, prefix: str, concurrency: int = 8):
+        """
+        function deletes all the objects whose key starts with prefix, listing them
+        recursively while they are deleted by delete_objects.
+
+        Parameters
+        ----------
+        bucket_name : str
+        prefix : str
+            as in ListObjectsOptions, empty for the whole bucket or ending with slash.
+        concurrency : int (optional)
+
+        Returns
+        -------
+        list of DeleteResult
+        """
+
+        objects = self.iterate_objects(bucket_name, ListObjectsOptions(prefix=prefix,
+                                                                       recursive=True))
+        return self.delete_objects(bucket_name, (object_.key for object_ in objects
+                                                 if not object_.is_prefix), concurrency)
+
+    def _delete_object_result(self, bucket_name, storj_path):
+        """deletes one object, reporting its error instead of raising it."""
+
+        try:
+            return DeleteResult(storj_path, self.delete_object(bucket_name, storj_path))
+        except StorjException as exception:
+            return DeleteResult(storj_path, error=exception)
 
     def close(self):
         """
-        function closes the project and all associated resources.
+        function closes the project and all associated resources, closing it again does
+        nothing.
 
         Returns
         -------
         None
         """
-        #
-        # declare types of arguments and response of the corresponding golang function
-        self.uplink.m_libuplink.uplink_close_project.argtypes = [ctypes.POINTER(_ProjectStruct)]
-        self.uplink.m_libuplink.uplink_close_project.restype = ctypes.POINTER(_Error)
-        #
+        if self._closed:
+            return
+        self._closed = True
         # close Storj project by calling the exported golang function
         error = self.uplink.m_libuplink.uplink_close_project(self.project)
+        if self._project_result is not None:
+            self.uplink.m_libuplink.uplink_free_project_result(self._project_result)
+            self._project_result = None
         #
         # if error occurred
         if bool(error):
-            raise _storj_exception(error.contents.code,
-                                   error.contents.message.decode("utf-8"))
+            exception = _storj_exception(error.contents.code,
+                                         error.contents.message.decode("utf-8"))
+            self.uplink.m_libuplink.uplink_free_error(error)
+            raise exception
 
     def upload_object(self, bucket_name: str, storj_path: str,
-                      upload_options: UploadOptions = None):
+                      upload_options: UploadOptions = None, compression: Compression = None,
+                      checksums=None):
         """
         function starts an upload to the specified key.
 
@@ -401,18 +840,16 @@ class Project:
         bucket_name : str
         storj_path : str
         upload_options : UploadOptions (optional)
+        compression : Compression (optional)
+            codec the data written is compressed with, recorded in custom metadata.
+        checksums : list of str (optional)
+            names of the checksums computed as data is written and recorded in custom
+            metadata: "sha256", "crc32", and "crc32c" when the crc32c package is installed.
 
         Returns
         -------
         Upload
         """
-        #
-        # declare types of arguments and response of the corresponding golang function
-        self.uplink.m_libuplink.uplink_upload_object.argtypes =\
-            [ctypes.POINTER(_ProjectStruct), ctypes.c_char_p, ctypes.c_char_p,
-             ctypes.POINTER(_UploadOptionsStruct)]
-        self.uplink.m_libuplink.uplink_upload_object.restype = _UploadResult
-        #
         # prepare the input for the function
         if upload_options is None:
             upload_options_obj = ctypes.POINTER(_UploadOptionsStruct)()
@@ -429,32 +866,69 @@ class Project:
         #
         # if error occurred
         if bool(upload_result.error):
-            raise _storj_exception(upload_result.error.contents.code,
-                                   upload_result.error.contents.message.decode("utf-8"))
-        return Upload(upload_result.upload, self.uplink)
+            exception = _storj_exception(upload_result.error.contents.code,
+                                         upload_result.error.contents.message.decode("utf-8"))
+            self.uplink.m_libuplink.uplink_free_upload_result(upload_result)
+            raise exception
+        on_commit = None
+        if self.cache is not None:
+            on_commit = functools.partial(self.cache.invalidate, bucket_name, storj_path)
+        return Upload(upload_result.upload, self.uplink, upload_result, on_commit, compression,
+                      checksums)
 
     def download_object(self, bucket_name: str, storj_path: str,
-                        download_options: DownloadOptions = None):
+                        download_options: DownloadOptions = None, decompress: bool = True,
+                        verify: bool = True):
         """
         function starts download to the specified key.
 
+        An object uploaded with compression is decompressed as it is read, unless
+        decompress is False or download_options select a range of the stored data.
+        The checksums recorded by an upload are computed as the object is read and verified
+        at its end, unless verify is False or download_options select a range.
+
         Parameters
         ----------
         bucket_name : str
         storj_path : str
         download_options : DownloadOptions (optional)
+        decompress : bool (optional)
+        verify : bool (optional)
 
         Returns
         -------
         Download
         """
-        #
-        # declare types of arguments and response of the corresponding golang function
-        self.uplink.m_libuplink.uplink_download_object.argtypes =\
-            [ctypes.POINTER(_ProjectStruct), ctypes.c_char_p, ctypes.c_char_p,
-             ctypes.POINTER(_DownloadOptionsStruct)]
-        self.uplink.m_libuplink.uplink_download_object.restype = _DownloadResult
-        #
+
+        if self.retry is None:
+            download_result = self._open_download(bucket_name, storj_path, download_options)
+        else:
+            download_result = self.retry.call(self._open_download, bucket_name, storj_path,
+                                              download_options)
+        if download_options is not None and (download_options.offset or
+                                             download_options.length >= 0):
+            decompress = verify = False
+        reopen = functools.partial(self._reopen_download, bucket_name, storj_path,
+                                   download_options)
+        return Download(download_result.download, self.uplink, self.project,
+                        ctypes.c_char_p(bucket_name.encode('utf-8')),
+                        ctypes.c_char_p(storj_path.encode('utf-8')), download_result, decompress,
+                        verify, self.retry, reopen)
+
+    def _reopen_download(self, bucket_name, storj_path, download_options, position):
+        """opens the download again, position bytes after the start of the range first read."""
+
+        offset, length = 0, -1
+        if download_options is not None:
+            offset, length = download_options.offset, download_options.length
+        if length >= 0:
+            length -= position
+        return self._open_download(bucket_name, storj_path,
+                                   DownloadOptions(offset + position, length))
+
+    def _open_download(self, bucket_name, storj_path, download_options):
+        """opens a native download, returning its download result."""
+
         # prepare the input for the function
         if download_options is None:
             download_options_obj = ctypes.POINTER(_DownloadOptionsStruct)()
@@ -472,7 +946,614 @@ class Project:
         #
         # if error occurred
         if bool(download_result.error):
-            raise _storj_exception(download_result.error.contents.code,
-                                   download_result.error.contents.message.decode("utf-8"))
-        return Download(download_result.download, self.uplink, self.project, bucket_name_ptr,
-                        storj_path_ptr)
+            exception = _storj_exception(download_result.error.contents.code,
+                                         download_result.error.contents.message.decode("utf-8"))
+            self.uplink.m_libuplink.uplink_free_download_result(download_result)
+            raise exception
+        return download_result
+
+    def download_stream(self, bucket_name: str, storj_path: str,
+                        buffer_size: int = COPY_BUFSIZE):
+        """
+        function opens the object at the specified key as a seekable binary file object.
+
+        Seeking re-opens the download at the new offset using DownloadOptions.
+
+        Parameters
+        ----------
+        bucket_name : str
+        storj_path : str
+        buffer_size : int (optional)
+            size of the io.BufferedReader wrapping the stream, 0 returns the raw stream.
+
+        Returns
+        -------
+        io.BufferedReader or DownloadStream
+        """
+
+        stream = DownloadStream(self, bucket_name, storj_path)
+        if not buffer_size:
+            return stream
+        return io.BufferedReader(stream, buffer_size)
+
+    def upload_stream(self, bucket_name: str, storj_path: str,
+                      upload_options: UploadOptions = None, buffer_size: int = COPY_BUFSIZE,
+                      compression: Compression = None, checksums=None):
+        """
+        function starts an upload to the specified key as a writable binary file object.
+
+        The upload is committed when the stream is closed, and aborted when a with block
+        exits with an exception.
+
+        Parameters
+        ----------
+        bucket_name : str
+        storj_path : str
+        upload_options : UploadOptions (optional)
+        buffer_size : int (optional)
+            writes smaller than buffer_size are coalesced into buffer_size sized writes.
+        compression : Compression (optional)
+        checksums : list of str (optional)
+
+        Returns
+        -------
+        UploadStream
+        """
+
+        return UploadStream(self.upload_object(bucket_name, storj_path, upload_options,
+                                               compression, checksums), buffer_size)
+
+    def begin_upload(self, bucket_name: str, storj_path: str,
+                     upload_options: UploadOptions = None):
+        """
+        function begins a new multipart upload to the specified key.
+
+        Parameters
+        ----------
+        bucket_name : str
+        storj_path : str
+        upload_options : UploadOptions (optional)
+
+        Returns
+        -------
+        str
+            upload id of the multipart upload.
+        """
+        if not hasattr(self.uplink.m_libuplink, "uplink_begin_upload"):
+            raise InternalError("libuplinkc does not export the multipart upload functions")
+        # prepare the input for the function
+        if upload_options is None:
+            upload_options_obj = ctypes.POINTER(_UploadOptionsStruct)()
+        else:
+            upload_options_obj = ctypes.byref(upload_options.get_structure())
+
+        bucket_name_ptr = ctypes.c_char_p(bucket_name.encode('utf-8'))
+        storj_path_ptr = ctypes.c_char_p(storj_path.encode('utf-8'))
+
+        # begin multipart upload by calling the exported golang function
+        upload_info_result = self.uplink.m_libuplink.uplink_begin_upload(self.project,
+                                                                         bucket_name_ptr,
+                                                                         storj_path_ptr,
+                                                                         upload_options_obj)
+        try:
+            #
+            # if error occurred
+            if bool(upload_info_result.error):
+                raise _storj_exception(upload_info_result.error.contents.code,
+                                       upload_info_result.error.contents.message.decode("utf-8"))
+            return upload_info_result.info.contents.upload_id.decode("utf-8")
+        finally:
+            self.uplink.m_libuplink.uplink_free_upload_info_result(upload_info_result)
+
+    def upload_part(self, bucket_name: str, storj_path: str, upload_id: str, part_number: int):
+        """
+        function starts an upload of one part of a multipart upload.
+
+        Parameters
+        ----------
+        bucket_name : str
+        storj_path : str
+        upload_id : str
+        part_number : int
+
+        Returns
+        -------
+        PartUpload
+        """
+        # prepare the input for the function
+        bucket_name_ptr = ctypes.c_char_p(bucket_name.encode('utf-8'))
+        storj_path_ptr = ctypes.c_char_p(storj_path.encode('utf-8'))
+        upload_id_ptr = ctypes.c_char_p(upload_id.encode('utf-8'))
+        part_number_obj = ctypes.c_uint32(part_number)
+
+        # get part uploader by calling the exported golang function
+        part_upload_result = self.uplink.m_libuplink.uplink_upload_part(self.project,
+                                                                        bucket_name_ptr,
+                                                                        storj_path_ptr,
+                                                                        upload_id_ptr,
+                                                                        part_number_obj)
+        #
+        # if error occurred
+        if bool(part_upload_result.error):
+            exception = _storj_exception(part_upload_result.error.contents.code,
+                                         part_upload_result.error.contents.message.decode("utf-8"))
+            self.uplink.m_libuplink.uplink_free_part_upload_result(part_upload_result)
+            raise exception
+        return PartUpload(part_upload_result.part_upload, self.uplink, part_upload_result)
+
+    def commit_upload(self, bucket_name: str, storj_path: str, upload_id: str,
+                      commit_upload_options: CommitUploadOptions = None):
+        """
+        function commits a multipart upload, assembling its parts into one object.
+
+        Parameters
+        ----------
+        bucket_name : str
+        storj_path : str
+        upload_id : str
+        commit_upload_options : CommitUploadOptions (optional)
+
+        Returns
+        -------
+        Object
+        """
+        # prepare the input for the function
+        if commit_upload_options is None:
+            commit_upload_options_obj = ctypes.POINTER(_CommitUploadOptionsStruct)()
+        else:
+            commit_upload_options_obj = ctypes.byref(commit_upload_options.get_structure())
+
+        bucket_name_ptr = ctypes.c_char_p(bucket_name.encode('utf-8'))
+        storj_path_ptr = ctypes.c_char_p(storj_path.encode('utf-8'))
+        upload_id_ptr = ctypes.c_char_p(upload_id.encode('utf-8'))
+
+        # commit multipart upload by calling the exported golang function
+        commit_result = self.uplink.m_libuplink.uplink_commit_upload(self.project,
+                                                                     bucket_name_ptr,
+                                                                     storj_path_ptr,
+                                                                     upload_id_ptr,
+                                                                     commit_upload_options_obj)
+        if self.cache is not None:
+            self.cache.invalidate(bucket_name, storj_path)
+        try:
+            #
+            # if error occurred
+            if bool(commit_result.error):
+                raise _storj_exception(commit_result.error.contents.code,
+                                       commit_result.error.contents.message.decode("utf-8"))
+            return self.uplink.object_from_result(commit_result.object)
+        finally:
+            self.uplink.m_libuplink.uplink_free_commit_upload_result(commit_result)
+
+    def abort_upload(self, bucket_name: str, storj_path: str, upload_id: str):
+        """
+        function aborts a multipart upload, discarding its uploaded parts.
+
+        Parameters
+        ----------
+        bucket_name : str
+        storj_path : str
+        upload_id : str
+
+        Returns
+        -------
+        None
+        """
+        # prepare the input for the function
+        bucket_name_ptr = ctypes.c_char_p(bucket_name.encode('utf-8'))
+        storj_path_ptr = ctypes.c_char_p(storj_path.encode('utf-8'))
+        upload_id_ptr = ctypes.c_char_p(upload_id.encode('utf-8'))
+
+        # abort multipart upload by calling the exported golang function
+        error = self.uplink.m_libuplink.uplink_abort_upload(self.project, bucket_name_ptr,
+                                                            storj_path_ptr, upload_id_ptr)
+        #
+        # if error occurred
+        if bool(error):
+            exception = _storj_exception(error.contents.code,
+                                         error.contents.message.decode("utf-8"))
+            self.uplink.m_libuplink.uplink_free_error(error)
+            raise exception
+
+    def upload_file_parallel(self, bucket_name: str, storj_path: str, file_path: str,
+                             part_size: int = PART_SIZE, workers: int = 4,
+                             upload_options: UploadOptions = None,
+                             commit_upload_options: CommitUploadOptions = None,
+                             progress=None):
+        """
+        function uploads a local file as one object, in parts of part_size bytes uploaded
+        concurrently by workers threads through a multipart upload.
+
+        libuplinkc releases the GIL during its calls, so parts are read and uploaded in
+        parallel. If any part fails, the remaining parts are stopped and the multipart upload
+        is aborted before the error is raised. With a libuplinkc which does not export the
+        multipart upload functions, as v1.2.2 does not, the file is uploaded sequentially by
+        a single upload instead.
+
+        Parameters
+        ----------
+        bucket_name : str
+        storj_path : str
+        file_path : str
+        part_size : int (optional)
+        workers : int (optional)
+        upload_options : UploadOptions (optional)
+        commit_upload_options : CommitUploadOptions (optional)
+        progress : callable (optional)
+            called as progress(bytes_uploaded, total_bytes) after every write.
+
+        Returns
+        -------
+        Object
+        """
+
+        total_size = os.path.getsize(file_path)
+        if not hasattr(self.uplink.m_libuplink, "uplink_begin_upload"):
+            return self._upload_file_sequential(bucket_name, storj_path, file_path, total_size,
+                                                upload_options, commit_upload_options, progress)
+        parts = [(part_number, offset, min(part_size, total_size - offset))
+                 for part_number, offset in enumerate(range(0, total_size or 1, part_size), 1)]
+        upload_id = self.begin_upload(bucket_name, storj_path, upload_options)
+
+        cancel = threading.Event()
+        lock = threading.Lock()
+        uploaded = [0]
+
+        def report(size):
+            with lock:
+                uploaded[0] += size
+                if progress is not None:
+                    progress(uploaded[0], total_size)
+
+        executor = concurrent.futures.ThreadPoolExecutor(max(1, workers))
+        futures = list()
+        try:
+            try:
+                futures = [executor.submit(self._upload_file_part, bucket_name, storj_path,
+                                           upload_id, file_path, part, cancel, report)
+                           for part in parts]
+                for future in concurrent.futures.as_completed(futures):
+                    future.result()
+            except BaseException:
+                cancel.set()
+                for future in futures:
+                    future.cancel()
+                raise
+            finally:
+                # no part is left running once the upload is committed or aborted
+                executor.shutdown()
+            return self.commit_upload(bucket_name, storj_path, upload_id,
+                                      commit_upload_options)
+        except BaseException:
+            try:
+                self.abort_upload(bucket_name, storj_path, upload_id)
+            except StorjException:
+                pass
+            raise
+
+    def _upload_file_sequential(self, bucket_name, storj_path, file_path, total_size,
+                                upload_options, commit_upload_options, progress):
+        """uploads the file by a single upload, where multipart uploads are not available."""
+
+        uploaded = 0
+        buf = bytearray(PART_BUFSIZE)
+        with open(file_path, 'rb') as file_handle, memoryview(buf) as view, \
+                self.upload_object(bucket_name, storj_path, upload_options) as upload:
+            if commit_upload_options is not None and \
+                    commit_upload_options.custom_metadata is not None:
+                upload.set_custom_metadata(commit_upload_options.custom_metadata)
+            while True:
+                bytes_read = file_handle.readinto(view)
+                if not bytes_read:
+                    break
+                upload.write(view[:bytes_read], bytes_read)
+                uploaded += bytes_read
+                if progress is not None:
+                    progress(uploaded, total_size)
+            upload.commit()
+            return upload.info()
+
+    def _upload_file_part(self, bucket_name, storj_path, upload_id, file_path, part, cancel,
+                          report):
+        """uploads length bytes of the file from offset as one part, unless cancelled."""
+
+        part_number, offset, length = part
+        buf = bytearray(min(length, PART_BUFSIZE) or 1)
+        with open(file_path, 'rb') as file_handle, memoryview(buf) as view:
+            file_handle.seek(offset)
+            with self.upload_part(bucket_name, storj_path, upload_id, part_number) as part_upload:
+                while length > 0:
+                    if cancel.is_set():
+                        part_upload.abort()
+                        return
+                    bytes_read = file_handle.readinto(view[:min(length, len(buf))])
+                    if not bytes_read:
+                        raise InternalError("unexpected end of file " + file_path)
+                    part_upload.write(view[:bytes_read], bytes_read)
+                    length -= bytes_read
+                    report(bytes_read)
+
+    def download_file_parallel(self, bucket_name: str, storj_path: str, file_path: str,
+                               segment_size: int = SEGMENT_SIZE, workers: int = 4,
+                               retries: int = 3, progress=None):
+        """
+        function downloads an object to a local file, in segments of segment_size bytes
+        downloaded concurrently by workers threads through ranged downloads.
+
+        The file is preallocated to the size of the object and every segment is written at
+        its offset with os.pwrite, so segments complete in any order without seeking. A
+        segment failing with a transient error is resumed from its last written byte, up to
+        retries times, or as the retry policy of the project decides when retries are
+        enabled. The size of the object is taken past the cache, so a stale cached size does
+        not truncate the file. If a segment fails for good, the others are stopped and the error is
+        raised, leaving the file incomplete. An object uploaded with compression is
+        decompressed by a single download instead, without progress reports. Checksums are
+        only verified by that single download.
+
+        Parameters
+        ----------
+        bucket_name : str
+        storj_path : str
+        file_path : str
+        segment_size : int (optional)
+        workers : int (optional)
+        retries : int (optional)
+            number of times a failed segment is opened again, without a retry policy.
+        progress : callable (optional)
+            called as progress(bytes_downloaded, total_bytes) after every write.
+
+        Returns
+        -------
+        Object
+        """
+
+        # a cached size may be stale, segments past the current end would fail
+        if self.retry is None:
+            object_ = self._stat_object(bucket_name, storj_path)
+        else:
+            object_ = self.retry.call(self._stat_object, bucket_name, storj_path)
+        if METADATA_COMPRESSION in object_.custom.get_mapping():
+            # compressed data is decompressed in order, by a single download
+            with open(file_path, 'wb') as file_handle, \
+                    self.download_object(bucket_name, storj_path) as download:
+                download.read_file(file_handle)
+            return object_
+        total_size = object_.system.content_length
+        segments = [(offset, min(segment_size, total_size - offset))
+                    for offset in range(0, total_size, segment_size)]
+
+        cancel = threading.Event()
+        lock = threading.Lock()
+        downloaded = [0]
+
+        def report(size):
+            with lock:
+                downloaded[0] += size
+                if progress is not None:
+                    progress(downloaded[0], total_size)
+
+        file_descriptor = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC |
+                                  getattr(os, "O_BINARY", 0), 0o666)
+        executor = concurrent.futures.ThreadPoolExecutor(max(1, workers))
+        futures = list()
+        try:
+            _preallocate(file_descriptor, total_size)
+            futures = [executor.submit(self._download_file_segment, bucket_name, storj_path,
+                                       file_descriptor, segment, retries, cancel, report)
+                       for segment in segments]
+            for future in concurrent.futures.as_completed(futures):
+                future.result()
+        except BaseException:
+            cancel.set()
+            for future in futures:
+                future.cancel()
+            raise
+        finally:
+            executor.shutdown()
+            os.close(file_descriptor)
+        return object_
+
+    def _download_file_segment(self, bucket_name, storj_path, file_descriptor, segment, retries,
+                               cancel, report):
+        """downloads length bytes of the object from offset into the file, unless cancelled."""
+
+        offset, length = segment
+        buf = bytearray(min(length, SEGMENT_BUFSIZE))
+        start, attempt = time.monotonic(), 0
+        with memoryview(buf) as view:
+            while length > 0:
+                try:
+                    with self.download_object(bucket_name, storj_path,
+                                              DownloadOptions(offset, length)) as download:
+                        while length > 0:
+                            if cancel.is_set():
+                                return
+                            bytes_read = download.readinto(view[:min(length, len(buf))])
+                            if not bytes_read:
+                                raise InternalError("unexpected end of object " + storj_path)
+                            _pwrite(file_descriptor, view[:bytes_read], offset)
+                            offset += bytes_read
+                            length -= bytes_read
+                            report(bytes_read)
+                except RETRYABLE_ERRORS as exception:
+                    attempt += 1
+                    if cancel.is_set():
+                        raise
+                    # back off before resuming the segment from its last written byte
+                    if self.retry is not None:
+                        if not self.retry.retry(exception, attempt, start):
+                            raise
+                    elif attempt > retries:
+                        raise
+                    else:
+                        time.sleep(0.1 * 2 ** (attempt - 1))
+
+    def upload_file_dedup(self, bucket_name: str, storj_path: str, file_path: str,
+                          content_addressed: bool = False, index: DigestIndex = None,
+                          upload_options: UploadOptions = None):
+        """
+        function uploads a file unless its key already holds the same content, as told by the
+        SHA-256 digest recorded in custom metadata when it was uploaded by this function or
+        by sync with checksum.
+
+        The digest is computed while the file is read for upload and stored before commit.
+        The file is only hashed ahead of the transfer when a remote object of the same size
+        has to be compared with it, or when content_addressed=True, in which case the key is
+        storj_path followed by the hex digest, so identical files are stored once. An index
+        remembers the digests of unchanged files, so they are not read again.
+
+        Parameters
+        ----------
+        bucket_name : str
+        storj_path : str
+            key of the object, or its prefix when content_addressed is True.
+        file_path : str
+        content_addressed : bool (optional)
+        index : DigestIndex (optional)
+            digests of local files, updated with the file hashed.
+        upload_options : UploadOptions (optional)
+
+        Returns
+        -------
+        DedupResult
+        """
+
+        file_stat = os.stat(file_path)
+        digest = None if index is None else index.get(file_path, file_stat)
+        if content_addressed:
+            if digest is None:
+                digest = file_sha256(file_path)
+            storj_path += digest
+
+        remote = self._stat_object_or_none(bucket_name, storj_path)
+        if remote is not None and remote.system.content_length == file_stat.st_size:
+            remote_digest = remote.custom.get_mapping().get(METADATA_SHA256)
+            if remote_digest is not None:
+                if digest is None:
+                    digest = file_sha256(file_path)
+                if index is not None:
+                    index.put(file_path, file_stat, digest)
+                if digest == remote_digest:
+                    return DedupResult(storj_path, digest, file_stat.st_size, False)
+
+        uploaded = self._upload_file_hashed(bucket_name, storj_path, file_path, {}, True,
+                                            upload_options, digest if content_addressed else None)
+        if index is not None:
+            index.put(file_path, file_stat, uploaded)
+        return DedupResult(storj_path, uploaded, file_stat.st_size, True)
+
+    def sync(self, local_dir: str, bucket_name: str, prefix: str = "", delete: bool = False,
+             dry_run: bool = False, checksum: bool = False, concurrency: int = 8):
+        """
+        function uploads the files of a local directory tree which are missing or changed
+        below prefix in the bucket, and with delete=True deletes the objects below prefix
+        whose file no longer exists.
+
+        The remote listing is streamed once, with custom metadata, and merged with a walk of
+        local_dir in key order. Storj lists objects by encrypted key, so a file whose object
+        was not listed yet waits for the rest of the listing before it is uploaded. A file is
+        up to date when its size and modification time match those recorded in custom
+        metadata by the previous sync. With checksum=True, a file whose modification time
+        changed is also up to date when its SHA-256 digest, recorded during the upload,
+        matches. Uploads and deletes are run concurrency at a time, a failing key does not
+        stop the others. With dry_run=True nothing is uploaded nor deleted, the result
+        reports what would be.
+
+        Parameters
+        ----------
+        local_dir : str
+        bucket_name : str
+        prefix : str (optional)
+            key prefix of the tree in the bucket, a slash is appended if missing.
+        delete : bool (optional)
+        dry_run : bool (optional)
+        checksum : bool (optional)
+        concurrency : int (optional)
+
+        Returns
+        -------
+        SyncResult
+        """
+
+        if prefix and not prefix.endswith("/"):
+            prefix += "/"
+        # the listing is merged with the sorted walk as both are streamed
+        orphans = list()
+        files = _merge_remote(_walk_files(local_dir, prefix),
+                              self._sync_listing(bucket_name, prefix), orphans)
+
+        uploaded, errors, skipped, bytes_uploaded = list(), list(), 0, 0
+        sync_file = functools.partial(self._sync_file, bucket_name, checksum, dry_run)
+        for (key, _, file_stat, _), (changed, error) in _map_bounded(sync_file, files,
+                                                                     concurrency, False):
+            if error is not None:
+                errors.append((key, error))
+            elif changed:
+                uploaded.append(key)
+                bytes_uploaded += file_stat.st_size
+            else:
+                skipped += 1
+
+        deleted = sorted(orphans) if delete else list()
+        if delete and not dry_run:
+            results = self.delete_objects(bucket_name, deleted, concurrency)
+            deleted = [result.key for result in results if result.error is None]
+            errors.extend((result.key, result.error) for result in results
+                          if result.error is not None)
+        return SyncResult(sorted(uploaded), deleted, skipped, errors, bytes_uploaded, dry_run)
+
+    def _sync_listing(self, bucket_name, prefix):
+        """yields the key and (size, mtime, sha256) of the objects below prefix, from metadata."""
+
+        options = ListObjectsOptions(prefix=prefix, recursive=True, system=True, custom=True)
+        for object_ in self._iterate_object_structs(bucket_name, options):
+            contents = object_.contents
+            if contents.is_prefix:
+                continue
+            values = dict()
+            for i in range(contents.custom.count):
+                entry = contents.custom.entries[i]
+                name = entry.key.decode("utf-8")
+                if name in (METADATA_MTIME, METADATA_SHA256):
+                    values[name] = entry.value.decode("utf-8")
+            yield contents.key.decode("utf-8"), (contents.system.content_length,
+                                                 values.get(METADATA_MTIME),
+                                                 values.get(METADATA_SHA256))
+
+    def _sync_file(self, bucket_name, checksum, dry_run, item):
+        """uploads one file if changed, returning whether it was and its error if any."""
+
+        key, path, file_stat, remote = item
+        try:
+            if not _sync_changed(path, file_stat, remote, checksum):
+                return False, None
+            if not dry_run:
+                self._sync_upload(bucket_name, key, path, file_stat, checksum)
+            return True, None
+        except (StorjException, OSError) as exception:
+            return False, exception
+
+    def _sync_upload(self, bucket_name, storj_path, path, file_stat, checksum):
+        """uploads one file, recording its mtime and, with checksum, its SHA-256 digest."""
+
+        self._upload_file_hashed(bucket_name, storj_path, path,
+                                 {METADATA_MTIME: str(file_stat.st_mtime_ns)}, checksum)
+
+    def _upload_file_hashed(self, bucket_name, storj_path, path, metadata, checksum=True,
+                            upload_options=None, expected=None):
+        """
+        uploads one file with custom metadata, adding, with checksum, the SHA-256 digest
+        computed while the file is read, and returns it. The upload is aborted if the digest
+        is not the expected one.
+        """
+
+        with open(path, 'rb') as file_handle, \
+                self.upload_object(bucket_name, storj_path, upload_options,
+                                   checksums=["sha256"] if checksum else None) as upload:
+            upload.write_file(file_handle)
+            digest = upload.checksums().get("sha256")
+            if expected is not None and digest != expected:
+                raise InternalError("file changed while uploading: {}".format(path))
+            # the digest is added to custom metadata on commit, on leaving the block
+            upload.set_custom_metadata(CustomMetadata.from_mapping(metadata))
+        return digest
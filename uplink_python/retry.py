@@ -0,0 +1,149 @@
+"""Module with RetryPolicy class, retrying operations failing with transient errors"""
+import collections
+import random
+import threading
+import time
+
+from uplink_python.errors import InternalError, TooManyRequestsError
+
+# errors of libuplinkc worth retrying, the others are raised at once
+RETRYABLE_ERRORS = (InternalError, TooManyRequestsError)
+
+
+class RetryPolicy:
+    """
+    RetryPolicy decides whether an operation failing with a transient error is retried,
+    and how long to wait before: exponential backoff from base_delay up to max_delay, with
+    a random part of jitter, within max_attempts attempts and deadline seconds from the
+    first one. Errors are classified by the exception types _storj_exception raises.
+
+    A RetryPolicy can be shared by threads, it counts the retries of all the operations
+    it is used for.
+
+    ...
+
+    Attributes
+    ----------
+    max_attempts : int
+        attempts of an operation, the first one included.
+    base_delay : float
+        seconds waited before the first retry, doubled on every retry.
+    max_delay : float
+        upper bound of the seconds waited before a retry.
+    jitter : float
+        fraction of the delay drawn at random, 1 for full jitter and 0 for none.
+    deadline : float
+        seconds after the first attempt past which no retry is made, None for no deadline.
+    retryable : tuple of exception types
+        errors retried, InternalError and TooManyRequestsError by default.
+    retries : collections.Counter
+        number of retries by error code.
+    exhausted : collections.Counter
+        number of errors raised after the attempts or the deadline ran out, by error code.
+
+    Methods
+    -------
+    call():
+        result of the function
+    retry():
+        bool
+    delay():
+        float
+    get_dict():
+        dict
+    """
+
+    def __init__(self, max_attempts: int = 5, base_delay: float = 0.1, max_delay: float = 10.0,
+                 jitter: float = 1.0, deadline: float = None, retryable=RETRYABLE_ERRORS):
+        """Constructs all the necessary attributes for the RetryPolicy object."""
+
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.deadline = deadline
+        self.retryable = retryable
+        self.retries = collections.Counter()
+        self.exhausted = collections.Counter()
+        self._lock = threading.Lock()
+
+    def delay(self, attempt: int):
+        """
+        function returns the seconds to wait after the given number of failed attempts.
+
+        Parameters
+        ----------
+        attempt : int
+
+        Returns
+        -------
+        float
+        """
+
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return delay * (1 - self.jitter * random.random())
+
+    def retry(self, exception: Exception, attempt: int, start: float):
+        """
+        function returns whether an operation which failed with exception is retried, after
+        waiting the backoff delay. The retry is counted by error code.
+
+        Parameters
+        ----------
+        exception : Exception
+        attempt : int
+            number of failed attempts of the operation, this one included.
+        start : float
+            time.monotonic() of the first attempt.
+
+        Returns
+        -------
+        bool
+        """
+
+        if not isinstance(exception, self.retryable):
+            return False
+        delay = self.delay(attempt)
+        code = getattr(exception, "code", None)
+        if attempt >= self.max_attempts or \
+                (self.deadline is not None and time.monotonic() + delay > start + self.deadline):
+            with self._lock:
+                self.exhausted[code] += 1
+            return False
+        with self._lock:
+            self.retries[code] += 1
+        time.sleep(delay)
+        return True
+
+    def call(self, function, *args, **kwargs):
+        """
+        function calls function with args and kwargs until it returns, retrying it on the
+        errors the policy retries, and returns its result.
+
+        Parameters
+        ----------
+        function : callable
+
+        Returns
+        -------
+        result of the function
+        """
+
+        start = time.monotonic()
+        attempt = 0
+        while True:
+            try:
+                return function(*args, **kwargs)
+            except self.retryable as exception:
+                attempt += 1
+                if not self.retry(exception, attempt, start):
+                    raise
+
+    def get_dict(self):
+        """Converts python class object to python dictionary"""
+
+        with self._lock:
+            return {"max_attempts": self.max_attempts, "base_delay": self.base_delay,
+                    "max_delay": self.max_delay, "jitter": self.jitter,
+                    "deadline": self.deadline, "retries": dict(self.retries),
+                    "exhausted": dict(self.exhausted)}
@@ -4,10 +4,11 @@
 import ctypes
 import os
 import sysconfig
+import threading
 
 from uplink_python.access import Access
 from uplink_python.errors import _storj_exception, LibUplinkSoError
-from uplink_python.module_def import _AccessResult, _ConfigStruct
+from uplink_python.module_def import _ConfigStruct, _bind_functions
 from uplink_python.module_classes import Config, Bucket, Object, SystemMetadata, \
     CustomMetadataEntry, CustomMetadata
 
@@ -16,12 +17,17 @@ class Uplink:
     """
     Python Storj Uplink class to initialize and get access grant to Storj (V3)"
 
+    libuplinkc.so is loaded and its functions are declared once per process, the first
+    Uplink constructed from any thread does it under a lock and later ones share it. Native
+    functions are called through ctypes.CDLL, which releases the GIL for the duration of
+    every call, so transfers on distinct handles run in parallel from many threads.
+
     ...
 
     Attributes
     ----------
     m_libuplink : CDLL
-        Instance to the libuplinkc.so.
+        Instance to the libuplinkc.so, or to the library given to the constructor.
 
     Methods
     -------
@@ -32,25 +38,47 @@ class Uplink:
     """
 
     __instance = None
+    __lock = threading.Lock()
+
+    def __init__(self, library=None):
+        """
+        Constructs all the necessary attributes for the Uplink object.
+
+        Parameters
+        ----------
+        library : str or object
+            path of a shared library implementing the C ABI of libuplinkc, or an object
+            providing its uplink_* functions such as uplink_python.local.LocalLibrary, used
+            instead of libuplinkc.so (optional).
+        """
 
-    def __init__(self):
-        """Constructs all the necessary attributes for the Uplink object."""
+        # a stand-in backend is private to this Uplink, it never becomes the shared instance
+        if library is not None:
+            if isinstance(library, str):
+                library = _bind_functions(ctypes.CDLL(library))
+            self.m_libuplink = library
+            return
         # private members of PyStorj class with reference objects
         # include the golang exported libuplink library functions
-        if Uplink.__instance is None:
-            so_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'libuplinkc.so')
-            if os.path.exists(so_path):
-                self.m_libuplink = ctypes.CDLL(so_path)
-            else:
-                new_path = os.path.join(sysconfig.get_paths()['purelib'], "uplink_python",
-                                        'libuplinkc.so')
-                if os.path.exists(new_path):
+        # the first Uplink of the process loads the library, concurrent ones wait for it
+        with Uplink.__lock:
+            if Uplink.__instance is None:
+                so_path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                       'libuplinkc.so')
+                if os.path.exists(so_path):
                     self.m_libuplink = ctypes.CDLL(so_path)
                 else:
-                    raise LibUplinkSoError
-            Uplink.__instance = self
-        else:
-            self.m_libuplink = Uplink.__instance.m_libuplink
+                    new_path = os.path.join(sysconfig.get_paths()['purelib'], "uplink_python",
+                                            'libuplinkc.so')
+                    if os.path.exists(new_path):
+                        self.m_libuplink = ctypes.CDLL(new_path)
+                    else:
+                        raise LibUplinkSoError
+                # declare types of arguments and responses of all golang functions once
+                _bind_functions(self.m_libuplink)
+                Uplink.__instance = self
+            else:
+                self.m_libuplink = Uplink.__instance.m_libuplink
 
     @classmethod
     def object_from_result(cls, object_):
@@ -107,13 +135,6 @@ class Uplink:
         -------
         Access
         """
-        #
-        # declare types of arguments and response of the corresponding golang function
-        self.m_libuplink.uplink_request_access_with_passphrase.argtypes = [ctypes.c_char_p,
-                                                                           ctypes.c_char_p,
-                                                                           ctypes.c_char_p]
-        self.m_libuplink.uplink_request_access_with_passphrase.restype = _AccessResult
-        #
         # prepare the input for the function
         satellite_ptr = ctypes.c_char_p(satellite.encode('utf-8'))
         api_key_ptr = ctypes.c_char_p(api_key.encode('utf-8'))
@@ -126,9 +147,11 @@ class Uplink:
         #
         # if error occurred
         if bool(access_result.error):
-            raise _storj_exception(access_result.error.contents.code,
-                                   access_result.error.contents.message.decode("utf-8"))
-        return Access(access_result.access, self)
+            exception = _storj_exception(access_result.error.contents.code,
+                                         access_result.error.contents.message.decode("utf-8"))
+            self.m_libuplink.uplink_free_access_result(access_result)
+            raise exception
+        return Access(access_result.access, self, access_result)
 
     def config_request_access_with_passphrase(self, config: Config, satellite: str, api_key: str,
                                               passphrase: str):
@@ -155,14 +178,6 @@ class Uplink:
         Access
         """
 
-        #
-        # declare types of arguments and response of the corresponding golang function
-        self.m_libuplink.uplink_config_request_access_with_passphrase.argtypes = [_ConfigStruct,
-                                                                                  ctypes.c_char_p,
-                                                                                  ctypes.c_char_p,
-                                                                                  ctypes.c_char_p]
-        self.m_libuplink.uplink_config_request_access_with_passphrase.restype = _AccessResult
-        #
         # prepare the input for the function
         if config is None:
             config_obj = _ConfigStruct()
@@ -180,9 +195,11 @@ class Uplink:
         #
         # if error occurred
         if bool(access_result.error):
-            raise _storj_exception(access_result.error.contents.code,
-                                   access_result.error.contents.message.decode("utf-8"))
-        return Access(access_result.access, self)
+            exception = _storj_exception(access_result.error.contents.code,
+                                         access_result.error.contents.message.decode("utf-8"))
+            self.m_libuplink.uplink_free_access_result(access_result)
+            raise exception
+        return Access(access_result.access, self, access_result)
 
     def parse_access(self, serialized_access: str):
         """
@@ -203,17 +220,14 @@ class Uplink:
         #
         # prepare the input for the function
         serialized_access_ptr = ctypes.c_char_p(serialized_access.encode('utf-8'))
-        #
-        # declare types of arguments and response of the corresponding golang function
-        self.m_libuplink.uplink_parse_access.argtypes = [ctypes.c_char_p]
-        self.m_libuplink.uplink_parse_access.restype = _AccessResult
-        #
 
         # get parsed access by calling the exported golang function
         access_result = self.m_libuplink.uplink_parse_access(serialized_access_ptr)
         #
         # if error occurred
         if bool(access_result.error):
-            raise _storj_exception(access_result.error.contents.code,
-                                   access_result.error.contents.message.decode("utf-8"))
-        return Access(access_result.access, self)
+            exception = _storj_exception(access_result.error.contents.code,
+                                         access_result.error.contents.message.decode("utf-8"))
+            self.m_libuplink.uplink_free_access_result(access_result)
+            raise exception
+        return Access(access_result.access, self, access_result)
@@ -1,20 +1,114 @@
 """Module with Upload class and upload methods to work with object upload"""
 # pylint: disable=line-too-long
+import contextlib
 import ctypes
+import io
 import os
+import weakref
 
-from uplink_python.module_classes import CustomMetadata
-from uplink_python.module_def import _UploadStruct, _WriteResult, _Error, _CustomMetadataStruct, _ObjectResult
-from uplink_python.errors import _storj_exception
+from uplink_python.module_classes import CustomMetadata, METADATA_COMPRESSION
+from uplink_python.module_def import _CustomMetadataStruct
+from uplink_python.compression import Compression
+from uplink_python.digest import _Checksums
+from uplink_python.errors import _storj_exception, InternalError
 
 _WINDOWS = os.name == 'nt'
 COPY_BUFSIZE = 1024 * 1024 if _WINDOWS else 64 * 1024
+# default size of the parts of a parallel multipart upload, and of the writes within a part
+PART_SIZE = 64 * 1024 * 1024
+PART_BUFSIZE = 1024 * 1024
+
+
+class _PyBufferStruct(ctypes.Structure):
+    """Py_buffer of the Python C API, filled by PyObject_GetBuffer."""
+
+    _fields_ = [("buf", ctypes.c_void_p), ("obj", ctypes.c_void_p), ("len", ctypes.c_ssize_t),
+                ("itemsize", ctypes.c_ssize_t), ("readonly", ctypes.c_int),
+                ("ndim", ctypes.c_int), ("format", ctypes.c_char_p),
+                ("shape", ctypes.c_void_p), ("strides", ctypes.c_void_p),
+                ("suboffsets", ctypes.c_void_p), ("internal", ctypes.c_void_p)]
+
+
+# the buffer API of CPython, None where ctypes.pythonapi is not available
+_PYTHON_API = getattr(ctypes, "pythonapi", None)
+if _PYTHON_API is not None:
+    _PYTHON_API.PyObject_GetBuffer.argtypes = [ctypes.py_object,
+                                               ctypes.POINTER(_PyBufferStruct), ctypes.c_int]
+    _PYTHON_API.PyObject_GetBuffer.restype = ctypes.c_int
+    _PYTHON_API.PyBuffer_Release.argtypes = [ctypes.POINTER(_PyBufferStruct)]
+    _PYTHON_API.PyBuffer_Release.restype = None
+
+
+class _BufferExport:
+    """
+    Export of the memory of a contiguous buffer protocol object, read-only ones included,
+    taken with PyObject_GetBuffer. The object stays referenced and its memory in place until
+    the export is released.
+    """
+
+    def __init__(self, data):
+        self._buffer = _PyBufferStruct()
+        # PyBUF_SIMPLE, raises BufferError for non contiguous buffers
+        _PYTHON_API.PyObject_GetBuffer(data, ctypes.byref(self._buffer), 0)
+        self.address = self._buffer.buf or 0
+        self.size = self._buffer.len
+
+    def release(self):
+        """releases the export, its memory must not be used afterwards."""
+
+        _PYTHON_API.PyBuffer_Release(ctypes.byref(self._buffer))
+
+
+@contextlib.contextmanager
+def _buffer_pointer(data):
+    """
+    Yields a c_ubyte pointer or array over the memory of a buffer protocol object, and its
+    size in bytes, valid until the with block exits. Read-only buffers are exported for the
+    duration of the block and released on exit.
+    """
+
+    if isinstance(data, bytes):
+        # bytes are immutable, point libuplinkc straight at their internal storage
+        yield ctypes.cast(data, ctypes.POINTER(ctypes.c_uint8)), len(data)
+        return
+
+    view = memoryview(data)
+    if view.ndim != 1 or view.itemsize != 1:
+        view = view.cast('B')
+    if not view.readonly:
+        yield (ctypes.c_uint8 * view.nbytes).from_buffer(view), view.nbytes
+    elif _PYTHON_API is not None:
+        # read-only buffers (memoryviews of bytes, mmaps opened for reading) are exported,
+        # libuplinkc only reads from them
+        export = _BufferExport(view)
+        try:
+            yield (ctypes.c_uint8 * export.size).from_address(export.address), export.size
+        finally:
+            export.release()
+    else:
+        yield (ctypes.c_uint8 * view.nbytes).from_buffer_copy(view), view.nbytes
+
+
+def _with_entries(custom_metadata, entries):
+    """Returns custom_metadata, which may be None, with entries of a mapping added."""
+
+    mapping = dict() if custom_metadata is None else custom_metadata.get_mapping()
+    mapping.update(entries)
+    return CustomMetadata.from_mapping(mapping)
 
 
 class Upload:
     """
     Upload is an upload to Storj Network.
 
+    An Upload must be used by one thread at a time, distinct uploads can be written from
+    many threads concurrently.
+
+    With compression, data is compressed as it is written and the codec is recorded in
+    custom metadata on commit. The size of the object is then the compressed size.
+    With checksums, they are computed on the buffers as they are written, before any
+    compression, and recorded in custom metadata on commit.
+
     ...
 
     Attributes
@@ -23,68 +117,135 @@ class Upload:
         Upload _handle returned from libuplinkc upload_result.upload
     uplink : Uplink
         uplink object used to get access
+    on_commit : callable
+        called without arguments after the upload is committed, None by default.
+    compression : Compression
+        codec data is compressed with, None by default.
 
     Methods
     -------
     write():
         Int
+    checksums():
+        dict
     write_file():
         None
     commit():
         None
     abort():
         None
+    free():
+        None
     set_custom_metadata():
         None
     info():
         Object
     """
 
-    def __init__(self, upload, uplink):
+    def __init__(self, upload, uplink, upload_result=None, on_commit=None,
+                 compression: Compression = None, checksums=None):
         """Constructs all the necessary attributes for the Upload object."""
 
         self.upload = upload
         self.uplink = uplink
+        self.on_commit = on_commit
+        self.compression = compression
+        self._done = False
+        # native upload result is freed on context exit, or when garbage collected
+        self._finalizer = None
+        if upload_result is not None:
+            self._finalizer = weakref.finalize(self,
+                                               uplink.m_libuplink.uplink_free_upload_result,
+                                               upload_result)
+        self._compressor = None if compression is None else compression.compressor()
+        self._checksums = None if not checksums else _Checksums(checksums)
+        # custom metadata last set, the entries of the binding are added to it on commit
+        self._custom_metadata = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """commits the upload, or aborts it on exception, unless already done."""
+
+        try:
+            if not self._done:
+                if exc_type is None:
+                    self.commit()
+                else:
+                    self.abort()
+        finally:
+            self.free()
 
-    def write(self, data_to_write: bytes, size_to_write: int):
+    def write(self, data_to_write, size_to_write: int = None):
         """
         function uploads bytes data passed as parameter to the object's data stream.
 
+        data_to_write can be any object supporting the buffer protocol (bytes, bytearray,
+        memoryview, mmap, array.array, NumPy arrays), its memory is passed to libuplinkc
+        without an intermediate copy, read-only ones included. With compression, the data is
+        compressed first and the number of bytes of data_to_write consumed is returned. With
+        checksums, the bytes written are added to them.
+
         Parameters
         ----------
-        data_to_write : bytes
-        size_to_write : int
+        data_to_write : bytes-like object
+        size_to_write : int (optional)
+            defaults to the size of data_to_write in bytes.
 
         Returns
         -------
         int
         """
 
-        # declare types of arguments and response of the corresponding golang function
-        self.uplink.m_libuplink.uplink_upload_write.argtypes = [ctypes.POINTER(_UploadStruct),
-                                                                ctypes.POINTER(ctypes.c_uint8),
-                                                                ctypes.c_size_t]
-        self.uplink.m_libuplink.uplink_upload_write.restype = _WriteResult
-        #
+        self._check_open()
+        if self._compressor is None and self._checksums is None:
+            return self._write(data_to_write, size_to_write)
+        with memoryview(data_to_write) as view, view.cast('B') as data:
+            if size_to_write is None or size_to_write > data.nbytes:
+                size_to_write = data.nbytes
+            if self._compressor is not None:
+                compressed = self._compressor.compress(data[:size_to_write])
+                if compressed:
+                    self._write(compressed, len(compressed))
+                bytes_written = size_to_write
+            else:
+                bytes_written = self._write(data_to_write, size_to_write)
+            if self._checksums is not None:
+                self._checksums.update(data[:bytes_written])
+        return bytes_written
+
+    def checksums(self):
+        """
+        function returns the hex value of the checksums of the data written so far, by name.
+
+        Returns
+        -------
+        dict
+        """
+
+        return dict() if self._checksums is None else self._checksums.hexdigests()
+
+    def _write(self, data_to_write, size_to_write):
+        """writes data to the native upload as is."""
+
         # prepare the inputs for the function
-        # --------------------------------------------
-        # data conversion to type required by function
-        # get size of data in c type int32 variable
-        # conversion of read bytes data to c type ubyte Array
-        data_to_write = (ctypes.c_uint8 * ctypes.c_int32(len(data_to_write)).value)(*data_to_write)
-        # conversion of c type ubyte Array to LP_c_ubyte required by upload write function
-        data_to_write_ptr = ctypes.cast(data_to_write, ctypes.POINTER(ctypes.c_uint8))
-        # --------------------------------------------
-        size_to_write_obj = ctypes.c_size_t(size_to_write)
-
-        # upload data by calling the exported golang function
-        write_result = self.uplink.m_libuplink.uplink_upload_write(self.upload, data_to_write_ptr,
-                                                                   size_to_write_obj)
+        with _buffer_pointer(data_to_write) as (data_to_write_ptr, data_size):
+            if size_to_write is None or size_to_write > data_size:
+                size_to_write = data_size
+            size_to_write_obj = ctypes.c_size_t(size_to_write)
+
+            # upload data by calling the exported golang function
+            write_result = self.uplink.m_libuplink.uplink_upload_write(self.upload,
+                                                                       data_to_write_ptr,
+                                                                       size_to_write_obj)
         #
         # if error occurred
         if bool(write_result.error):
-            _storj_exception(write_result.error.contents.code,
-                             write_result.error.contents.message.decode("utf-8"))
+            exception = _storj_exception(write_result.error.contents.code,
+                                         write_result.error.contents.message.decode("utf-8"))
+            self.uplink.m_libuplink.uplink_free_write_result(write_result)
+            raise exception
         return int(write_result.bytes_written)
 
     def write_file(self, file_handle, buffer_size: int = 0):
@@ -109,11 +270,22 @@ class Upload:
 
         if not buffer_size:
             buffer_size = COPY_BUFSIZE
-        while True:
-            buf = file_handle.read(buffer_size)
-            if not buf:
-                break
-            self.write(buf, len(buf))
+        if not hasattr(file_handle, "readinto"):
+            while True:
+                buf = file_handle.read(buffer_size)
+                if not buf:
+                    break
+                self.write(buf, len(buf))
+            return
+        #
+        # read into one reusable buffer, which is handed to libuplinkc without copying
+        buf = bytearray(buffer_size)
+        with memoryview(buf) as view:
+            while True:
+                bytes_read = file_handle.readinto(buf)
+                if not bytes_read:
+                    break
+                self.write(view[:bytes_read], bytes_read)
 
     def commit(self):
         """
@@ -124,18 +296,27 @@ class Upload:
         None
         """
 
-        # declare types of arguments and response of the corresponding golang function
-        self.uplink.m_libuplink.uplink_upload_commit.argtypes = [ctypes.POINTER(_UploadStruct)]
-        self.uplink.m_libuplink.uplink_upload_commit.restype = ctypes.POINTER(_Error)
-        #
-
+        self._check_open()
+        if self._compressor is not None:
+            compressor, self._compressor = self._compressor, None
+            compressed = compressor.flush()
+            if compressed:
+                self._write(compressed, len(compressed))
+        if self.compression is not None or self._checksums is not None:
+            self._set_custom_metadata(_with_entries(self._custom_metadata,
+                                                    self._metadata_entries()))
         # upload commit by calling the exported golang function
         error = self.uplink.m_libuplink.uplink_upload_commit(self.upload)
         #
         # if error occurred
         if bool(error):
-            raise _storj_exception(error.contents.code,
-                                   error.contents.message.decode("utf-8"))
+            exception = _storj_exception(error.contents.code,
+                                         error.contents.message.decode("utf-8"))
+            self.uplink.m_libuplink.uplink_free_error(error)
+            raise exception
+        self._done = True
+        if self.on_commit is not None:
+            self.on_commit()
 
     def abort(self):
         """
@@ -145,24 +326,46 @@ class Upload:
         -------
         None
         """
-        #
-        # declare types of arguments and response of the corresponding golang function
-        self.uplink.m_libuplink.uplink_upload_abort.argtypes = [ctypes.POINTER(_UploadStruct)]
-        self.uplink.m_libuplink.uplink_upload_abort.restype = ctypes.POINTER(_Error)
-        #
 
+        self._check_open()
         # abort ongoing upload by calling the exported golang function
         error = self.uplink.m_libuplink.uplink_upload_abort(self.upload)
+        self._done = True
         #
         # if error occurred
         if bool(error):
-            raise _storj_exception(error.contents.code,
-                                   error.contents.message.decode("utf-8"))
+            exception = _storj_exception(error.contents.code,
+                                         error.contents.message.decode("utf-8"))
+            self.uplink.m_libuplink.uplink_free_error(error)
+            raise exception
+
+    def free(self):
+        """
+        function releases the native upload, it can't be used afterwards and freeing it again
+        does nothing. Called on context exit, or when the upload is garbage collected.
+
+        Returns
+        -------
+        None
+        """
+
+        if self._finalizer is not None:
+            self._finalizer()
+        self.upload = None
+
+    def _check_open(self):
+        """raises ValueError once the native upload is freed."""
+
+        if self.upload is None:
+            raise ValueError("upload is closed")
 
     def set_custom_metadata(self, custom_metadata: CustomMetadata = None):
         """
         function to set custom meta information while uploading data
 
+        With compression or checksums, the entries recording them are added to
+        custom_metadata on commit.
+
         Parameters
         ----------
         custom_metadata : CustomMetadata
@@ -171,12 +374,24 @@ class Upload:
         -------
         None
         """
-        #
-        # declare types of arguments and response of the corresponding golang function
-        self.uplink.m_libuplink.uplink_upload_set_custom_metadata.argtypes = [ctypes.POINTER(_UploadStruct),
-                                                                              _CustomMetadataStruct]
-        self.uplink.m_libuplink.uplink_upload_set_custom_metadata.restype = ctypes.POINTER(_Error)
-        #
+
+        self._check_open()
+        self._custom_metadata = custom_metadata
+        self._set_custom_metadata(custom_metadata)
+
+    def _metadata_entries(self):
+        """returns the custom metadata entries recording compression and checksums."""
+
+        entries = dict()
+        if self.compression is not None:
+            entries[METADATA_COMPRESSION] = self.compression.codec
+        if self._checksums is not None:
+            entries.update(self._checksums.metadata())
+        return entries
+
+    def _set_custom_metadata(self, custom_metadata):
+        """sets custom metadata to the native upload as is."""
+
         # prepare the input for the function
         if custom_metadata is None:
             custom_metadata_obj = _CustomMetadataStruct()
@@ -188,8 +403,10 @@ class Upload:
         #
         # if error occurred
         if bool(error):
-            raise _storj_exception(error.contents.code,
-                                   error.contents.message.decode("utf-8"))
+            exception = _storj_exception(error.contents.code,
+                                         error.contents.message.decode("utf-8"))
+            self.uplink.m_libuplink.uplink_free_error(error)
+            raise exception
 
     def info(self):
         """
@@ -199,16 +416,334 @@ class Upload:
         -------
         Object
         """
-        #
-        # declare types of arguments and response of the corresponding golang function
-        self.uplink.m_libuplink.uplink_upload_info.argtypes = [ctypes.POINTER(_UploadStruct)]
-        self.uplink.m_libuplink.uplink_upload_info.restype = _ObjectResult
-        #
+        self._check_open()
         # get last upload info by calling the exported golang function
         object_result = self.uplink.m_libuplink.uplink_upload_info(self.upload)
+        try:
+            #
+            # if error occurred
+            if bool(object_result.error):
+                raise _storj_exception(object_result.error.contents.code,
+                                       object_result.error.contents.message.decode("utf-8"))
+            return self.uplink.object_from_result(object_result.object)
+        finally:
+            self.uplink.m_libuplink.uplink_free_object_result(object_result)
+
+
+class PartUpload:
+    """
+    PartUpload is an upload of one part of a multipart upload to Storj Network.
+
+    ...
+
+    Attributes
+    ----------
+    part_upload : int
+        PartUpload _handle returned from libuplinkc part_upload_result.part_upload
+    uplink : Uplink
+        uplink object used to get access
+
+    Methods
+    -------
+    write():
+        Int
+    write_file():
+        None
+    commit():
+        None
+    abort():
+        None
+    free():
+        None
+    """
+
+    def __init__(self, part_upload, uplink, part_upload_result=None):
+        """Constructs all the necessary attributes for the PartUpload object."""
+
+        self.part_upload = part_upload
+        self.uplink = uplink
+        self._done = False
+        # native part upload result is freed on context exit, or when garbage collected
+        self._finalizer = None
+        if part_upload_result is not None:
+            self._finalizer = weakref.finalize(self,
+                                               uplink.m_libuplink.uplink_free_part_upload_result,
+                                               part_upload_result)
+
+    __enter__ = Upload.__enter__
+    __exit__ = Upload.__exit__
+    write_file = Upload.write_file
+
+    def write(self, data_to_write, size_to_write: int = None):
+        """
+        function uploads bytes data passed as parameter to the part's data stream.
+
+        Parameters
+        ----------
+        data_to_write : bytes-like object
+        size_to_write : int (optional)
+            defaults to the size of data_to_write in bytes.
+
+        Returns
+        -------
+        int
+        """
+
+        self._check_open()
+        # prepare the inputs for the function
+        with _buffer_pointer(data_to_write) as (data_to_write_ptr, data_size):
+            if size_to_write is None or size_to_write > data_size:
+                size_to_write = data_size
+            size_to_write_obj = ctypes.c_size_t(size_to_write)
+
+            # upload data by calling the exported golang function
+            write_result = self.uplink.m_libuplink.uplink_part_upload_write(self.part_upload,
+                                                                            data_to_write_ptr,
+                                                                            size_to_write_obj)
         #
         # if error occurred
-        if bool(object_result.error):
-            raise _storj_exception(object_result.error.contents.code,
-                                   object_result.error.contents.message.decode("utf-8"))
-        return self.uplink.object_from_result(object_result.object)
+        if bool(write_result.error):
+            exception = _storj_exception(write_result.error.contents.code,
+                                         write_result.error.contents.message.decode("utf-8"))
+            self.uplink.m_libuplink.uplink_free_write_result(write_result)
+            raise exception
+        return int(write_result.bytes_written)
+
+    def commit(self):
+        """
+        function commits the uploaded part.
+
+        Returns
+        -------
+        None
+        """
+
+        self._check_open()
+        # part commit by calling the exported golang function
+        error = self.uplink.m_libuplink.uplink_part_upload_commit(self.part_upload)
+        #
+        # if error occurred
+        if bool(error):
+            exception = _storj_exception(error.contents.code,
+                                         error.contents.message.decode("utf-8"))
+            self.uplink.m_libuplink.uplink_free_error(error)
+            raise exception
+        self._done = True
+
+    def abort(self):
+        """
+        function aborts an ongoing part upload.
+
+        Returns
+        -------
+        None
+        """
+
+        self._check_open()
+        # abort ongoing part upload by calling the exported golang function
+        error = self.uplink.m_libuplink.uplink_part_upload_abort(self.part_upload)
+        self._done = True
+        #
+        # if error occurred
+        if bool(error):
+            exception = _storj_exception(error.contents.code,
+                                         error.contents.message.decode("utf-8"))
+            self.uplink.m_libuplink.uplink_free_error(error)
+            raise exception
+
+    def free(self):
+        """
+        function releases the native part upload, it can't be used afterwards and freeing it
+        again does nothing. Called on context exit, or when the part upload is garbage
+        collected.
+
+        Returns
+        -------
+        None
+        """
+
+        if self._finalizer is not None:
+            self._finalizer()
+        self.part_upload = None
+
+    def _check_open(self):
+        """raises ValueError once the native part upload is freed."""
+
+        if self.part_upload is None:
+            raise ValueError("part upload is closed")
+
+
+class UploadStream(io.RawIOBase):
+    """
+    UploadStream is a write-only raw stream uploading to an object on Storj Network.
+
+    Small writes are coalesced into buffer_size sized uplink_upload_write calls, writes of at
+    least buffer_size bytes are passed through without copying. The upload is committed when
+    the stream is closed, or aborted when a with block exits with an exception or the stream
+    is garbage collected without being closed.
+
+    ...
+
+    Attributes
+    ----------
+    upload : Upload
+        upload object the data is written to
+    buffer_size : int
+        size of the coalescing buffer
+
+    Methods
+    -------
+    write():
+        Int
+    flush():
+        None
+    close():
+        None
+    abort():
+        None
+    """
+
+    def __init__(self, upload: Upload, buffer_size: int = COPY_BUFSIZE):
+        """Constructs all the necessary attributes for the UploadStream object."""
+
+        super().__init__()
+        self.upload = upload
+        self.buffer_size = buffer_size
+        self._buffer = bytearray(buffer_size)
+        self._pending = 0
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        """
+        function writes data to the upload, coalescing it with earlier small writes.
+
+        Parameters
+        ----------
+        data : bytes-like object
+
+        Returns
+        -------
+        int
+        """
+
+        self._checkClosed()
+        with memoryview(data) as view:
+            if view.ndim != 1 or view.itemsize != 1:
+                view = view.cast('B')
+            size = view.nbytes
+            offset = 0
+            if self._pending:
+                # top up the buffered data first to keep the written order
+                offset = min(size, self.buffer_size - self._pending)
+                self._buffer[self._pending:self._pending + offset] = view[:offset]
+                self._pending += offset
+                if self._pending == self.buffer_size:
+                    self._flush_buffer()
+            if size - offset >= self.buffer_size:
+                # bytes are passed as is, libuplinkc reads their storage directly
+                self._write_all(data if not offset and isinstance(data, bytes)
+                                else view[offset:])
+            elif offset < size:
+                self._buffer[:size - offset] = view[offset:]
+                self._pending = size - offset
+        self._position += size
+        return size
+
+    def tell(self):
+        self._checkClosed()
+        return self._position
+
+    def flush(self):
+        """
+        function passes buffered data to the upload.
+
+        Returns
+        -------
+        None
+        """
+
+        self._checkClosed()
+        self._flush_buffer()
+
+    def close(self):
+        """
+        function flushes buffered data and commits the upload.
+        If flushing or committing fails the upload is aborted and the error is raised, a
+        failure of the abort itself is not raised in its place.
+
+        Returns
+        -------
+        None
+        """
+
+        if self.closed:
+            return
+        try:
+            self._flush_buffer()
+            self.upload.commit()
+        except BaseException:
+            try:
+                self._abort()
+            except Exception:  # pylint: disable=broad-except
+                # the error of the flush or commit is the one worth raising
+                pass
+            raise
+        finally:
+            self.upload.free()
+            super().close()
+
+    def abort(self):
+        """
+        function discards buffered data, aborts the upload and closes the stream.
+
+        Returns
+        -------
+        None
+        """
+
+        if self.closed:
+            return
+        try:
+            self._abort()
+        finally:
+            self.upload.free()
+            super().close()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def __del__(self):
+        # an upload that was never closed explicitly must not be committed
+        if not self.closed:
+            self.abort()
+
+    def _abort(self):
+        """aborts the upload, dropping buffered data."""
+
+        self._pending = 0
+        self.upload.abort()
+
+    def _flush_buffer(self):
+        """writes buffered data to the upload."""
+
+        if self._pending:
+            with memoryview(self._buffer) as view:
+                self._write_all(view[:self._pending])
+            self._pending = 0
+
+    def _write_all(self, data):
+        """writes all of data, bytes or a byte view, to the upload, retrying on short writes."""
+
+        remaining = len(data)
+        while remaining:
+            bytes_written = self.upload.write(data)
+            if bytes_written <= 0:
+                raise InternalError("upload write made no progress")
+            remaining -= bytes_written
+            data = memoryview(data)[bytes_written:]